@@ -0,0 +1,57 @@
+"""Benchmark throughput SpamDetector (cogs/events.py).
+
+Jalankan dari root project:  python -m benchmarks.bench_spam [jumlah_pesan]
+"""
+import random
+import sys
+import time
+
+from cogs.events import MAX_TRACKED_USERS, SpamDetector
+
+GUILDS = 50
+CHANNELS_PER_GUILD = 20
+USERS = 200000
+MESSAGES_PER_SECOND = 5000
+SPAMMER_RATIO = 0.02
+
+def generate(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    phrases = [f"pesan biasa nomor {i} dengan sedikit isi" for i in range(5000)]
+    spam = ["FREE NITRO https://disc0rd.gift/abc", "join server kami!!!", "@everyone cek ini"]
+    spammers = rng.sample(range(USERS), int(USERS * SPAMMER_RATIO))
+    now = 1_700_000_000.0
+    for i in range(count):
+        now += rng.expovariate(MESSAGES_PER_SECOND)
+        guild = rng.randrange(GUILDS)
+        channel = guild * CHANNELS_PER_GUILD + rng.randrange(CHANNELS_PER_GUILD)
+        if rng.random() < 0.1:
+            author = rng.choice(spammers)
+            content = rng.choice(spam)
+            mentions = rng.choice((0, 0, 3, 9))
+        else:
+            author = rng.randrange(USERS)
+            content = rng.choice(phrases)
+            mentions = 1 if rng.random() < 0.05 else 0
+        yield guild, channel, author, i, content, mentions, now
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    events = list(generate(count))
+    detector = SpamDetector()
+    check = detector.check
+
+    start = time.perf_counter()
+    for event in events:
+        check(*event)
+    elapsed = time.perf_counter() - start
+
+    print(f"pesan           : {count}")
+    print(f"waktu           : {elapsed:.3f} s")
+    print(f"throughput      : {count / elapsed:,.0f} pesan/s")
+    print(f"per pesan       : {elapsed / count * 1e6:.2f} µs")
+    print(f"terdeteksi      : {detector.flagged}")
+    print(f"user dilacak    : {len(detector)} (maks {MAX_TRACKED_USERS})")
+    print(f"dibuang (LRU)   : {detector.evicted}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,573 @@
+"""Replay rekaman trafik (cogs/traffic_recorder.py) terhadap state guild palsu.
+
+Rekam dulu dengan menjalankan bot bersama RECORD_TRAFFIC=traffic.jsonl, lalu dari root project:
+
+    python -m benchmarks.replay_traffic traffic.jsonl --speed 10 --api-latency 80
+
+--speed 1 memutar dengan kecepatan asli, 10 berarti 10x lebih cepat, 0 secepat mungkin.
+Panggilan API Discord disimulasikan dengan latensi --api-latency (ms) ± --api-jitter.
+Semua file state (config.json, *.db) ditulis ke direktori sementara.
+"""
+import argparse
+import asyncio
+import collections
+import datetime
+import importlib
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import typing
+
+import discord
+
+DEFAULT_EXTENSIONS = "outbound,voice_moderation,voice_timers,text_moderation,log_config,member_index"
+
+API = {"latency": 0.05, "jitter": 0.02, "calls": 0}
+
+async def api_call():
+    API["calls"] += 1
+    delay = API["latency"] + random.uniform(-API["jitter"], API["jitter"])
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+# --- FAKE DISCORD OBJECTS ---
+
+class FakeVoiceState:
+    def __init__(self, channel=None, mute=False, deaf=False):
+        self.channel = channel
+        self.mute = mute
+        self.deaf = deaf
+        self.self_mute = False
+        self.self_deaf = False
+
+class FakeMember:
+    def __init__(self, guild, member_id: int, name: str):
+        self.guild = guild
+        self.id = member_id
+        self.name = name
+        self.display_name = name.title()
+        self.discriminator = "0"
+        self.bot = False
+        self.voice: typing.Optional[FakeVoiceState] = None
+        self.roles = []
+        self.joined_at = datetime.datetime.now(datetime.timezone.utc)
+        self.guild_permissions = discord.Permissions.all()
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    def __str__(self) -> str:
+        return self.name
+
+    def get_role(self, role_id):
+        return None
+
+    def _set_channel(self, channel):
+        old = self.voice.channel if self.voice else None
+        if old is not None:
+            old._members.pop(self.id, None)
+        if channel is None:
+            self.voice = None
+            return
+        if self.voice is None:
+            self.voice = FakeVoiceState()
+        self.voice.channel = channel
+        channel._members[self.id] = self
+
+    async def edit(self, *, mute=None, deafen=None, voice_channel=discord.utils.MISSING, reason=None, **_):
+        await api_call()
+        if voice_channel is not discord.utils.MISSING:
+            self._set_channel(voice_channel)
+        if self.voice:
+            if mute is not None:
+                self.voice.mute = mute
+            if deafen is not None:
+                self.voice.deaf = deafen
+
+    async def move_to(self, channel, *, reason=None):
+        await api_call()
+        self._set_channel(channel)
+
+class FakeVoiceChannel(discord.VoiceChannel):
+    def __init__(self, guild, channel_id: int, name: str):
+        self.guild = guild
+        self.id = channel_id
+        self.name = name
+        self._members: typing.Dict[int, FakeMember] = {}
+
+    @property
+    def members(self):
+        return list(self._members.values())
+
+    @property
+    def type(self):
+        return discord.ChannelType.voice
+
+    def permissions_for(self, obj):
+        return discord.Permissions.all()
+
+class FakeMessage(discord.Message):
+    _ids = itertools.count(1 << 60)
+
+    def __init__(self, channel, author, content: str = "", reference=None):
+        self.id = next(self._ids)
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.content = content
+        self.reference = reference
+        self.attachments = []
+        self.embeds = []
+
+    async def delete(self, *, delay=None, reason=None):
+        await api_call()
+
+    async def edit(self, **_):
+        await api_call()
+        return self
+
+    async def forward(self, destination, **_):
+        await api_call()
+        return FakeMessage(destination, self.author, self.content)
+
+class FakeTextChannel(discord.TextChannel):
+    def __init__(self, guild, channel_id: int, name: str):
+        self.guild = guild
+        self.id = channel_id
+        self.name = name
+        self.sent = 0
+
+    @property
+    def type(self):
+        return discord.ChannelType.text
+
+    def permissions_for(self, obj):
+        return discord.Permissions.all()
+
+    async def send(self, content=None, **kwargs):
+        await api_call()
+        self.sent += 1
+        return FakeMessage(self, self.guild.me, content or "")
+
+    async def fetch_message(self, message_id: int):
+        await api_call()
+        return FakeMessage(self, self.guild.me)
+
+    async def history(self, **_):
+        # channel log replay selalu kosong; satu panggilan untuk halaman pertama
+        await api_call()
+        return
+        yield
+
+    async def delete_messages(self, messages, **_):
+        await api_call()
+
+class FakeGuild:
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.name = f"guild-{guild_id % 10000}"
+        self._members: typing.Dict[int, FakeMember] = {}
+        self._channels: typing.Dict[int, typing.Any] = {}
+        self.me = FakeMember(self, 1, "bot")
+        self.me.bot = True
+        self.chunked = True
+
+    @property
+    def members(self):
+        return list(self._members.values())
+
+    @property
+    def member_count(self):
+        return len(self._members)
+
+    @property
+    def voice_channels(self):
+        return [c for c in self._channels.values() if isinstance(c, FakeVoiceChannel)]
+
+    @property
+    def text_channels(self):
+        return [c for c in self._channels.values() if isinstance(c, FakeTextChannel)]
+
+    @property
+    def stage_channels(self):
+        return []
+
+    @property
+    def roles(self):
+        return []
+
+    def get_member(self, member_id):
+        return self._members.get(member_id)
+
+    def get_channel(self, channel_id):
+        return self._channels.get(channel_id)
+
+    def get_role(self, role_id):
+        return None
+
+    def member(self, member_id: int) -> FakeMember:
+        member = self._members.get(member_id)
+        if member is None:
+            member = self._members[member_id] = FakeMember(self, member_id, f"user{len(self._members)}")
+        return member
+
+    def voice_channel(self, channel_id: int) -> FakeVoiceChannel:
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._channels[channel_id] = FakeVoiceChannel(self, channel_id, f"voice-{len(self._channels)}")
+        return channel
+
+    def text_channel(self, channel_id: int) -> FakeTextChannel:
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._channels[channel_id] = FakeTextChannel(self, channel_id, f"text-{len(self._channels)}")
+        return channel
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _ack(self):
+        if self._done:
+            raise discord.InteractionResponded(self._interaction)
+        self._done = True
+        await api_call()
+        self._interaction.acked_at = time.perf_counter()
+
+    async def send_message(self, *args, view=None, **kwargs):
+        await self._ack()
+        _auto_confirm(view)
+
+    async def defer(self, **_):
+        await self._ack()
+
+    async def autocomplete(self, choices):
+        await self._ack()
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self._interaction = interaction
+
+    async def send(self, *args, view=None, **kwargs):
+        await api_call()
+        _auto_confirm(view)
+        return FakeMessage(self._interaction.channel, self._interaction.guild.me)
+
+def _auto_confirm(view):
+    # dialog konfirmasi (ConfirmView) langsung disetujui saat replay
+    if view is not None and hasattr(view, "value"):
+        view.value = True
+        view.stop()
+
+class FakeInteraction:
+    def __init__(self, guild, user, channel, data, kind):
+        self.guild = guild
+        self.guild_id = guild.id
+        self.user = user
+        self.channel = channel
+        self.channel_id = channel.id
+        self.data = data
+        self.type = discord.InteractionType.autocomplete if kind == "autocomplete" else discord.InteractionType.application_command
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.created_at = datetime.datetime.now(datetime.timezone.utc)
+        self.acked_at: typing.Optional[float] = None
+
+    async def edit_original_response(self, **_):
+        await api_call()
+
+    async def original_response(self):
+        await api_call()
+        return FakeMessage(self.channel, self.guild.me)
+
+class FakeReference:
+    def __init__(self, channel_id, message_id, resolved):
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.resolved = resolved
+
+class FakeContext:
+    def __init__(self, message):
+        self.message = message
+        self.author = message.author
+        self.channel = message.channel
+        self.guild = message.guild
+
+class FakeBot:
+    def __init__(self):
+        self.guilds_by_id: typing.Dict[int, FakeGuild] = {}
+        self.cogs: typing.Dict[str, typing.Any] = {}
+        self.user = FakeMember(None, 1, "bot")
+
+    @property
+    def guilds(self):
+        return list(self.guilds_by_id.values())
+
+    def guild(self, guild_id: int) -> FakeGuild:
+        guild = self.guilds_by_id.get(guild_id)
+        if guild is None:
+            guild = self.guilds_by_id[guild_id] = FakeGuild(guild_id)
+        return guild
+
+    def get_guild(self, guild_id):
+        return self.guilds_by_id.get(guild_id)
+
+    def get_channel(self, channel_id):
+        for guild in self.guilds_by_id.values():
+            channel = guild.get_channel(channel_id)
+            if channel is not None:
+                return channel
+        return None
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+    async def add_cog(self, cog):
+        self.cogs[cog.__cog_name__] = cog
+        await discord.utils.maybe_coroutine(cog.cog_load)
+
+    async def wait_until_ready(self):
+        return
+
+    def is_ready(self) -> bool:
+        return True
+
+    def is_closed(self) -> bool:
+        return False
+
+# --- REPLAY ---
+
+class Replayer:
+    def __init__(self, bot: FakeBot, max_members: int):
+        self.bot = bot
+        self.max_members = max_members
+        self.commands: typing.Dict[str, typing.Tuple[typing.Any, typing.Any]] = {}
+        self.durations: typing.Dict[str, typing.List[float]] = collections.defaultdict(list)
+        self.acks: typing.Dict[str, typing.List[float]] = collections.defaultdict(list)
+        self.lag: typing.List[float] = []
+        self.errors: typing.Counter[str] = collections.Counter()
+        self.skipped: typing.Counter[str] = collections.Counter()
+        for cog in bot.cogs.values():
+            for cmd in cog.__cog_app_commands__:
+                self.commands[cmd.name] = (cog, cmd)
+
+    async def _listeners(self, event: str, *args):
+        for cog in self.bot.cogs.values():
+            for name, listener in cog.get_listeners():
+                if name == event:
+                    await listener(*args)
+
+    async def apply_state(self, rec: dict):
+        kind = rec["kind"]
+        guild = self.bot.guild(rec["guild"])
+        if kind == "guild":
+            if guild._members:
+                return
+            for ch in rec.get("text_channels", []):
+                guild.text_channel(ch)
+            for vc in rec.get("voice_channels", []):
+                channel = guild.voice_channel(vc["id"])
+                for member_id, mute, deaf in vc["members"]:
+                    member = guild.member(member_id)
+                    member._set_channel(channel)
+                    member.voice.mute, member.voice.deaf = mute, deaf
+            for i in range(min(rec.get("members", 0), self.max_members) - len(guild._members)):
+                guild.member((guild.id << 20) + i)
+        elif kind == "voice":
+            member = guild.member(rec["member"])
+            before = FakeVoiceState(member.voice.channel, member.voice.mute, member.voice.deaf) if member.voice else FakeVoiceState()
+            member._set_channel(guild.voice_channel(rec["after"]) if rec["after"] else None)
+            if member.voice:
+                member.voice.mute, member.voice.deaf = rec["mute"], rec["deaf"]
+            after = FakeVoiceState(member.voice.channel, member.voice.mute, member.voice.deaf) if member.voice else FakeVoiceState()
+            await self._listeners("on_voice_state_update", member, before, after)
+        elif kind == "member_join":
+            await self._listeners("on_member_join", guild.member(rec["member"]))
+        elif kind == "member_remove":
+            member = guild._members.pop(rec["member"], None)
+            if member:
+                member._set_channel(None)
+                await self._listeners("on_member_remove", member)
+
+    def _resolve(self, guild: FakeGuild, param, value):
+        if value is None:
+            return None
+        kind = param.type
+        if kind == discord.AppCommandOptionType.channel:
+            return guild.get_channel(int(value))
+        if kind in (discord.AppCommandOptionType.user, discord.AppCommandOptionType.mentionable):
+            # user yang tidak ada di snapshot awal tetap dibuat agar perintah berjalan seperti aslinya
+            return guild.member(int(value))
+        return value
+
+    async def interaction(self, rec: dict):
+        name = rec["command"]
+        if name not in self.commands:
+            self.skipped[name] += 1
+            return
+        cog, cmd = self.commands[name]
+        guild = self.bot.guild(rec["guild"])
+        channel = guild.get_channel(rec["channel"]) or guild.text_channel(rec["channel"])
+        user = guild.member(rec["user"])
+        data = {"name": name, "options": rec["options"]}
+        interaction = FakeInteraction(guild, user, channel, data, rec["kind"])
+        label = f"{rec['kind']}:{name}"
+
+        start = time.perf_counter()
+        try:
+            if rec["kind"] == "autocomplete":
+                focused = next((o for o in rec["options"] if o.get("focused")), None)
+                param = cmd._params.get(focused["name"]) if focused else None
+                if param is None or param.autocomplete is None:
+                    self.skipped[label] += 1
+                    return
+                if getattr(param.autocomplete, "pass_command_binding", False):
+                    await param.autocomplete(cog, interaction, focused.get("value", ""))
+                else:
+                    await param.autocomplete(interaction, focused.get("value", ""))
+            else:
+                kwargs = {}
+                for o in rec["options"]:
+                    param = cmd._params.get(o["name"])
+                    if param is not None:
+                        kwargs[param.name] = self._resolve(guild, param, o.get("value"))
+                await cmd.callback(cog, interaction, **kwargs)
+        except Exception as e:
+            self.errors[f"{label}: {type(e).__name__}"] += 1
+        finally:
+            end = time.perf_counter()
+            self.durations[label].append(end - start)
+            if rec["kind"] == "command" and interaction.acked_at is not None:
+                self.acks[name].append(interaction.acked_at - start)
+
+    async def prefix(self, rec: dict):
+        cog = self.bot.get_cog("TextModeration")
+        if cog is None:
+            self.skipped["prefix:" + rec["command"]] += 1
+            return
+        guild = self.bot.guild(rec["guild"])
+        channel = guild.get_channel(rec["channel"]) or guild.text_channel(rec["channel"])
+        author = guild.member(rec["user"])
+        reference = None
+        if rec.get("reply_to"):
+            target = FakeMessage(channel, guild.member(rec["reply_author"]) if rec.get("reply_author") else author, "x")
+            reference = FakeReference(channel.id, rec["reply_to"], target if rec.get("cached") else None)
+        ctx = FakeContext(FakeMessage(channel, author, "!delete", reference))
+        label = "prefix:" + rec["command"] + (":cached" if rec.get("cached") else ":fetched")
+        start = time.perf_counter()
+        try:
+            await cog.delete_cmd.callback(cog, ctx, reason=rec.get("reason"))
+        except Exception as e:
+            self.errors[f"{label}: {type(e).__name__}"] += 1
+        finally:
+            self.durations[label].append(time.perf_counter() - start)
+
+    async def run(self, records: typing.List[dict], speed: float):
+        loop = asyncio.get_running_loop()
+        base = loop.time()
+        origin = records[0]["t"] if records else 0.0
+        pending = set()
+        for rec in records:
+            if speed > 0:
+                target = base + (rec["t"] - origin) / speed
+                delay = target - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self.lag.append(max(loop.time() - target, 0.0))
+            kind = rec["kind"]
+            if kind in ("command", "autocomplete"):
+                task = asyncio.create_task(self.interaction(rec))
+            elif kind == "prefix":
+                task = asyncio.create_task(self.prefix(rec))
+            else:
+                await self.apply_state(rec)
+                continue
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            if speed == 0:
+                await asyncio.sleep(0)
+        if pending:
+            await asyncio.gather(*pending)
+
+def percentile(values: typing.List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def report(replayer: Replayer, elapsed: float, events: int):
+    def row(label, values):
+        ms = [v * 1000 for v in values]
+        return (
+            f"{label:<34} {len(ms):>6} {percentile(ms, 0.50):>9.1f} {percentile(ms, 0.95):>9.1f} "
+            f"{percentile(ms, 0.99):>9.1f} {max(ms):>9.1f}"
+        )
+    header = f"{'':<34} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+
+    print(f"event: {events} • waktu: {elapsed:.2f} s • panggilan API simulasi: {API['calls']}")
+    print("\nDurasi handler")
+    print(header)
+    for label in sorted(replayer.durations):
+        print(row(label, replayer.durations[label]))
+    if replayer.acks:
+        print("\nWaktu sampai interaction di-acknowledge (batas Discord: 3000 ms)")
+        print(header)
+        for name in sorted(replayer.acks):
+            print(row(name, replayer.acks[name]))
+    if replayer.lag:
+        print("\nKeterlambatan jadwal replay")
+        print(header)
+        print(row("lag", replayer.lag))
+    if replayer.errors:
+        print("\nError")
+        for label, count in replayer.errors.most_common():
+            print(f"  {count:>6}  {label}")
+    if replayer.skipped:
+        print("\nDilewati (cog tidak dimuat / tanpa autocomplete)")
+        for label, count in replayer.skipped.most_common():
+            print(f"  {count:>6}  {label}")
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("file")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--api-latency", type=float, default=50.0, help="ms")
+    parser.add_argument("--api-jitter", type=float, default=20.0, help="ms")
+    parser.add_argument("--extensions", default=DEFAULT_EXTENSIONS, help="cog yang dimuat, dipisah koma")
+    parser.add_argument("--max-members", type=int, default=200000, help="batas member palsu per guild")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    API["latency"] = args.api_latency / 1000
+    API["jitter"] = min(args.api_jitter, args.api_latency) / 1000
+    with open(args.file, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    records.sort(key=lambda r: r["t"])
+
+    sys.path.insert(0, os.getcwd())
+    modules = [importlib.import_module(f"cogs.{name.strip()}") for name in args.extensions.split(",") if name.strip()]
+    os.chdir(tempfile.mkdtemp(prefix="replay-"))
+
+    bot = FakeBot()
+    for module in modules:
+        await module.setup(bot)
+    replayer = Replayer(bot, args.max_members)
+
+    start = time.perf_counter()
+    try:
+        await replayer.run(records, args.speed)
+    finally:
+        for cog in bot.cogs.values():
+            await discord.utils.maybe_coroutine(cog.cog_unload)
+    report(replayer, time.perf_counter() - start, len(records))
+
+if __name__ == "__main__":
+    asyncio.run(main())
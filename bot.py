@@ -11,8 +11,11 @@ TOKEN = os.getenv("TOKEN")
 if not TOKEN:
     raise SystemExit("ERROR: TOKEN tidak ditemukan. Isi TOKEN di file .env pada root project Anda.")
 
+# Jumlah pesan yang di-cache discord.py; 0 untuk mematikan cache pesan.
+MAX_MESSAGES = int(os.getenv("MAX_MESSAGES", "1000"))
+
 intents = discord.Intents.all()
-bot = commands.Bot(command_prefix="!", intents=intents, application_id=None)
+bot = commands.Bot(command_prefix="!", intents=intents, application_id=None, max_messages=MAX_MESSAGES or None)
 
 class HelpCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -35,6 +38,9 @@ async def load_cogs():
         try:
             await bot.load_extension(ext)
             print(f"Loaded extension {ext}")
+        except commands.NoEntryPointError:
+            # modul helper bersama (tanpa setup), bukan cog
+            continue
         except Exception as e:
             print(f"Failed to load extension {ext}: {e}")
 
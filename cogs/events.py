@@ -1,9 +1,575 @@
 import discord
-from discord.ext import commands
+from discord import app_commands
+from discord.ext import commands, tasks
+from .log_config import load_config
+from .outbound import ENFORCEMENT, LOGGING, dispatch, route, send_message
+import collections
+import datetime
+import json
+import os
+import re
+import sys
+import time
+import typing
+
+
+ANTISPAM_FILE = "antispam.json"
+
+# Flood: lebih dari FLOOD_MAX_MESSAGES pesan dalam FLOOD_WINDOW_SECONDS.
+FLOOD_MAX_MESSAGES = 6
+FLOOD_WINDOW_SECONDS = 5.0
+# Duplikat: konten sama >= DUPLICATE_MAX kali dari satu user dalam DUPLICATE_WINDOW_SECONDS.
+DUPLICATE_MAX = 3
+DUPLICATE_WINDOW_SECONDS = 30.0
+# Konten pendek ("gg", "ok", "+1") hanya dihitung duplikat bila membawa link, mention, atau lampiran.
+DUPLICATE_MIN_CHARS = 12
+# Duplikat lintas user di satu channel (raid copy-paste).
+CHANNEL_DUPLICATE_USERS = 4
+CHANNEL_DUPLICATE_HISTORY = 32
+# Mention storm: total mention dalam MENTION_WINDOW_SECONDS, atau dalam satu pesan.
+MENTION_MAX = 10
+MENTION_SINGLE_MAX = 8
+MENTION_WINDOW_SECONDS = 10
+# Lama user dianggap pelanggar setelah terdeteksi; pesan berikutnya langsung dihapus.
+OFFENDER_SECONDS = 30.0
+
+MAX_TRACKED_USERS = 50000
+MAX_TRACKED_CHANNELS = 10000
+IDLE_SECONDS = 300.0
+
+FLUSH_INTERVAL_SECONDS = 1.0
+DELETE_BATCH_SIZE = 100
+LOG_BATCH_LINES = 25
+LOG_BATCH_CHARS = 3800
+LOG_CONFIG_REFRESH_SECONDS = 30.0
+
+# Cache konten pesan untuk log hapus/edit: batas byte per guild dan total.
+CONTENT_CACHE_GUILD_BYTES = 4 * 1024 * 1024
+CONTENT_CACHE_TOTAL_BYTES = 64 * 1024 * 1024
+LOG_CONTENT_CHARS = 300
+# ID pesan yang dihapus bot sendiri (anti-spam, filter, !delete) agar tidak dicatat dua kali.
+MAX_EXPECTED_DELETIONS = 10000
+# ID pesan yang dikirim bot sendiri (mis. balasan delete_after); hapusnya tidak dicatat
+# walau pesan sudah keluar dari cache discord.py.
+MAX_OWN_MESSAGES = 10000
+
+# kind log -> (judul embed, warna)
+LOG_KINDS = {
+    "spam": ("🛡️ Anti-spam", discord.Color.orange()),
+    "delete": ("🗑️ Pesan Dihapus", discord.Color.red()),
+    "edit": ("✏️ Pesan Diedit", discord.Color.gold()),
+}
+
+VERDICT_LABELS = {
+    "flood": "🌊 Flood",
+    "duplicate": "📑 Duplikat",
+    "raid_duplicate": "📑 Duplikat lintas user",
+    "mention": "📣 Mention storm",
+    "offender": "⛔ Lanjutan pelanggar",
+}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LINK_RE = re.compile(r"https?://|discord\.gg/|www\.")
+
+# --- HELPER FUNCTIONS (JSON) ---
+
+def load_antispam() -> dict:
+    """Memuat daftar guild yang mengaktifkan anti-spam."""
+    if not os.path.exists(ANTISPAM_FILE):
+        return {}
+    with open(ANTISPAM_FILE, 'r') as f:
+        return json.load(f)
+
+def save_antispam(data: dict):
+    """Menyimpan daftar guild yang mengaktifkan anti-spam."""
+    with open(ANTISPAM_FILE, 'w') as f:
+        json.dump(data, f, indent=4)
+
+def content_hash(content: str, mentions: int = 0, attachments: int = 0) -> int:
+    """Hash konten yang dinormalisasi (huruf kecil, spasi dirapatkan); 0 bila terlalu umum untuk dicek duplikat."""
+    normalized = _WHITESPACE_RE.sub(" ", content.casefold()).strip()
+    if len(normalized) < DUPLICATE_MIN_CHARS and not mentions and not attachments and not _LINK_RE.search(normalized):
+        return 0
+    return hash(normalized)
+
+# --- SPAM DETECTOR ---
+
+class _UserState:
+    __slots__ = ("times", "refs", "pos", "hashes", "hash_times", "hash_pos", "mention_buckets", "mention_seconds", "offender_until", "last_seen")
+
+    def __init__(self):
+        # ring waktu + referensi (channel_id, message_id) dari FLOOD_MAX_MESSAGES pesan terakhir
+        self.times = [0.0] * FLOOD_MAX_MESSAGES
+        self.refs: typing.List[typing.Optional[typing.Tuple[int, int]]] = [None] * FLOOD_MAX_MESSAGES
+        self.pos = 0
+        # ring hash konten dari DUPLICATE_MAX pesan terakhir
+        self.hashes = [0] * DUPLICATE_MAX
+        self.hash_times = [0.0] * DUPLICATE_MAX
+        self.hash_pos = 0
+        # counter mention per detik, ring sepanjang window
+        self.mention_buckets = [0] * MENTION_WINDOW_SECONDS
+        self.mention_seconds = [0] * MENTION_WINDOW_SECONDS
+        self.offender_until = 0.0
+        self.last_seen = 0.0
+
+class _ChannelState:
+    __slots__ = ("hashes", "authors", "pos", "last_seen")
+
+    def __init__(self):
+        self.hashes = [0] * CHANNEL_DUPLICATE_HISTORY
+        self.authors = [0] * CHANNEL_DUPLICATE_HISTORY
+        self.pos = 0
+        self.last_seen = 0.0
+
+class SpamDetector:
+    """Detektor flood/duplikat/mention dengan biaya O(1) per pesan dan memori terbatas (LRU)."""
+
+    def __init__(self, max_users: int = MAX_TRACKED_USERS, max_channels: int = MAX_TRACKED_CHANNELS):
+        self.max_users = max_users
+        self.max_channels = max_channels
+        self._users: typing.OrderedDict[typing.Tuple[int, int], _UserState] = collections.OrderedDict()
+        self._channels: typing.OrderedDict[int, _ChannelState] = collections.OrderedDict()
+        self.checked = 0
+        self.flagged = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def _user(self, key: typing.Tuple[int, int], now: float) -> _UserState:
+        state = self._users.get(key)
+        if state is None:
+            state = self._users[key] = _UserState()
+        else:
+            self._users.move_to_end(key)
+        state.last_seen = now
+        users = self._users
+        # LRU: entri terdepan adalah yang paling lama idle
+        while len(users) > self.max_users or users[next(iter(users))].last_seen < now - IDLE_SECONDS:
+            users.popitem(last=False)
+            self.evicted += 1
+        return state
+
+    def _channel(self, channel_id: int, now: float) -> _ChannelState:
+        state = self._channels.get(channel_id)
+        if state is None:
+            state = self._channels[channel_id] = _ChannelState()
+            if len(self._channels) > self.max_channels:
+                self._channels.popitem(last=False)
+        else:
+            self._channels.move_to_end(channel_id)
+        state.last_seen = now
+        return state
+
+    def check(
+        self,
+        guild_id: int,
+        channel_id: int,
+        author_id: int,
+        message_id: int,
+        content: str,
+        mentions: int,
+        now: float,
+        attachments: int = 0
+    ) -> typing.Tuple[typing.Optional[str], typing.List[typing.Tuple[int, int]]]:
+        """Memproses satu pesan. Mengembalikan (verdict, pesan yang perlu dihapus)."""
+        self.checked += 1
+        user = self._user((guild_id, author_id), now)
+        ref = (channel_id, message_id)
+
+        if user.offender_until > now:
+            return "offender", [ref]
+
+        # flood: slot tertua di ring adalah pesan ke-N sebelumnya
+        oldest = user.times[user.pos]
+        user.times[user.pos] = now
+        user.refs[user.pos] = ref
+        user.pos = (user.pos + 1) % FLOOD_MAX_MESSAGES
+        verdict = None
+        if oldest and now - oldest <= FLOOD_WINDOW_SECONDS:
+            verdict = "flood"
+
+        digest = content_hash(content, mentions, attachments) if content else 0
+        if verdict is None and digest:
+            user.hashes[user.hash_pos] = digest
+            user.hash_times[user.hash_pos] = now
+            user.hash_pos = (user.hash_pos + 1) % DUPLICATE_MAX
+            repeats = sum(
+                1 for h, t in zip(user.hashes, user.hash_times)
+                if h == digest and now - t <= DUPLICATE_WINDOW_SECONDS
+            )
+            if repeats >= DUPLICATE_MAX:
+                verdict = "duplicate"
+
+        if verdict is None and digest:
+            channel = self._channel(channel_id, now)
+            channel.hashes[channel.pos] = digest
+            channel.authors[channel.pos] = author_id
+            channel.pos = (channel.pos + 1) % CHANNEL_DUPLICATE_HISTORY
+            authors = {a for h, a in zip(channel.hashes, channel.authors) if h == digest}
+            if len(authors) >= CHANNEL_DUPLICATE_USERS:
+                verdict = "raid_duplicate"
+
+        if verdict is None and mentions:
+            second = int(now)
+            slot = second % MENTION_WINDOW_SECONDS
+            if user.mention_seconds[slot] != second:
+                user.mention_seconds[slot] = second
+                user.mention_buckets[slot] = 0
+            user.mention_buckets[slot] += mentions
+            total = sum(
+                n for n, s in zip(user.mention_buckets, user.mention_seconds)
+                if second - s < MENTION_WINDOW_SECONDS
+            )
+            if mentions >= MENTION_SINGLE_MAX or total >= MENTION_MAX:
+                verdict = "mention"
+
+        if verdict is None:
+            return None, []
+
+        self.flagged += 1
+        if verdict == "raid_duplicate":
+            # salinan lintas user belum tentu dari spammer: hanya salinan ini yang dihapus, tanpa penalti
+            return verdict, [ref]
+        user.offender_until = now + OFFENDER_SECONDS
+        # hapus juga pesan-pesan sebelumnya yang masih di window
+        refs = [
+            r for r, t in zip(user.refs, user.times)
+            if r is not None and now - t <= max(FLOOD_WINDOW_SECONDS, DUPLICATE_WINDOW_SECONDS)
+        ]
+        if ref not in refs:
+            refs.append(ref)
+        user.refs = [None] * FLOOD_MAX_MESSAGES
+        return verdict, refs
+
+    def forget_user(self, guild_id: int, author_id: int):
+        self._users.pop((guild_id, author_id), None)
+
+# --- CONTENT CACHE ---
+
+# (channel_id, author_id, created_at, content, nama lampiran)
+CachedMessage = typing.Tuple[int, int, float, str, typing.Tuple[str, ...]]
+
+def _entry_size(entry: CachedMessage) -> int:
+    return sys.getsizeof(entry) + sys.getsizeof(entry[3]) + sum(sys.getsizeof(a) for a in entry[4]) + 96
+
+class ContentCache:
+    """Cache konten pesan per guild dalam tuple ringkas, dibatasi jumlah byte (bukan jumlah pesan)."""
+
+    def __init__(self, guild_bytes: int = CONTENT_CACHE_GUILD_BYTES, total_bytes: int = CONTENT_CACHE_TOTAL_BYTES):
+        self.guild_bytes = guild_bytes
+        self.total_bytes = total_bytes
+        # guild_id -> (message_id -> entry); urutan guild = LRU aktivitas
+        self._guilds: typing.OrderedDict[int, typing.OrderedDict[int, CachedMessage]] = collections.OrderedDict()
+        self._sizes: typing.Dict[int, int] = {}
+        self.size = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return sum(len(g) for g in self._guilds.values())
+
+    def _evict_one(self, guild_id: int):
+        messages = self._guilds[guild_id]
+        _, entry = messages.popitem(last=False)
+        freed = _entry_size(entry)
+        self._sizes[guild_id] -= freed
+        self.size -= freed
+        self.evicted += 1
+        if not messages:
+            del self._guilds[guild_id]
+            del self._sizes[guild_id]
+
+    def put(self, guild_id: int, message_id: int, entry: CachedMessage):
+        messages = self._guilds.get(guild_id)
+        if messages is None:
+            messages = self._guilds[guild_id] = collections.OrderedDict()
+            self._sizes[guild_id] = 0
+        else:
+            self._guilds.move_to_end(guild_id)
+        old = messages.pop(message_id, None)
+        if old is not None:
+            self._sizes[guild_id] -= _entry_size(old)
+            self.size -= _entry_size(old)
+        messages[message_id] = entry
+        added = _entry_size(entry)
+        self._sizes[guild_id] += added
+        self.size += added
+        while guild_id in self._sizes and self._sizes[guild_id] > self.guild_bytes:
+            self._evict_one(guild_id)
+        while self.size > self.total_bytes and self._guilds:
+            # guild paling lama tidak aktif dikorbankan lebih dulu
+            self._evict_one(next(iter(self._guilds)))
+
+    def get(self, guild_id: int, message_id: int) -> typing.Optional[CachedMessage]:
+        messages = self._guilds.get(guild_id)
+        return messages.get(message_id) if messages else None
+
+    def pop(self, guild_id: int, message_id: int) -> typing.Optional[CachedMessage]:
+        messages = self._guilds.get(guild_id)
+        if not messages:
+            return None
+        entry = messages.pop(message_id, None)
+        if entry is not None:
+            freed = _entry_size(entry)
+            self._sizes[guild_id] -= freed
+            self.size -= freed
+            if not messages:
+                del self._guilds[guild_id]
+                del self._sizes[guild_id]
+        return entry
+
+    def drop_guild(self, guild_id: int):
+        if self._guilds.pop(guild_id, None) is not None:
+            self.size -= self._sizes.pop(guild_id)
+
+def _shorten(text: str, limit: int = LOG_CONTENT_CHARS) -> str:
+    text = text.replace("\n", " ")
+    return text if len(text) <= limit else text[:limit] + "…"
+
+def _batch_lines(lines: typing.List[str]) -> typing.Iterator[typing.List[str]]:
+    """Membagi baris log per embed: maksimal LOG_BATCH_LINES baris dan LOG_BATCH_CHARS karakter."""
+    chunk: typing.List[str] = []
+    size = 0
+    for line in lines:
+        if chunk and (len(chunk) >= LOG_BATCH_LINES or size + len(line) + 1 > LOG_BATCH_CHARS):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(line[:LOG_BATCH_CHARS])
+        size += len(line) + 1
+    if chunk:
+        yield chunk
+
+# --- COG CLASS ---
 
 class Events(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.detector = SpamDetector()
+        self.enabled = load_antispam()
+        # channel_id -> (guild_id, set(message_id))
+        self._pending_deletes: typing.Dict[int, typing.Tuple[int, typing.Set[int]]] = {}
+        # guild_id -> kind -> baris log
+        self._pending_logs: typing.Dict[int, typing.Dict[str, typing.List[str]]] = {}
+        self.content = ContentCache()
+        self._expected_deletions: typing.OrderedDict[int, None] = collections.OrderedDict()
+        self._own_messages: typing.OrderedDict[int, None] = collections.OrderedDict()
+        # guild_id -> channel log; dibaca ulang dari config secara berkala
+        self._log_channels: typing.Dict[int, int] = {}
+        self._log_channels_at = 0.0
+        self.flush_task.start()
+
+    def cog_unload(self):
+        self.flush_task.cancel()
+
+    def _refresh_log_channels(self, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self._log_channels_at < LOG_CONFIG_REFRESH_SECONDS:
+            return
+        self._log_channels_at = now
+        try:
+            self._log_channels = {int(k): int(v) for k, v in load_config().items()}
+        except Exception as e:
+            print(f"ERROR: Gagal membaca config log: {e}")
+
+    def _queue_log(self, guild_id: int, kind: str, line: str):
+        self._pending_logs.setdefault(guild_id, {}).setdefault(kind, []).append(line)
+
+    def expect_deletion(self, message_ids: typing.Iterable[int]):
+        """Tandai pesan yang akan dihapus bot sendiri; log hapus mentahnya dilewati."""
+        for message_id in message_ids:
+            self._expected_deletions[message_id] = None
+        while len(self._expected_deletions) > MAX_EXPECTED_DELETIONS:
+            self._expected_deletions.popitem(last=False)
+
+    # --- LISTENER: pesan baru (cache konten + anti-spam) ---
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.guild is None:
+            return
+        self._refresh_log_channels()
+        log_channel_id = self._log_channels.get(message.guild.id)
+        if log_channel_id and message.author == self.bot.user:
+            self._own_messages[message.id] = None
+            while len(self._own_messages) > MAX_OWN_MESSAGES:
+                self._own_messages.popitem(last=False)
+        elif log_channel_id and message.channel.id != log_channel_id:
+            self.content.put(message.guild.id, message.id, (
+                message.channel.id,
+                message.author.id,
+                message.created_at.timestamp(),
+                message.content,
+                tuple(a.filename for a in message.attachments),
+            ))
+
+        if message.author.bot or not self.enabled.get(str(message.guild.id)):
+            return
+        verdict, refs = self.detector.check(
+            message.guild.id,
+            message.channel.id,
+            message.author.id,
+            message.id,
+            message.content,
+            len(message.raw_mentions) + len(message.raw_role_mentions) + (5 if message.mention_everyone else 0),
+            message.created_at.timestamp(),
+            len(message.attachments)
+        )
+        if verdict is None:
+            return
+        perms = message.channel.permissions_for(message.author)
+        if perms.manage_messages or perms.administrator:
+            self.detector.forget_user(message.guild.id, message.author.id)
+            return
+
+        for channel_id, message_id in refs:
+            _, ids = self._pending_deletes.setdefault(channel_id, (message.guild.id, set()))
+            ids.add(message_id)
+        self.expect_deletion(message_id for _, message_id in refs)
+        if verdict != "offender":
+            self._queue_log(
+                message.guild.id, "spam",
+                f"<t:{int(message.created_at.timestamp())}:T> **{VERDICT_LABELS[verdict]}** "
+                f"{message.author.mention} di {message.channel.mention} • {len(refs)} pesan"
+            )
+
+    # --- LISTENERS: log hapus/edit (raw, tidak bergantung cache discord.py) ---
+    def _deleted_line(self, guild_id: int, channel_id: int, message_id: int, cached: typing.Optional[discord.Message]) -> typing.Optional[str]:
+        entry = self.content.pop(guild_id, message_id)
+        if message_id in self._expected_deletions:
+            del self._expected_deletions[message_id]
+            return None
+        if message_id in self._own_messages:
+            del self._own_messages[message_id]
+            return None
+        if entry is None:
+            if cached is not None and cached.author == self.bot.user:
+                return None
+            return f"<#{channel_id}> • `{message_id}` • *(konten tidak ada di cache)*"
+        _, author_id, created_at, content, attachments = entry
+        line = f"<#{channel_id}> • <@{author_id}> • <t:{int(created_at)}:f>\n> {_shorten(content) or '*(tanpa teks)*'}"
+        if attachments:
+            line += f"\n📎 {', '.join(attachments)}"
+        return line
+
+    def _should_log(self, guild_id: typing.Optional[int], channel_id: int) -> bool:
+        if guild_id is None:
+            return False
+        self._refresh_log_channels()
+        log_channel_id = self._log_channels.get(guild_id)
+        # purge channel log oleh LogConfig tidak perlu dicatat
+        return bool(log_channel_id) and channel_id != log_channel_id
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        if not self._should_log(payload.guild_id, payload.channel_id):
+            return
+        line = self._deleted_line(payload.guild_id, payload.channel_id, payload.message_id, payload.cached_message)
+        if line:
+            self._queue_log(payload.guild_id, "delete", line)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        if not self._should_log(payload.guild_id, payload.channel_id):
+            return
+        cached = {m.id: m for m in payload.cached_messages}
+        for message_id in sorted(payload.message_ids):
+            line = self._deleted_line(payload.guild_id, payload.channel_id, message_id, cached.get(message_id))
+            if line:
+                self._queue_log(payload.guild_id, "delete", line)
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        if not self._should_log(payload.guild_id, payload.channel_id):
+            return
+        content = payload.data.get("content")
+        if content is None:
+            # update tanpa konten (embed link dimuat, pin, dll.)
+            return
+        entry = self.content.get(payload.guild_id, payload.message_id)
+        if entry is not None and entry[3] == content:
+            return
+        author_id = entry[1] if entry else int(payload.data.get("author", {}).get("id", 0)) or None
+        if author_id == self.bot.user.id or payload.message_id in self._own_messages:
+            return
+        before = _shorten(entry[3]) if entry else "*(tidak ada di cache)*"
+        author = f"<@{author_id}> • " if author_id else ""
+        self._queue_log(
+            payload.guild_id, "edit",
+            f"<#{payload.channel_id}> • {author}[pesan](https://discord.com/channels/{payload.guild_id}/{payload.channel_id}/{payload.message_id})\n"
+            f"**Sebelum:** {before or '*(tanpa teks)*'}\n**Sesudah:** {_shorten(content) or '*(tanpa teks)*'}"
+        )
+        if entry is not None:
+            self.content.put(payload.guild_id, payload.message_id, entry[:3] + (content,) + entry[4:])
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.content.drop_guild(guild.id)
+
+    # --- BACKGROUND TASK: hapus & log secara batch ---
+    @tasks.loop(seconds=FLUSH_INTERVAL_SECONDS)
+    async def flush_task(self):
+        deletes, self._pending_deletes = self._pending_deletes, {}
+        logs, self._pending_logs = self._pending_logs, {}
+
+        for channel_id, (guild_id, ids) in deletes.items():
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                continue
+            ordered = sorted(ids)
+            for i in range(0, len(ordered), DELETE_BATCH_SIZE):
+                chunk = [discord.Object(id=mid) for mid in ordered[i:i + DELETE_BATCH_SIZE]]
+                try:
+                    await dispatch(
+                        self.bot, ENFORCEMENT, route("message.delete", channel_id), guild_id,
+                        lambda chunk=chunk: channel.delete_messages(chunk, reason="Anti-spam")
+                    )
+                except discord.NotFound:
+                    pass
+                except Exception as e:
+                    print(f"ERROR: Gagal menghapus pesan spam di channel {channel_id}: {e}")
+
+        self._refresh_log_channels()
+        for guild_id, kinds in logs.items():
+            log_channel_id = self._log_channels.get(guild_id)
+            log_ch = self.bot.get_channel(log_channel_id) if log_channel_id else None
+            if not log_ch:
+                continue
+            for kind, lines in kinds.items():
+                title, color = LOG_KINDS[kind]
+                for chunk in _batch_lines(lines):
+                    embed = discord.Embed(
+                        title=f"{title} ({len(chunk)})" if len(chunk) > 1 else title,
+                        description="\n".join(chunk),
+                        color=color,
+                        timestamp=datetime.datetime.now(datetime.timezone.utc)
+                    )
+                    embed.set_footer(text=f"Guild: {guild_id}")
+                    try:
+                        await send_message(self.bot, LOGGING, log_ch, embed=embed)
+                    except Exception:
+                        pass
+
+    @flush_task.before_loop
+    async def before_flush_task(self):
+        await self.bot.wait_until_ready()
+        self._refresh_log_channels(force=True)
+
+    # --- COMMAND: /antispam ---
+    @app_commands.command(name="antispam", description="Aktifkan/nonaktifkan deteksi spam otomatis")
+    @app_commands.describe(enabled="Aktif atau tidak")
+    @app_commands.default_permissions(administrator=True)
+    async def antispam(self, interaction: discord.Interaction, enabled: bool):
+        key = str(interaction.guild_id)
+        if enabled:
+            self.enabled[key] = True
+        else:
+            self.enabled.pop(key, None)
+        save_antispam(self.enabled)
+        stats = self.detector
+        await interaction.response.send_message(
+            f"🛡️ Anti-spam {'aktif' if enabled else 'nonaktif'}.\n"
+            f"Dicek: {stats.checked} pesan • Terdeteksi: {stats.flagged} • User dilacak: {len(stats)} • Dibuang (LRU): {stats.evicted}",
+            ephemeral=True
+        )
 
 async def setup(bot: commands.Bot):
-    await bot.add_cog(Events(bot))
\ No newline at end of file
+    await bot.add_cog(Events(bot))
@@ -0,0 +1,361 @@
+# cogs/evidence_store.py
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from .outbound import LOGGING, dispatch, route
+from .sqlite_store import SQLiteStore
+import aiohttp
+import asyncio
+import hashlib
+import os
+import threading
+import time
+import typing
+
+
+EVIDENCE_DIR = "evidence"
+EVIDENCE_DB_FILE = "evidence.db"
+# Batas total ukuran file tersimpan; file yang paling lama tidak terlihat dihapus lebih dulu.
+EVIDENCE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+EVIDENCE_MAX_AGE_DAYS = 90
+MAX_ATTACHMENT_BYTES = 25 * 1024 * 1024
+DOWNLOAD_WORKERS = 4
+QUEUE_SIZE = 500
+DOWNLOAD_TIMEOUT_SECONDS = 60
+EVICT_MINUTES = 30
+# Waktu tunggu arsip sebelum pesan dihapus; bila lewat, pesan di-forward sebagai cadangan.
+ARCHIVE_WAIT_SECONDS = 5.0
+# Panjang prefix hash yang ditampilkan di log (cukup untuk /evidence).
+HASH_PREFIX = 16
+MIN_LOOKUP_PREFIX = 8
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evidence_blobs (
+    sha256       TEXT PRIMARY KEY,
+    size         INTEGER NOT NULL,
+    content_type TEXT,
+    created_at   REAL NOT NULL,
+    last_seen    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_evidence_blobs_seen ON evidence_blobs (last_seen);
+CREATE TABLE IF NOT EXISTS evidence_refs (
+    attachment_id INTEGER PRIMARY KEY,
+    message_id    INTEGER NOT NULL,
+    guild_id      INTEGER NOT NULL,
+    filename      TEXT NOT NULL,
+    sha256        TEXT NOT NULL,
+    size          INTEGER NOT NULL,
+    created_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_evidence_refs_sha ON evidence_refs (sha256);
+"""
+
+class EvidenceItem(typing.NamedTuple):
+    filename: str
+    sha256: str
+    size: int
+    duplicate: bool
+
+# --- HELPER FUNCTIONS (FILES) ---
+
+def blob_path(sha256: str) -> str:
+    """Lokasi file berdasarkan hash, dipecah per 2 karakter pertama agar direktori tidak terlalu besar."""
+    return os.path.join(EVIDENCE_DIR, sha256[:2], sha256)
+
+def write_blob(data: bytes) -> str:
+    """Menghitung sha256 lalu menulis file secara atomik bila belum ada. Mengembalikan hash."""
+    sha256 = hashlib.sha256(data).hexdigest()
+    path = blob_path(sha256)
+    if os.path.exists(path):
+        return sha256
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return sha256
+
+def format_size(size: int) -> str:
+    if size >= 1024 * 1024:
+        return f"{size / 1024 / 1024:.1f} MiB"
+    return f"{size / 1024:.0f} KiB"
+
+class EvidenceIndex(SQLiteStore):
+    """Indeks SQLite: satu baris per file unik, satu baris per lampiran yang merujuknya."""
+
+    def __init__(self, path: str = EVIDENCE_DB_FILE):
+        super().__init__(path, _SCHEMA)
+
+    def record(self, sha256: str, size: int, content_type: typing.Optional[str], attachment_id: int,
+               message_id: int, guild_id: int, filename: str) -> bool:
+        """Mencatat lampiran. True bila file dengan hash ini sudah tersimpan sebelumnya."""
+        now = time.time()
+        with self._lock, self._conn:
+            existed = self._conn.execute(
+                "UPDATE evidence_blobs SET last_seen = ? WHERE sha256 = ?", (now, sha256)
+            ).rowcount > 0
+            if not existed:
+                self._conn.execute(
+                    "INSERT INTO evidence_blobs (sha256, size, content_type, created_at, last_seen) VALUES (?, ?, ?, ?, ?)",
+                    (sha256, size, content_type, now, now)
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evidence_refs (attachment_id, message_id, guild_id, filename, sha256, size, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (attachment_id, message_id, guild_id, filename, sha256, size, now)
+            )
+            return existed
+
+    def lookup(self, guild_id: int, prefix: str) -> typing.List[tuple]:
+        """Mencari file berdasarkan prefix hash yang pernah muncul di guild ini."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT b.sha256, b.size, b.content_type, r.filename FROM evidence_blobs b "
+                "JOIN evidence_refs r ON r.sha256 = b.sha256 "
+                "WHERE r.guild_id = ? AND b.sha256 LIKE ? GROUP BY b.sha256 LIMIT 2",
+                (guild_id, prefix + "%")
+            ).fetchall()
+
+    def touch(self, sha256: str):
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE evidence_blobs SET last_seen = ? WHERE sha256 = ?", (time.time(), sha256))
+
+    def stats(self, guild_id: typing.Optional[int] = None) -> typing.Tuple[int, int, int, int]:
+        """(jumlah lampiran, total byte lampiran, jumlah file unik, total byte tersimpan)."""
+        with self._lock:
+            if guild_id is None:
+                refs, logical = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM evidence_refs").fetchone()
+                blobs, stored = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM evidence_blobs").fetchone()
+            else:
+                refs, logical = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM evidence_refs WHERE guild_id = ?", (guild_id,)
+                ).fetchone()
+                blobs, stored = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM evidence_blobs "
+                    "WHERE sha256 IN (SELECT sha256 FROM evidence_refs WHERE guild_id = ?)", (guild_id,)
+                ).fetchone()
+            return refs, logical, blobs, stored
+
+    def evict(self, max_bytes: int, max_age_seconds: float) -> typing.List[str]:
+        """Menghapus baris file yang basi lalu yang paling lama tidak terlihat sampai total <= max_bytes."""
+        cutoff = time.time() - max_age_seconds
+        with self._lock, self._conn:
+            victims = [r[0] for r in self._conn.execute("SELECT sha256 FROM evidence_blobs WHERE last_seen < ?", (cutoff,))]
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM evidence_blobs WHERE last_seen >= ?", (cutoff,)
+            ).fetchone()
+            if total > max_bytes:
+                for sha256, size in self._conn.execute(
+                    "SELECT sha256, size FROM evidence_blobs WHERE last_seen >= ? ORDER BY last_seen", (cutoff,)
+                ).fetchall():
+                    if total <= max_bytes:
+                        break
+                    victims.append(sha256)
+                    total -= size
+            self._conn.executemany("DELETE FROM evidence_blobs WHERE sha256 = ?", [(v,) for v in victims])
+            self._conn.executemany("DELETE FROM evidence_refs WHERE sha256 = ?", [(v,) for v in victims])
+            return victims
+
+def remove_blobs(hashes: typing.List[str]):
+    for sha256 in hashes:
+        try:
+            os.remove(blob_path(sha256))
+        except FileNotFoundError:
+            pass
+
+# --- COG CLASS ---
+
+class EvidenceStore(commands.Cog):
+    """Arsip lampiran pesan yang dimoderasi, disimpan sekali per isi file (sha256)."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.index = EvidenceIndex()
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._workers: typing.List[asyncio.Task] = []
+        self._annotations: typing.Set[asyncio.Task] = set()
+        self.stats = {"downloaded": 0, "duplicates": 0, "failed": 0, "dropped": 0, "too_large": 0, "evicted": 0, "late": 0}
+
+    async def cog_load(self):
+        # satu session (connection pool) dipakai bersama oleh semua worker
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=DOWNLOAD_WORKERS),
+            timeout=aiohttp.ClientTimeout(total=DOWNLOAD_TIMEOUT_SECONDS)
+        )
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(DOWNLOAD_WORKERS)]
+        self.evict_task.start()
+
+    async def cog_unload(self):
+        self.evict_task.cancel()
+        for task in self._workers + list(self._annotations):
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._annotations, return_exceptions=True)
+        while not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_result(None)
+        if self._session:
+            await self._session.close()
+        self.index.close()
+
+    def archive(self, message: discord.Message) -> typing.List[asyncio.Future]:
+        """Mengantrekan semua lampiran pesan. Tiap future berisi EvidenceItem atau None bila gagal."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for attachment in message.attachments:
+            future = loop.create_future()
+            if attachment.size > MAX_ATTACHMENT_BYTES:
+                self.stats["too_large"] += 1
+                future.set_result(None)
+            else:
+                try:
+                    self._queue.put_nowait((message.guild.id, message.id, attachment, future))
+                except asyncio.QueueFull:
+                    self.stats["dropped"] += 1
+                    future.set_result(None)
+            futures.append(future)
+        return futures
+
+    async def settle(self, futures: typing.List[asyncio.Future], timeout: float = ARCHIVE_WAIT_SECONDS) -> bool:
+        """Menunggu unduhan lampiran (maks `timeout`). True bila semua lampiran sudah tersimpan."""
+        if not futures:
+            return True
+        done, pending = await asyncio.wait(futures, timeout=timeout)
+        if pending:
+            self.stats["late"] += 1
+        return not pending and all(f.result() is not None for f in done)
+
+    async def _worker(self):
+        while True:
+            guild_id, message_id, attachment, future = await self._queue.get()
+            try:
+                item = await self._download(guild_id, message_id, attachment)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.set_result(None)
+                raise
+            except Exception as e:
+                self.stats["failed"] += 1
+                print(f"ERROR: Gagal mengarsipkan lampiran {attachment.filename} ({message_id}): {e}")
+                item = None
+            if not future.done():
+                future.set_result(item)
+
+    async def _download(self, guild_id: int, message_id: int, attachment: discord.Attachment) -> EvidenceItem:
+        async with self._session.get(attachment.url) as resp:
+            resp.raise_for_status()
+            if (resp.content_length or 0) > MAX_ATTACHMENT_BYTES:
+                raise ValueError(f"ukuran {resp.content_length} byte melebihi batas")
+            data = await resp.content.read(MAX_ATTACHMENT_BYTES + 1)
+        if len(data) > MAX_ATTACHMENT_BYTES:
+            raise ValueError("ukuran melebihi batas")
+        sha256 = await asyncio.to_thread(write_blob, data)
+        duplicate = await asyncio.to_thread(
+            self.index.record, sha256, len(data), attachment.content_type, attachment.id, message_id, guild_id, attachment.filename
+        )
+        self.stats["duplicates" if duplicate else "downloaded"] += 1
+        return EvidenceItem(attachment.filename, sha256, len(data), duplicate)
+
+    def annotate_log(self, log_message: typing.Optional[discord.Message], embed: discord.Embed, futures: typing.List[asyncio.Future]):
+        """Setelah arsip selesai, tambahkan daftar hash lampiran ke embed log yang sudah terkirim."""
+        if log_message is None or not futures:
+            return
+        task = asyncio.create_task(self._annotate(log_message, embed, futures))
+        self._annotations.add(task)
+        task.add_done_callback(self._annotations.discard)
+
+    async def _annotate(self, log_message: discord.Message, embed: discord.Embed, futures: typing.List[asyncio.Future]):
+        items = await asyncio.gather(*futures)
+        lines = []
+        for item in items:
+            if item is None:
+                lines.append("⚠️ gagal diarsipkan")
+                continue
+            note = " (duplikat)" if item.duplicate else ""
+            lines.append(f"`{item.filename}` • {format_size(item.size)} • `{item.sha256[:HASH_PREFIX]}`{note}")
+        value = "\n".join(lines)
+        embed.add_field(name="📎 Arsip Lampiran", value=value if len(value) <= 1024 else value[:1023] + "…", inline=False)
+        try:
+            await dispatch(
+                self.bot, LOGGING, route("message.edit", log_message.channel.id), log_message.guild.id,
+                lambda: log_message.edit(embed=embed)
+            )
+        except Exception as e:
+            print(f"ERROR: Gagal memperbarui log arsip lampiran: {e}")
+
+    # --- BACKGROUND TASK: Eviction ---
+    @tasks.loop(minutes=EVICT_MINUTES)
+    async def evict_task(self):
+        try:
+            victims = await asyncio.to_thread(self.index.evict, EVIDENCE_MAX_BYTES, EVIDENCE_MAX_AGE_DAYS * 86400)
+            if victims:
+                await asyncio.to_thread(remove_blobs, victims)
+                self.stats["evicted"] += len(victims)
+        except Exception as e:
+            print(f"ERROR: Gagal menjalankan eviction arsip lampiran: {e}")
+
+    # --- COMMAND: /evidence ---
+    @app_commands.command(name="evidence", description="Ambil file lampiran yang diarsipkan berdasarkan hash")
+    @app_commands.describe(sha256="Hash (atau prefix minimal 8 karakter) dari log")
+    @app_commands.default_permissions(manage_messages=True)
+    async def evidence(self, interaction: discord.Interaction, sha256: str):
+        prefix = sha256.strip().lower()
+        if len(prefix) < MIN_LOOKUP_PREFIX or any(c not in "0123456789abcdef" for c in prefix):
+            await interaction.response.send_message(f"Hash tidak valid (minimal {MIN_LOOKUP_PREFIX} karakter hex).", ephemeral=True)
+            return
+        rows = await asyncio.to_thread(self.index.lookup, interaction.guild_id, prefix)
+        if not rows:
+            await interaction.response.send_message("File tidak ditemukan atau sudah dihapus dari arsip.", ephemeral=True)
+            return
+        if len(rows) > 1:
+            await interaction.response.send_message("Prefix cocok dengan lebih dari satu file, gunakan hash lebih panjang.", ephemeral=True)
+            return
+        full, size, _, filename = rows[0]
+        path = blob_path(full)
+        if not os.path.exists(path):
+            await interaction.response.send_message("File tidak ditemukan atau sudah dihapus dari arsip.", ephemeral=True)
+            return
+        await asyncio.to_thread(self.index.touch, full)
+        await interaction.response.send_message(
+            f"`{full}` • {format_size(size)}", file=discord.File(path, filename=filename), ephemeral=True
+        )
+
+    # --- COMMAND: /evidencestats ---
+    @app_commands.command(name="evidencestats", description="Statistik arsip lampiran dan rasio deduplikasi")
+    @app_commands.default_permissions(administrator=True)
+    async def evidencestats(self, interaction: discord.Interaction):
+        g_refs, g_logical, g_blobs, g_stored = await asyncio.to_thread(self.index.stats, interaction.guild_id)
+        refs, logical, blobs, stored = await asyncio.to_thread(self.index.stats)
+
+        def describe(refs: int, logical: int, blobs: int, stored: int) -> str:
+            ratio = logical / stored if stored else 1.0
+            return (
+                f"{refs} lampiran ({format_size(logical)}) → {blobs} file unik ({format_size(stored)})\n"
+                f"Rasio dedup: **{ratio:.2f}x**"
+            )
+
+        embed = discord.Embed(title="📎 Arsip Lampiran", color=discord.Color.blurple())
+        embed.add_field(name="Server ini", value=describe(g_refs, g_logical, g_blobs, g_stored), inline=False)
+        embed.add_field(
+            name="Total",
+            value=describe(refs, logical, blobs, stored) + f"\nBatas: {format_size(stored)} / {format_size(EVIDENCE_MAX_BYTES)} • {EVIDENCE_MAX_AGE_DAYS} hari",
+            inline=False
+        )
+        s = self.stats
+        embed.add_field(
+            name="Sejak start",
+            value=(
+                f"Baru: {s['downloaded']} • Duplikat: {s['duplicates']} • Gagal: {s['failed']}\n"
+                f"Antrean penuh: {s['dropped']} • Terlalu besar: {s['too_large']} • Lewat batas tunggu: {s['late']}\n"
+                f"Dihapus (eviction): {s['evicted']} • "
+                f"Antrean: {self._queue.qsize()} / {QUEUE_SIZE}"
+            ),
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(EvidenceStore(bot))
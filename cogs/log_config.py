@@ -2,6 +2,7 @@
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
+from .outbound import CLEANUP, dispatch, route
 import json
 import datetime
 import os
@@ -10,6 +11,9 @@ import pytz
 
 CONFIG_FILE = "config.json"
 LOG_EXPIRY_DAYS = 7
+# Bulk delete Discord hanya menerima pesan berumur < 14 hari (dengan sedikit margin).
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14) - datetime.timedelta(minutes=5)
+PURGE_BATCH_SIZE = 100
 
 # --- HELPER FUNCTIONS (JSON) ---
 
@@ -97,11 +101,8 @@ class LogConfig(commands.Cog):
 
             if log_channel and isinstance(log_channel, discord.TextChannel):
                 try:
-                    deleted = await log_channel.purge(
-                        before=seven_days_ago,
-                        limit=None
-                    )
-                    print(f"[{guild.name}] Berhasil menghapus {len(deleted)} pesan log lama.")
+                    deleted = await self._purge_old_logs(log_channel, seven_days_ago)
+                    print(f"[{guild.name}] Berhasil menghapus {deleted} pesan log lama.")
                     
                 except discord.Forbidden:
                     print(f"ERROR: Bot tidak memiliki izin Manage Messages di log channel {log_channel.name} ({guild.name}).")
@@ -110,6 +111,38 @@ class LogConfig(commands.Cog):
 
         print("Tugas pembersihan log selesai.")
 
+    async def _purge_old_logs(self, log_channel: discord.TextChannel, before: datetime.datetime) -> int:
+        """Menghapus pesan lama per batch; tiap batch adalah job CLEANUP tersendiri agar enforcement tetap didahulukan."""
+        key = route("message.delete", log_channel.id)
+        guild_id = log_channel.guild.id
+        bulk_cutoff = datetime.datetime.now(pytz.utc) - BULK_DELETE_MAX_AGE
+        batch = []
+        deleted = 0
+
+        async def flush():
+            nonlocal batch, deleted
+            if not batch:
+                return
+            messages, batch = batch, []
+            await dispatch(self.bot, CLEANUP, key, guild_id, lambda: log_channel.delete_messages(messages))
+            deleted += len(messages)
+
+        async for message in log_channel.history(limit=None, before=before):
+            if message.created_at > bulk_cutoff:
+                batch.append(message)
+                if len(batch) >= PURGE_BATCH_SIZE:
+                    await flush()
+                continue
+            # terlalu tua untuk bulk delete: satu per satu
+            await flush()
+            try:
+                await dispatch(self.bot, CLEANUP, key, guild_id, message.delete)
+                deleted += 1
+            except discord.NotFound:
+                pass
+        await flush()
+        return deleted
+
     @log_cleanup_task.before_loop
     async def before_log_cleanup_task(self):
         print("Menunggu bot siap untuk memulai tugas pembersihan log...")
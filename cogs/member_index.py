@@ -0,0 +1,411 @@
+# cogs/member_index.py
+import discord
+from discord.ext import commands
+from .voice_timers import parse_duration
+import collections
+import fnmatch
+import re
+import time
+import typing
+
+
+SELECTOR_CACHE_SIZE = 256
+
+_TOKEN_RE = re.compile(r'\s*(?:(\()|(\))|((?:[^\s()"]|"(?:[^"\\]|\\.)*")+))')
+_ID_RE = re.compile(r"^<(?:@[!&]?|#)(\d+)>$|^(\d+)$")
+_TIME_ATOM_RE = re.compile(r"^(joined|voice)([<>])(.+)$")
+
+# predicate(member, channel_id, voice_since, now) -> bool
+Predicate = typing.Callable[[discord.Member, typing.Optional[int], typing.Optional[float], float], bool]
+
+class SelectorError(ValueError):
+    pass
+
+# --- HELPER FUNCTIONS (SELECTOR) ---
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    return value.replace('"', "")
+
+def _parse_id(value: str) -> typing.Optional[int]:
+    m = _ID_RE.match(value.strip())
+    if not m:
+        return None
+    return int(m.group(1) or m.group(2))
+
+def _tokenize(expr: str) -> typing.List[str]:
+    tokens = []
+    pos = 0
+    expr = expr.strip()
+    while pos < len(expr):
+        m = _TOKEN_RE.match(expr, pos)
+        if not m or m.end() == pos:
+            raise SelectorError(f"Karakter tidak dikenal di posisi {pos + 1}.")
+        tokens.append(m.group(1) or m.group(2) or m.group(3))
+        pos = m.end()
+    return tokens
+
+class Selector:
+    """Ekspresi selector yang sudah dikompilasi menjadi satu predicate."""
+
+    __slots__ = ("source", "predicate", "channels")
+
+    def __init__(self, source: str, predicate: Predicate, channels: typing.Optional[typing.FrozenSet[int]]):
+        self.source = source
+        self.predicate = predicate
+        # bila tidak None, hanya member di channel ini yang perlu dievaluasi
+        self.channels = channels
+
+class _Parser:
+    """Recursive descent: or < and (eksplisit atau implisit) < not < atom/kurung."""
+
+    def __init__(self, tokens: typing.List[str], guild: discord.Guild):
+        self.tokens = tokens
+        self.pos = 0
+        self.guild = guild
+
+    def _peek(self) -> typing.Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise SelectorError("Ekspresi berakhir terlalu cepat.")
+        self.pos += 1
+        return token
+
+    def parse(self) -> typing.Tuple[Predicate, typing.Optional[typing.FrozenSet[int]]]:
+        if not self.tokens:
+            raise SelectorError("Selector kosong.")
+        result = self._or()
+        if self._peek() is not None:
+            raise SelectorError(f"Token tidak terduga: `{self._peek()}`")
+        return result
+
+    def _or(self):
+        parts = [self._and()]
+        while (self._peek() or "").lower() == "or":
+            self._next()
+            parts.append(self._and())
+        if len(parts) == 1:
+            return parts[0]
+        preds = [p for p, _ in parts]
+        channels = None
+        if all(c is not None for _, c in parts):
+            channels = frozenset().union(*(c for _, c in parts))
+        return (lambda m, ch, since, now: any(p(m, ch, since, now) for p in preds)), channels
+
+    def _and(self):
+        parts = [self._not()]
+        while True:
+            token = self._peek()
+            if token is None or token == ")" or token.lower() == "or":
+                break
+            if token.lower() == "and":
+                self._next()
+            parts.append(self._not())
+        if len(parts) == 1:
+            return parts[0]
+        preds = [p for p, _ in parts]
+        narrowed = [c for _, c in parts if c is not None]
+        channels = frozenset.intersection(*narrowed) if narrowed else None
+        return (lambda m, ch, since, now: all(p(m, ch, since, now) for p in preds)), channels
+
+    def _not(self):
+        token = self._peek()
+        if token is not None and token.lower() == "not":
+            self._next()
+            pred, _ = self._not()
+            return (lambda m, ch, since, now: not pred(m, ch, since, now)), None
+        if token == "(":
+            self._next()
+            result = self._or()
+            if self._next() != ")":
+                raise SelectorError("Kurung tidak ditutup.")
+            return result
+        if token == ")":
+            raise SelectorError("Kurung tutup tanpa pasangan.")
+        return self._atom(self._next())
+
+    def _atom(self, token: str):
+        lowered = token.lower()
+        if lowered == "bot":
+            return (lambda m, ch, since, now: m.bot), None
+
+        key, sep, raw = token.partition(":")
+        if sep and key.lower() == "role":
+            role = self._resolve_role(_unquote(raw))
+            role_id = role.id
+            return (lambda m, ch, since, now: m.get_role(role_id) is not None), None
+        if sep and key.lower() == "channel":
+            channel = self._resolve_channel(_unquote(raw))
+            channel_id = channel.id
+            return (lambda m, ch, since, now: ch == channel_id), frozenset((channel_id,))
+        if sep and key.lower() == "user":
+            user_id = _parse_id(_unquote(raw))
+            if user_id is None:
+                raise SelectorError(f"User tidak valid: `{raw}`")
+            return (lambda m, ch, since, now: m.id == user_id), None
+
+        key, sep, raw = token.partition("~")
+        if sep and key.lower() == "name":
+            # glob (`mod*`, `*bot?`), bukan regex user: aman dievaluasi per ketikan autocomplete
+            source = _unquote(raw)
+            if not source:
+                raise SelectorError("Pola nama kosong.")
+            if not any(c in source for c in "*?["):
+                source = f"*{source}*"
+            pattern = re.compile(fnmatch.translate(source), re.IGNORECASE)
+            return (lambda m, ch, since, now: bool(
+                pattern.match(m.display_name) or pattern.match(m.name)
+            )), None
+
+        m = _TIME_ATOM_RE.match(token)
+        if m:
+            field, op, raw = m.group(1).lower(), m.group(2), m.group(3)
+            delta = parse_duration(raw)
+            if delta is None:
+                raise SelectorError(f"Durasi tidak valid: `{raw}`")
+            seconds = delta.total_seconds()
+            if field == "joined":
+                def joined_ts(member):
+                    return member.joined_at.timestamp() if member.joined_at else None
+                if op == "<":
+                    return (lambda mb, ch, since, now: (joined_ts(mb) or 0) > now - seconds), None
+                return (lambda mb, ch, since, now: (joined_ts(mb) or now) <= now - seconds), None
+            if op == "<":
+                return (lambda mb, ch, since, now: since is not None and since > now - seconds), None
+            return (lambda mb, ch, since, now: since is None or since <= now - seconds), None
+
+        user_id = _parse_id(token)
+        if user_id is not None:
+            return (lambda mb, ch, since, now: mb.id == user_id), None
+        raise SelectorError(f"Atom tidak dikenal: `{token}`")
+
+    def _resolve_role(self, value: str) -> discord.Role:
+        role_id = _parse_id(value)
+        role = self.guild.get_role(role_id) if role_id else discord.utils.find(
+            lambda r: r.name.lower() == value.lower().lstrip("@"), self.guild.roles
+        )
+        if not role:
+            raise SelectorError(f"Role tidak ditemukan: `{value}`")
+        return role
+
+    def _resolve_channel(self, value: str) -> discord.abc.GuildChannel:
+        channel_id = _parse_id(value)
+        channel = self.guild.get_channel(channel_id) if channel_id else discord.utils.find(
+            lambda c: c.name.lower() == value.lower(), self.guild.voice_channels
+        )
+        if not isinstance(channel, (discord.VoiceChannel, discord.StageChannel)):
+            raise SelectorError(f"Voice channel tidak ditemukan: `{value}`")
+        return channel
+
+def member_label(m: discord.Member) -> str:
+    """Label member untuk autocomplete: nama tampilan — username."""
+    disc = getattr(m, "discriminator", None)
+    uname = f"{m.name}#{disc}" if disc is not None else m.name
+    return f"{m.display_name} — {uname}"
+
+def compile_selector(expr: str, guild: discord.Guild) -> Selector:
+    """Mengompilasi ekspresi seperti `role:@Raiders and joined<10m and not name~mod*` untuk guild tertentu."""
+    predicate, channels = _Parser(_tokenize(expr), guild).parse()
+    return Selector(expr, predicate, channels)
+
+# --- COG CLASS ---
+
+class MemberIndex(commands.Cog):
+    """Indeks voice state (member -> channel, sejak kapan) per guild untuk evaluasi selector."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        # guild_id -> member_id -> (channel_id, voice_since | None)
+        self._voice: typing.Dict[int, typing.Dict[int, typing.Tuple[int, typing.Optional[float]]]] = {}
+        # guild_id -> channel_id -> set(member_id)
+        self._channels: typing.Dict[int, typing.Dict[int, typing.Set[int]]] = {}
+        self._compiled: typing.OrderedDict[typing.Tuple[int, str], Selector] = collections.OrderedDict()
+        # guild_id -> member_id -> (channel_id, label, mute, deaf) dari warm cache, dipakai autocomplete
+        # sampai guild selesai di-chunk
+        self._warm_members: typing.Dict[int, typing.Dict[int, typing.Tuple[int, str, bool, bool]]] = {}
+
+    def cog_unload(self):
+        # warm cache mungkin di-unload setelah cog ini; simpan state selagi masih ada
+        warm_cache = self.bot.get_cog("WarmCache")
+        if warm_cache:
+            warm_cache.capture(self)
+
+    def _ensure_guild(self, guild: discord.Guild):
+        if guild.id in self._voice:
+            return
+        voice: typing.Dict[int, typing.Tuple[int, typing.Optional[float]]] = {}
+        channels: typing.Dict[int, typing.Set[int]] = {}
+        for channel in [*guild.voice_channels, *guild.stage_channels]:
+            for member in channel.members:
+                voice[member.id] = (channel.id, None)
+                channels.setdefault(channel.id, set()).add(member.id)
+        self._voice[guild.id] = voice
+        self._channels[guild.id] = channels
+
+        warm_cache = self.bot.get_cog("WarmCache")
+        warm = warm_cache.claim(guild.id) if warm_cache else None
+        if warm is None:
+            return
+        # hanya entri yang cocok dengan voice state live yang dipakai
+        for member_id, channel_id, since in warm.voice:
+            current = voice.get(member_id)
+            if current is not None and current[0] == channel_id and since is not None:
+                voice[member_id] = (channel_id, since)
+        if not guild.chunked and warm.members:
+            warm_channels = {member_id: channel_id for member_id, channel_id, _ in warm.voice}
+            members = {}
+            for member_id, label, mute, deaf in warm.members:
+                channel_id = voice[member_id][0] if member_id in voice else warm_channels.get(member_id)
+                if channel_id is not None and guild.get_channel(channel_id) is not None:
+                    members[member_id] = (channel_id, label, mute, deaf)
+            self._warm_members[guild.id] = members
+        for expr in warm.selectors:
+            try:
+                self.compile(guild, expr)
+            except SelectorError:
+                pass
+
+    def indexed_guilds(self) -> typing.List[int]:
+        return list(self._voice)
+
+    def export(self, guild_id: int) -> typing.Tuple[
+        typing.List[typing.Tuple[int, int, typing.Optional[float]]],
+        typing.List[str],
+        typing.List[typing.Tuple[int, str, bool, bool]]
+    ]:
+        """State indeks untuk warm cache: (voice state, sumber selector yang baru dipakai, label member voice)."""
+        voice_map = self._voice.get(guild_id, {})
+        voice = [(mid, cid, since) for mid, (cid, since) in voice_map.items()]
+        selectors = [expr for gid, expr in self._compiled if gid == guild_id]
+        guild = self.bot.get_guild(guild_id)
+        warm = self._warm_members.get(guild_id, {})
+        members = []
+        for mid in voice_map:
+            member = guild.get_member(mid) if guild else None
+            if member is not None and member.voice:
+                members.append((mid, member_label(member), bool(member.voice.mute), bool(member.voice.deaf)))
+            elif mid in warm:
+                _, label, mute, deaf = warm[mid]
+                members.append((mid, label, mute, deaf))
+        # entri warm yang belum terlihat live (guild belum di-chunk) ikut dibawa ke snapshot berikutnya
+        for mid, (cid, label, mute, deaf) in warm.items():
+            if mid not in voice_map:
+                voice.append((mid, cid, None))
+                members.append((mid, label, mute, deaf))
+        return voice, selectors, members
+
+    def warm_voice_members(self, guild: discord.Guild) -> typing.Optional[typing.List[typing.Tuple[int, int, str, bool, bool]]]:
+        """(member_id, channel_id, label, mute, deaf) member voice selama guild belum selesai di-chunk.
+
+        None bila guild sudah di-chunk atau tidak ada warm snapshot; pemanggil memakai guild.members.
+        """
+        if guild.chunked:
+            self._warm_members.pop(guild.id, None)
+            return None
+        self._ensure_guild(guild)
+        warm = self._warm_members.get(guild.id)
+        if not warm:
+            return None
+        result = [(mid, cid, label, mute, deaf) for mid, (cid, label, mute, deaf) in warm.items()]
+        # member yang masuk voice setelah restart sudah ada di cache discord.py
+        for mid, (cid, _) in self._voice[guild.id].items():
+            if mid in warm:
+                continue
+            member = guild.get_member(mid)
+            if member is not None and member.voice:
+                result.append((mid, cid, member_label(member), bool(member.voice.mute), bool(member.voice.deaf)))
+        return result
+
+    def compile(self, guild: discord.Guild, expr: str) -> Selector:
+        key = (guild.id, expr.strip())
+        selector = self._compiled.get(key)
+        if selector is not None:
+            self._compiled.move_to_end(key)
+            return selector
+        selector = compile_selector(expr, guild)
+        self._compiled[key] = selector
+        if len(self._compiled) > SELECTOR_CACHE_SIZE:
+            self._compiled.popitem(last=False)
+        return selector
+
+    def select(self, guild: discord.Guild, expr: str) -> typing.List[discord.Member]:
+        """Mengembalikan member di voice yang cocok dengan selector. Raise SelectorError bila ekspresi tidak valid."""
+        return self._match(guild, self.compile(guild, expr))
+
+    def preview(self, guild: discord.Guild, expr: str) -> int:
+        """Jumlah member yang cocok, tanpa menyimpan hasil kompilasi ke LRU (untuk autocomplete per ketikan)."""
+        return len(self._match(guild, compile_selector(expr, guild)))
+
+    def _match(self, guild: discord.Guild, selector: Selector) -> typing.List[discord.Member]:
+        self._ensure_guild(guild)
+        voice = self._voice[guild.id]
+        if selector.channels is not None:
+            channels = self._channels[guild.id]
+            candidates = [mid for cid in selector.channels for mid in channels.get(cid, ())]
+        else:
+            candidates = list(voice)
+        now = time.time()
+        matched = []
+        for member_id in candidates:
+            member = guild.get_member(member_id)
+            if member is None:
+                continue
+            channel_id, since = voice[member_id]
+            if selector.predicate(member, channel_id, since, now):
+                matched.append(member)
+        return matched
+
+    # --- LISTENERS: pemeliharaan indeks ---
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        guild_id = member.guild.id
+        if guild_id not in self._voice:
+            return
+        voice = self._voice[guild_id]
+        channels = self._channels[guild_id]
+        before_id = before.channel.id if before.channel else None
+        after_id = after.channel.id if after.channel else None
+        warm = self._warm_members.get(guild_id)
+        if warm is not None and member.id in warm:
+            if after_id is None:
+                del warm[member.id]
+            else:
+                warm[member.id] = (after_id, member_label(member), bool(after.mute), bool(after.deaf))
+        if before_id == after_id:
+            return
+        if before_id is not None:
+            members = channels.get(before_id)
+            if members is not None:
+                members.discard(member.id)
+                if not members:
+                    del channels[before_id]
+        if after_id is None:
+            voice.pop(member.id, None)
+            return
+        channels.setdefault(after_id, set()).add(member.id)
+        previous = voice.get(member.id)
+        # "voice since" dihitung sejak masuk voice, bukan sejak pindah channel
+        since = previous[1] if previous and before_id is not None else time.time()
+        voice[member.id] = (after_id, since)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild):
+        # setelah reconnect, cache voice discord.py dibangun ulang; indeks menyusul secara lazy
+        self._voice.pop(guild.id, None)
+        self._channels.pop(guild.id, None)
+        self._warm_members.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._voice.pop(guild.id, None)
+        self._channels.pop(guild.id, None)
+        self._warm_members.pop(guild.id, None)
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(MemberIndex(bot))
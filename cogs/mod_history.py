@@ -0,0 +1,151 @@
+# cogs/mod_history.py
+import discord
+from discord import app_commands
+from discord.ext import commands
+from .pagination import ResultPaginator
+from .sqlite_store import BatchWriter, SQLiteStore
+import asyncio
+import datetime
+import typing
+
+
+HISTORY_DB_FILE = "history.db"
+WRITE_BATCH_SIZE = 1000
+PAGE_SIZE = 10
+
+ACTION_LABELS = {
+    "mute": "🔇 Mute",
+    "unmute": "🔊 Unmute",
+    "deafen": "🔕 Deafen",
+    "undeafen": "🔔 Undeafen",
+    "move": "🚚 Move",
+    "disconnect": "🔌 Disconnect",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mod_actions (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id   INTEGER NOT NULL,
+    actor_id   INTEGER NOT NULL,
+    target_id  INTEGER NOT NULL,
+    action     TEXT NOT NULL,
+    channel_id INTEGER,
+    reason     TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_actions_guild_target ON mod_actions (guild_id, target_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_actions_guild_actor ON mod_actions (guild_id, actor_id, created_at);
+CREATE TRIGGER IF NOT EXISTS mod_actions_no_update BEFORE UPDATE ON mod_actions BEGIN
+    SELECT RAISE(ABORT, 'mod_actions is append-only');
+END;
+CREATE TRIGGER IF NOT EXISTS mod_actions_no_delete BEFORE DELETE ON mod_actions BEGIN
+    SELECT RAISE(ABORT, 'mod_actions is append-only');
+END;
+"""
+
+# --- HELPER FUNCTIONS (SQLITE) ---
+
+class ActionJournal(SQLiteStore):
+    """Jurnal append-only untuk aksi moderasi, diindeks per guild+target dan guild+actor."""
+
+    def __init__(self, path: str = HISTORY_DB_FILE):
+        super().__init__(path, _SCHEMA)
+
+    def append_many(self, rows: typing.List[tuple]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO mod_actions (guild_id, actor_id, target_id, action, channel_id, reason, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def query(self, guild_id: int, user_id: int, as_actor: bool, offset: int, limit: int) -> typing.Tuple[int, typing.List[tuple]]:
+        column = "actor_id" if as_actor else "target_id"
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT count(*) FROM mod_actions WHERE guild_id = ? AND {column} = ?",
+                (guild_id, user_id)
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT actor_id, target_id, action, channel_id, reason, created_at FROM mod_actions "
+                f"WHERE guild_id = ? AND {column} = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                (guild_id, user_id, limit, offset)
+            ).fetchall()
+        return total, rows
+
+# --- COG CLASS ---
+
+class ModHistory(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.journal = ActionJournal()
+        self.writer = BatchWriter(self.journal.append_many, WRITE_BATCH_SIZE, 2, "menulis jurnal moderasi")
+        self.writer.start()
+
+    def cog_unload(self):
+        self.writer.close()
+        self.journal.close()
+
+    def record(
+        self,
+        guild_id: int,
+        actor_id: int,
+        target_id: int,
+        action: str,
+        channel_id: typing.Optional[int] = None,
+        reason: typing.Optional[str] = None
+    ):
+        """Mencatat satu aksi ke antrean jurnal. Ditulis oleh writer di background."""
+        now = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        self.writer.append((guild_id, actor_id, target_id, action, channel_id, reason, now))
+
+    # --- COMMAND: /history ---
+    @app_commands.command(name="history", description="Riwayat aksi moderasi voice untuk user")
+    @app_commands.describe(user="User yang ingin dilihat", role="Lihat sebagai target (default) atau sebagai moderator")
+    @app_commands.choices(role=[
+        app_commands.Choice(name="Target", value="target"),
+        app_commands.Choice(name="Moderator", value="actor"),
+    ])
+    @app_commands.default_permissions(moderate_members=True)
+    async def history(self, interaction: discord.Interaction, user: discord.User, role: typing.Optional[app_commands.Choice[str]] = None):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        await self.writer.flush()
+
+        guild_id = interaction.guild_id
+        as_actor = bool(role and role.value == "actor")
+        total, first_rows = await asyncio.to_thread(self.journal.query, guild_id, user.id, as_actor, 0, PAGE_SIZE)
+        if total == 0:
+            await interaction.followup.send(f"Belum ada riwayat moderasi untuk {user.mention}.", ephemeral=True)
+            return
+
+        total_pages = (total + PAGE_SIZE - 1) // PAGE_SIZE
+
+        async def render(page: int) -> discord.Embed:
+            if page == 0:
+                rows = first_rows
+            else:
+                _, rows = await asyncio.to_thread(self.journal.query, guild_id, user.id, as_actor, page * PAGE_SIZE, PAGE_SIZE)
+            lines = []
+            for actor_id, target_id, action, channel_id, reason, created_at in rows:
+                who = f"→ <@{target_id}>" if as_actor else f"oleh <@{actor_id}>"
+                line = f"<t:{int(created_at)}:f> **{ACTION_LABELS.get(action, action)}** {who}"
+                if channel_id:
+                    line += f" di <#{channel_id}>"
+                if reason:
+                    line += f"\n↳ {reason}"
+                lines.append(line)
+            embed = discord.Embed(
+                title=f"📜 Riwayat {'Aksi oleh' if as_actor else 'Moderasi'} {user} ({total})",
+                description="\n".join(lines)[:4096],
+                color=discord.Color.blurple()
+            )
+            embed.set_footer(text=f"Halaman {page + 1}/{total_pages}")
+            return embed
+
+        view = ResultPaginator(interaction.user.id, total_pages, render)
+        await interaction.followup.send(embed=await render(0), view=view, ephemeral=True)
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ModHistory(bot))
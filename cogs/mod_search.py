@@ -0,0 +1,185 @@
+# cogs/mod_search.py
+import discord
+from discord import app_commands
+from discord.ext import commands
+from .pagination import ResultPaginator
+from .sqlite_store import BatchWriter, SQLiteStore
+import asyncio
+import datetime
+import typing
+
+
+SEARCH_DB_FILE = "modsearch.db"
+INDEX_BATCH_SIZE = 500
+PAGE_SIZE = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deleted_messages (
+    message_id   INTEGER PRIMARY KEY,
+    guild_id     INTEGER NOT NULL,
+    channel_id   INTEGER NOT NULL,
+    author_id    INTEGER NOT NULL,
+    author_name  TEXT NOT NULL,
+    moderator_id INTEGER,
+    content      TEXT NOT NULL,
+    attachments  TEXT NOT NULL,
+    reason       TEXT,
+    created_at   REAL NOT NULL,
+    deleted_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_deleted_guild_time ON deleted_messages (guild_id, deleted_at);
+CREATE INDEX IF NOT EXISTS idx_deleted_guild_author ON deleted_messages (guild_id, author_id, deleted_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS deleted_messages_fts USING fts5(
+    content, author_name, reason, attachments,
+    content='deleted_messages', content_rowid='message_id'
+);
+CREATE TRIGGER IF NOT EXISTS deleted_messages_ai AFTER INSERT ON deleted_messages BEGIN
+    INSERT INTO deleted_messages_fts (rowid, content, author_name, reason, attachments)
+    VALUES (new.message_id, new.content, new.author_name, coalesce(new.reason, ''), new.attachments);
+END;
+"""
+
+# --- HELPER FUNCTIONS (SQLITE) ---
+
+def _fts_query(text: str) -> str:
+    """Mengubah input bebas menjadi query FTS5 yang aman (tiap kata dijadikan frasa)."""
+    terms = [t.replace('"', '""') for t in text.split() if t.strip()]
+    return " ".join(f'"{t}"' for t in terms)
+
+class DeletedMessageIndex(SQLiteStore):
+    """Arsip pesan terhapus di SQLite dengan indeks full-text FTS5."""
+
+    def __init__(self, path: str = SEARCH_DB_FILE):
+        super().__init__(path, _SCHEMA)
+
+    def insert_many(self, rows: typing.List[tuple]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO deleted_messages "
+                "(message_id, guild_id, channel_id, author_id, author_name, moderator_id, content, attachments, reason, created_at, deleted_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def search(
+        self,
+        guild_id: int,
+        query: typing.Optional[str],
+        author_id: typing.Optional[int],
+        since: typing.Optional[float],
+        offset: int,
+        limit: int
+    ) -> typing.Tuple[int, typing.List[tuple]]:
+        joins = ""
+        where = ["d.guild_id = ?"]
+        params: list = [guild_id]
+        snippet = "substr(d.content, 1, 200)"
+        if query and _fts_query(query):
+            joins = " JOIN deleted_messages_fts ON deleted_messages_fts.rowid = d.message_id"
+            where.append("deleted_messages_fts MATCH ?")
+            params.append(_fts_query(query))
+            snippet = "snippet(deleted_messages_fts, 0, '**', '**', '…', 24)"
+        if author_id:
+            where.append("d.author_id = ?")
+            params.append(author_id)
+        if since:
+            where.append("d.deleted_at >= ?")
+            params.append(since)
+        clause = f"FROM deleted_messages d{joins} WHERE " + " AND ".join(where)
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT count(*) {clause}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT d.message_id, d.channel_id, d.author_id, d.author_name, d.moderator_id, "
+                f"{snippet}, d.attachments, d.reason, d.deleted_at {clause} "
+                f"ORDER BY d.deleted_at DESC LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+        return total, rows
+
+# --- COG CLASS ---
+
+class ModSearch(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.index = DeletedMessageIndex()
+        self.writer = BatchWriter(self.index.insert_many, INDEX_BATCH_SIZE, 5, "mengindeks pesan terhapus")
+        self.writer.start()
+
+    def cog_unload(self):
+        self.writer.close()
+        self.index.close()
+
+    def queue_deleted_message(self, moderator: discord.abc.User, target_msg: discord.Message, reason: typing.Optional[str]):
+        """Memasukkan pesan yang dihapus ke antrean indeks. Tidak melakukan I/O."""
+        attachments = " ".join(a.filename for a in target_msg.attachments)
+        self.writer.append((
+            target_msg.id,
+            target_msg.guild.id,
+            target_msg.channel.id,
+            target_msg.author.id,
+            str(target_msg.author),
+            moderator.id if moderator else None,
+            target_msg.content or "",
+            attachments,
+            reason,
+            target_msg.created_at.timestamp(),
+            datetime.datetime.now(datetime.timezone.utc).timestamp()
+        ))
+
+    # --- COMMAND: /modsearch ---
+    @app_commands.command(name="modsearch", description="Cari arsip pesan yang dihapus moderator")
+    @app_commands.describe(query="Kata kunci atau URL", user="Penulis pesan", days="Batasi ke N hari terakhir")
+    @app_commands.default_permissions(manage_messages=True)
+    async def modsearch(
+        self,
+        interaction: discord.Interaction,
+        query: typing.Optional[str] = None,
+        user: typing.Optional[discord.User] = None,
+        days: typing.Optional[app_commands.Range[int, 1, 365]] = None
+    ):
+        await interaction.response.defer(thinking=True, ephemeral=True)
+        await self.writer.flush()
+
+        guild_id = interaction.guild_id
+        author_id = user.id if user else None
+        since = None
+        if days:
+            since = (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=days)).timestamp()
+
+        total, first_rows = await asyncio.to_thread(self.index.search, guild_id, query, author_id, since, 0, PAGE_SIZE)
+        if total == 0:
+            await interaction.followup.send("Tidak ada pesan terhapus yang cocok.", ephemeral=True)
+            return
+
+        total_pages = (total + PAGE_SIZE - 1) // PAGE_SIZE
+
+        async def render(page: int) -> discord.Embed:
+            if page == 0:
+                rows = first_rows
+            else:
+                _, rows = await asyncio.to_thread(self.index.search, guild_id, query, author_id, since, page * PAGE_SIZE, PAGE_SIZE)
+            embed = discord.Embed(
+                title=f"🔎 Arsip Pesan Terhapus ({total} hasil)",
+                description=f"Query: `{query}`" if query else None,
+                color=discord.Color.dark_red()
+            )
+            for i, (message_id, channel_id, msg_author_id, author_name, moderator_id, snippet, attachments, reason, deleted_at) in enumerate(rows):
+                value = f"{snippet or '*(tanpa teks)*'}\n<#{channel_id}> • <t:{int(deleted_at)}:R>"
+                if moderator_id:
+                    value += f" • oleh <@{moderator_id}>"
+                if attachments:
+                    value += f"\n📎 {attachments}"
+                if reason:
+                    value += f"\nAlasan: {reason}"
+                embed.add_field(name=f"#{page * PAGE_SIZE + i + 1} {author_name} ({msg_author_id})", value=value[:1024], inline=False)
+            embed.set_footer(text=f"Halaman {page + 1}/{total_pages}")
+            return embed
+
+        view = ResultPaginator(interaction.user.id, total_pages, render)
+        await interaction.followup.send(embed=await render(0), view=view, ephemeral=True)
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ModSearch(bot))
@@ -0,0 +1,327 @@
+# cogs/outbound.py
+import discord
+from discord import app_commands
+from discord.ext import commands
+import asyncio
+import collections
+import math
+import statistics
+import typing
+
+
+# Kelas prioritas: angka kecil selalu dilayani lebih dulu.
+ENFORCEMENT = 0
+RESPONSE = 1
+LOGGING = 2
+CLEANUP = 3
+
+PRIORITY_NAMES = {
+    ENFORCEMENT: "enforcement",
+    RESPONSE: "response",
+    LOGGING: "logging",
+    CLEANUP: "cleanup",
+}
+
+WORKER_COUNT = 8
+# Batas job yang berjalan bersamaan per kelas, agar log/cleanup yang lambat tidak menahan semua worker.
+PRIORITY_CONCURRENCY = {
+    ENFORCEMENT: WORKER_COUNT,
+    RESPONSE: 4,
+    LOGGING: 2,
+    CLEANUP: 1,
+}
+
+# Token bucket per route: family -> (token per detik, kapasitas burst).
+ROUTE_LIMITS = {
+    "member.edit": (10.0, 10),
+    "message.send": (5.0, 5),
+    "message.delete": (5.0, 5),
+    "message.forward": (5.0, 5),
+}
+DEFAULT_ROUTE_LIMIT = (5.0, 5)
+MAX_IDLE_BUCKETS = 5000
+WAIT_SAMPLES = 500
+
+# --- HELPER FUNCTIONS ---
+
+def route(family: str, major_id: typing.Optional[int]) -> str:
+    """Kunci route seperti `message.send:<channel_id>`; major id mengikuti pembagian bucket Discord."""
+    return f"{family}:{major_id or 0}"
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: int, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = now
+
+    def try_acquire(self, now: float) -> float:
+        """Mengambil satu token. Mengembalikan 0 bila berhasil, atau detik tunggu sampai token tersedia."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def is_full(self, now: float) -> bool:
+        return self.tokens + (now - self.updated) * self.rate >= self.capacity
+
+class _Job:
+    __slots__ = ("priority", "route", "guild_id", "factory", "future", "enqueued_at")
+
+    def __init__(self, priority, route, guild_id, factory, future, enqueued_at):
+        self.priority = priority
+        self.route = route
+        self.guild_id = guild_id
+        self.factory = factory
+        self.future = future
+        self.enqueued_at = enqueued_at
+
+class OutboundScheduler:
+    """Antrean keluar terpusat: prioritas ketat antar kelas, round-robin antar guild, token bucket per route."""
+
+    def __init__(self, workers: int = WORKER_COUNT):
+        self._worker_count = workers
+        self._workers: typing.List[asyncio.Task] = []
+        # per prioritas: guild_id -> deque job, plus urutan giliran guild
+        self._queues: typing.List[typing.Dict[int, typing.Deque[_Job]]] = [{} for _ in PRIORITY_NAMES]
+        self._turns: typing.List[typing.Deque[int]] = [collections.deque() for _ in PRIORITY_NAMES]
+        self._running = [0 for _ in PRIORITY_NAMES]
+        self._buckets: typing.Dict[str, TokenBucket] = {}
+        self._wakeup = asyncio.Event()
+        self.submitted = [0 for _ in PRIORITY_NAMES]
+        self.completed = [0 for _ in PRIORITY_NAMES]
+        self.failed = [0 for _ in PRIORITY_NAMES]
+        self.max_depth = [0 for _ in PRIORITY_NAMES]
+        self.wait_times: typing.List[typing.Deque[float]] = [collections.deque(maxlen=WAIT_SAMPLES) for _ in PRIORITY_NAMES]
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self):
+        if self._workers:
+            return
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self._worker_count)]
+
+    async def stop(self):
+        workers, self._workers = self._workers, []
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for queues in self._queues:
+            for q in queues.values():
+                for job in q:
+                    if not job.future.done():
+                        job.future.cancel()
+            queues.clear()
+        for turns in self._turns:
+            turns.clear()
+
+    def submit(
+        self,
+        priority: int,
+        route_key: str,
+        guild_id: typing.Optional[int],
+        factory: typing.Callable[[], typing.Awaitable[typing.Any]]
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        job = _Job(priority, route_key, guild_id or 0, factory, loop.create_future(), loop.time())
+        queues = self._queues[priority]
+        q = queues.get(job.guild_id)
+        if q is None:
+            q = queues[job.guild_id] = collections.deque()
+            self._turns[priority].append(job.guild_id)
+        q.append(job)
+        self.submitted[priority] += 1
+        self.max_depth[priority] = max(self.max_depth[priority], self.depth(priority))
+        self._wakeup.set()
+        return job.future
+
+    def depth(self, priority: int) -> int:
+        return sum(len(q) for q in self._queues[priority].values())
+
+    def stats(self) -> dict:
+        """Ringkasan state scheduler untuk ditampilkan (per prioritas, worker, jumlah bucket route)."""
+        priorities = {}
+        for priority, name in PRIORITY_NAMES.items():
+            waits = sorted(self.wait_times[priority])
+            priorities[name] = {
+                "depth": self.depth(priority),
+                "max_depth": self.max_depth[priority],
+                "running": self._running[priority],
+                "concurrency": PRIORITY_CONCURRENCY[priority],
+                "completed": self.completed[priority],
+                "failed": self.failed[priority],
+                "wait_p50": statistics.median(waits) if waits else 0.0,
+                "wait_p95": waits[int(len(waits) * 0.95)] if waits else 0.0,
+            }
+        return {"priorities": priorities, "workers": self._worker_count, "buckets": len(self._buckets)}
+
+    def guild_depths(self) -> typing.Dict[int, int]:
+        depths: typing.Dict[int, int] = collections.Counter()
+        for queues in self._queues:
+            for guild_id, q in queues.items():
+                depths[guild_id] += len(q)
+        return depths
+
+    def _bucket(self, route_key: str, now: float) -> TokenBucket:
+        bucket = self._buckets.get(route_key)
+        if bucket is None:
+            if len(self._buckets) >= MAX_IDLE_BUCKETS:
+                self._buckets = {k: b for k, b in self._buckets.items() if not b.is_full(now)}
+            rate, capacity = ROUTE_LIMITS.get(route_key.split(":", 1)[0], DEFAULT_ROUTE_LIMIT)
+            bucket = self._buckets[route_key] = TokenBucket(rate, capacity, now)
+        return bucket
+
+    def _pick(self, now: float) -> typing.Tuple[typing.Optional[_Job], float]:
+        """Memilih job berikutnya. Bila tidak ada yang siap, mengembalikan waktu tunggu terpendek."""
+        min_wait = math.inf
+        for priority, queues in enumerate(self._queues):
+            if self._running[priority] >= PRIORITY_CONCURRENCY[priority]:
+                continue
+            turns = self._turns[priority]
+            attempts = len(turns)
+            while attempts > 0 and turns:
+                guild_id = turns[0]
+                q = queues[guild_id]
+                job = q[0]
+                # job yang sudah dibatalkan pemanggil dibuang tanpa memakai token
+                cancelled = job.future.done()
+                wait = 0.0 if cancelled else self._bucket(job.route, now).try_acquire(now)
+                if wait > 0.0:
+                    turns.rotate(-1)
+                    attempts -= 1
+                    min_wait = min(min_wait, wait)
+                    continue
+                q.popleft()
+                turns.popleft()
+                if q:
+                    turns.append(guild_id)
+                else:
+                    del queues[guild_id]
+                if not cancelled:
+                    return job, 0.0
+        return None, min_wait
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job, wait = self._pick(loop.time())
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=None if wait == math.inf else wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            priority = job.priority
+            self._running[priority] += 1
+            self.wait_times[priority].append(loop.time() - job.enqueued_at)
+            try:
+                result = await job.factory()
+            except asyncio.CancelledError:
+                if not job.future.done():
+                    job.future.cancel()
+                raise
+            except Exception as e:
+                self.failed[priority] += 1
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                self.completed[priority] += 1
+                if not job.future.done():
+                    job.future.set_result(result)
+            finally:
+                self._running[priority] -= 1
+                self._wakeup.set()
+
+async def dispatch(
+    bot: commands.Bot,
+    priority: int,
+    route_key: str,
+    guild_id: typing.Optional[int],
+    factory: typing.Callable[[], typing.Awaitable[typing.Any]]
+) -> typing.Any:
+    """Menjalankan panggilan API lewat scheduler Outbound. Langsung dieksekusi bila cog tidak dimuat."""
+    outbound = bot.get_cog("Outbound")
+    if outbound is None or not outbound.scheduler.running:
+        return await factory()
+    return await outbound.scheduler.submit(priority, route_key, guild_id, factory)
+
+async def gather_bounded(
+    factories: typing.Iterable[typing.Callable[[], typing.Awaitable[typing.Any]]],
+    limit: int
+) -> typing.List[typing.Any]:
+    """Menjalankan banyak coroutine dengan paling banyak `limit` sekaligus. Exception dikembalikan sebagai hasil."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(factory):
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(*(run(f) for f in factories), return_exceptions=True)
+
+async def send_message(bot: commands.Bot, priority: int, channel: discord.abc.Messageable, *args, **kwargs) -> discord.Message:
+    guild = getattr(channel, "guild", None)
+    return await dispatch(
+        bot, priority, route("message.send", getattr(channel, "id", None)), guild.id if guild else None,
+        lambda: channel.send(*args, **kwargs)
+    )
+
+async def edit_member(bot: commands.Bot, member: discord.Member, **kwargs) -> typing.Any:
+    return await dispatch(
+        bot, ENFORCEMENT, route("member.edit", member.guild.id), member.guild.id,
+        lambda: member.edit(**kwargs)
+    )
+
+async def move_member(bot: commands.Bot, member: discord.Member, channel: typing.Optional[discord.VoiceChannel], reason: typing.Optional[str] = None) -> typing.Any:
+    return await dispatch(
+        bot, ENFORCEMENT, route("member.edit", member.guild.id), member.guild.id,
+        lambda: member.move_to(channel, reason=reason)
+    )
+
+# --- COG CLASS ---
+
+class Outbound(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.scheduler = OutboundScheduler()
+
+    async def cog_load(self):
+        self.scheduler.start()
+
+    async def cog_unload(self):
+        await self.scheduler.stop()
+
+    # --- COMMAND: /queuestats ---
+    @app_commands.command(name="queuestats", description="Statistik antrean request keluar")
+    @app_commands.default_permissions(administrator=True)
+    async def queuestats(self, interaction: discord.Interaction):
+        stats = self.scheduler.stats()
+        embed = discord.Embed(title="📬 Outbound Scheduler", color=discord.Color.blurple())
+        for name, p in stats["priorities"].items():
+            embed.add_field(
+                name=name,
+                value=(
+                    f"Antrean: **{p['depth']}** (maks {p['max_depth']})\n"
+                    f"Berjalan: {p['running']}/{p['concurrency']}\n"
+                    f"Selesai: {p['completed']} • Gagal: {p['failed']}\n"
+                    f"Tunggu p50/p95: {p['wait_p50'] * 1000:.0f}/{p['wait_p95'] * 1000:.0f} ms"
+                ),
+                inline=True
+            )
+        top = sorted(self.scheduler.guild_depths().items(), key=lambda kv: kv[1], reverse=True)[:5]
+        if top:
+            embed.add_field(name="Guild teratas", value="\n".join(f"`{gid}`: {n}" for gid, n in top), inline=False)
+        embed.set_footer(text=f"Worker: {stats['workers']} • Route bucket: {stats['buckets']}")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Outbound(bot))
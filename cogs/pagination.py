@@ -0,0 +1,49 @@
+# cogs/pagination.py
+# Modul helper (tanpa setup), dipakai bersama oleh ModSearch, ModHistory, dan VoiceModeration.
+import discord
+import typing
+
+
+# --- PAGINATION VIEW ---
+
+class ResultPaginator(discord.ui.View):
+    """Tombol ◀ ▶ untuk menampilkan hasil per halaman; hanya bisa dipakai pemanggil command."""
+
+    def __init__(
+        self,
+        owner_id: int,
+        total_pages: int,
+        render: typing.Callable[[int], typing.Awaitable[discord.Embed]],
+        timeout: float = 180
+    ):
+        super().__init__(timeout=timeout)
+        self.owner_id = owner_id
+        self.total_pages = max(total_pages, 1)
+        self.render = render
+        self.page = 0
+        self._sync_buttons()
+
+    def _sync_buttons(self):
+        self.prev_page.disabled = self.page <= 0
+        self.next_page.disabled = self.page >= self.total_pages - 1
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("Hanya pemanggil command yang dapat mengganti halaman.", ephemeral=True)
+            return False
+        return True
+
+    async def _show(self, interaction: discord.Interaction):
+        self._sync_buttons()
+        embed = await self.render(self.page)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(self.page - 1, 0)
+        await self._show(interaction)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(self.page + 1, self.total_pages - 1)
+        await self._show(interaction)
@@ -0,0 +1,75 @@
+# cogs/sqlite_store.py
+# Modul helper (tanpa setup): dasar store SQLite dan antrean tulis batch yang dipakai bersama oleh cog.
+from discord.ext import tasks
+import asyncio
+import collections
+import sqlite3
+import threading
+import typing
+
+
+# --- SQLITE STORE ---
+
+class SQLiteStore:
+    """Satu koneksi SQLite (WAL) yang dipakai dari asyncio.to_thread; semua akses dijaga `_lock`.
+
+    Subclass hanya mendefinisikan schema dan query-nya sendiri.
+    """
+
+    def __init__(self, path: str, schema: str, foreign_keys: bool = False):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        if foreign_keys:
+            self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(schema)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+# --- BATCH WRITER ---
+
+class BatchWriter:
+    """Antrean baris di memori yang ditulis per batch di background lewat `write(rows)` (dijalankan di thread)."""
+
+    def __init__(self, write: typing.Callable[[typing.List[tuple]], typing.Any], batch_size: int, seconds: float, label: str):
+        self.pending: typing.Deque[tuple] = collections.deque()
+        self._write = write
+        self._batch_size = batch_size
+        self._label = label
+        self._task = tasks.loop(seconds=seconds)(self._run)
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def start(self):
+        self._task.start()
+
+    def append(self, row: tuple):
+        self.pending.append(row)
+
+    def _take(self, limit: int) -> typing.List[tuple]:
+        rows = []
+        while self.pending and len(rows) < limit:
+            rows.append(self.pending.popleft())
+        return rows
+
+    async def flush(self):
+        """Menulis semua baris yang masih antre; dipanggil sebelum query agar hasilnya lengkap."""
+        while self.pending:
+            rows = self._take(self._batch_size)
+            await asyncio.to_thread(self._write, rows)
+
+    async def _run(self):
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"ERROR: Gagal {self._label}: {e}")
+
+    def close(self):
+        """Menghentikan task lalu menulis sisa antrean secara sinkron (untuk cog_unload)."""
+        self._task.cancel()
+        rows = self._take(len(self.pending))
+        if rows:
+            self._write(rows)
@@ -2,14 +2,105 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from .log_config import get_log_channel_id
+from .outbound import ENFORCEMENT, RESPONSE, LOGGING, dispatch, route, send_message
+import collections
 import datetime
+import json
+import os
+import sys
+import time
+import typing
 import pytz
 
 JAKARTA_TZ = pytz.timezone('Asia/Jakarta')
 
+MESSAGE_CACHE_FILE = "message_cache.json"
+# Jumlah pesan terakhir yang disimpan per channel "hot" (di luar cache discord.py).
+HOT_CHANNEL_CACHE_SIZE = 2000
+MEMORY_SAMPLE_SIZE = 200
+
+# --- HELPER FUNCTIONS (JSON) ---
+
+def load_hot_channels() -> dict:
+    """Memuat daftar channel dengan cache pesan besar per guild."""
+    if not os.path.exists(MESSAGE_CACHE_FILE):
+        return {}
+    with open(MESSAGE_CACHE_FILE, 'r') as f:
+        return json.load(f)
+
+def save_hot_channels(data: dict):
+    """Menyimpan daftar channel dengan cache pesan besar per guild."""
+    with open(MESSAGE_CACHE_FILE, 'w') as f:
+        json.dump(data, f, indent=4)
+
+def estimate_message_bytes(messages: typing.Sequence[discord.Message]) -> int:
+    """Perkiraan memori sekumpulan pesan dari sampel (ukuran objek, konten, lampiran, embed)."""
+    if not messages:
+        return 0
+    step = max(1, len(messages) // MEMORY_SAMPLE_SIZE)
+    sample = messages[::step]
+    total = 0
+    for m in sample:
+        total += sys.getsizeof(m) + sys.getsizeof(m.content)
+        total += sum(sys.getsizeof(a.filename) + sys.getsizeof(a.url) + 200 for a in m.attachments)
+        total += sum(len(str(e.to_dict())) for e in m.embeds)
+    return total * len(messages) // len(sample)
+
 class TextModeration(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.hot_channels = load_hot_channels()
+        self._hot_ids = {int(cid) for channels in self.hot_channels.values() for cid in channels}
+        # channel_id -> deque pesan terakhir untuk channel hot
+        self._hot_cache: typing.Dict[int, typing.Deque[discord.Message]] = {}
+        self.reference_stats = collections.Counter()
+        self._fetch_seconds = 0.0
+
+    async def _resolve_reference(self, ctx: commands.Context, ref: discord.MessageReference) -> typing.Optional[discord.Message]:
+        """Cari pesan target: cache discord.py, cache channel hot, lalu fetch API. None jika sudah dihapus."""
+        resolved = getattr(ref, "resolved", None)
+        if isinstance(resolved, discord.Message):
+            self.reference_stats["resolved"] += 1
+            return resolved
+        if isinstance(resolved, discord.DeletedReferencedMessage):
+            self.reference_stats["deleted"] += 1
+            return None
+        cached = self._hot_cache.get(ref.channel_id or ctx.channel.id)
+        if cached:
+            target = discord.utils.find(lambda m: m.id == ref.message_id, reversed(cached))
+            if target is not None:
+                self.reference_stats["hot"] += 1
+                return target
+        started = time.perf_counter()
+        try:
+            return await ctx.channel.fetch_message(ref.message_id)
+        finally:
+            self._fetch_seconds += time.perf_counter() - started
+            self.reference_stats["fetched"] += 1
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.channel.id in self._hot_ids:
+            cache = self._hot_cache.get(message.channel.id)
+            if cache is None:
+                cache = self._hot_cache[message.channel.id] = collections.deque(maxlen=HOT_CHANNEL_CACHE_SIZE)
+            cache.append(message)
+
+    def _forget_hot(self, channel_id: int, message_ids: typing.AbstractSet[int]):
+        cache = self._hot_cache.get(channel_id)
+        if cache and any(m.id in message_ids for m in cache):
+            self._hot_cache[channel_id] = collections.deque(
+                (m for m in cache if m.id not in message_ids), maxlen=HOT_CHANNEL_CACHE_SIZE
+            )
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        # pakai message_id: pesan hot bisa sudah keluar dari cache discord.py
+        self._forget_hot(payload.channel_id, {payload.message_id})
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        self._forget_hot(payload.channel_id, payload.message_ids)
 
     async def log_action(self, interaction: discord.Interaction, title: str, description: str, color=discord.Color.dark_gold()):
         log_channel_id = get_log_channel_id(interaction.guild_id)
@@ -28,7 +119,7 @@ class TextModeration(commands.Cog):
         embed.set_author(name=str(interaction.user), icon_url=getattr(interaction.user, "avatar.url", None) if hasattr(interaction.user, "avatar") else None)
         if log_ch:
             try:
-                await log_ch.send(embed=embed)
+                await send_message(self.bot, LOGGING, log_ch, embed=embed)
             except Exception:
                 pass
 
@@ -65,12 +156,30 @@ class TextModeration(commands.Cog):
             timestamp=now_wib
         )
         context_embed.set_footer(text=f"ID Pesan: {target_msg.id}")
-        await log_ch.send(embed=context_embed)
+
+        # Lampiran diunduh ke arsip (per hash) sebelum pesan dihapus; forward hanya sebagai cadangan
+        # bila arsip gagal atau belum selesai, agar salinan yang sama tidak di-forward berulang kali.
+        evidence = self.bot.get_cog("EvidenceStore")
+        if evidence and target_msg.attachments:
+            futures = evidence.archive(target_msg)
+            archived = await evidence.settle(futures)
+            if archived and target_msg.content:
+                content = target_msg.content if len(target_msg.content) <= 1000 else target_msg.content[:1000] + "…"
+                context_embed.add_field(name="Isi", value=content, inline=False)
+            log_msg = await send_message(self.bot, LOGGING, log_ch, embed=context_embed)
+            evidence.annotate_log(log_msg, context_embed, futures)
+            if archived:
+                return
+        else:
+            await send_message(self.bot, LOGGING, log_ch, embed=context_embed)
 
         try:
-            await target_msg.forward(log_ch)
+            await dispatch(
+                self.bot, LOGGING, route("message.forward", log_ch.id), target_msg.guild.id,
+                lambda: target_msg.forward(log_ch)
+            )
         except Exception as e:
-            await log_ch.send(f"⚠️ Gagal mem-forward pesan asli (ID: {target_msg.id}). Error: {e}")
+            await send_message(self.bot, LOGGING, log_ch, f"⚠️ Gagal mem-forward pesan asli (ID: {target_msg.id}). Error: {e}")
             
     async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
         if isinstance(error, app_commands.CommandOnCooldown):
@@ -84,6 +193,54 @@ class TextModeration(commands.Cog):
         except Exception:
             pass
 
+    # --- COMMAND: /cachestats ---
+    @app_commands.command(name="cachestats", description="Statistik cache pesan dan resolusi reply !delete")
+    @app_commands.default_permissions(administrator=True)
+    async def cachestats(self, interaction: discord.Interaction):
+        cached = list(self.bot.cached_messages)
+        # batas yang benar-benar dipakai client (max_messages dari bot.py); None berarti cache mati
+        max_messages = self.bot._connection.max_messages
+        hot_messages = [m for cache in self._hot_cache.values() for m in cache]
+        stats = self.reference_stats
+        total = stats["resolved"] + stats["hot"] + stats["fetched"]
+        hit_rate = (stats["resolved"] + stats["hot"]) / total * 100 if total else 0.0
+        avg_fetch = self._fetch_seconds / stats["fetched"] * 1000 if stats["fetched"] else 0.0
+
+        embed = discord.Embed(title="🗄️ Cache Pesan", color=discord.Color.blurple())
+        if max_messages:
+            cache_value = f"{len(cached)} / {max_messages} pesan\n≈ {estimate_message_bytes(cached) / 1024:.0f} KiB"
+        else:
+            cache_value = "Dinonaktifkan (MAX_MESSAGES=0)"
+        embed.add_field(name="Cache discord.py", value=cache_value)
+        embed.add_field(name="Channel hot", value=f"{len(self._hot_ids)} channel • {len(hot_messages)} pesan\n≈ {estimate_message_bytes(hot_messages) / 1024:.0f} KiB")
+        embed.add_field(
+            name="Reply !delete",
+            value=(
+                f"Dari cache: {stats['resolved']} • Channel hot: {stats['hot']} • Fetch API: {stats['fetched']} • Sudah dihapus: {stats['deleted']}\n"
+                f"Hit rate: {hit_rate:.1f}% • Rata-rata fetch: {avg_fetch:.0f} ms"
+            ),
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    # --- COMMAND: /hotchannel ---
+    @app_commands.command(name="hotchannel", description="Simpan cache pesan lebih besar untuk channel dengan moderasi tinggi")
+    @app_commands.describe(channel="Channel teks", enabled="Aktif atau tidak")
+    @app_commands.default_permissions(administrator=True)
+    async def hotchannel(self, interaction: discord.Interaction, channel: discord.TextChannel, enabled: bool):
+        guild_id = str(interaction.guild_id)
+        channels = self.hot_channels.setdefault(guild_id, [])
+        if enabled and channel.id not in channels:
+            channels.append(channel.id)
+        elif not enabled and channel.id in channels:
+            channels.remove(channel.id)
+            self._hot_cache.pop(channel.id, None)
+        if not channels:
+            del self.hot_channels[guild_id]
+        save_hot_channels(self.hot_channels)
+        self._hot_ids = {int(cid) for chs in self.hot_channels.values() for cid in chs}
+        state = f"aktif ({HOT_CHANNEL_CACHE_SIZE} pesan terakhir)" if enabled else "nonaktif"
+        await interaction.response.send_message(f"✅ Cache hot untuk {channel.mention} {state}.", ephemeral=True)
 
     @commands.command(name="delete", aliases=["del"])
     @commands.has_permissions(manage_messages=True)
@@ -92,17 +249,19 @@ class TextModeration(commands.Cog):
         
         ref = ctx.message.reference
         if not ref:
-            await ctx.send("Harap reply pesan yang ingin dihapus.", delete_after=8)
+            await send_message(self.bot, RESPONSE, ctx.channel, "Harap reply pesan yang ingin dihapus.", delete_after=8)
             return
         
         try:
-            target = ref.resolved if getattr(ref, "resolved", None) else await ctx.channel.fetch_message(ref.message_id)
+            target = await self._resolve_reference(ctx, ref)
         except discord.NotFound:
-             await ctx.send("Pesan target tidak ditemukan.", delete_after=8)
-             return
+            target = None
         except Exception as e:
-            await ctx.send(f"Gagal mengambil pesan: {e}", delete_after=8)
+            await send_message(self.bot, RESPONSE, ctx.channel, f"Gagal mengambil pesan: {e}", delete_after=8)
             return
+        if target is None:
+             await send_message(self.bot, RESPONSE, ctx.channel, "Pesan target tidak ditemukan.", delete_after=8)
+             return
 
         await self.log_deleted_message_details(
             moderator=ctx.author,
@@ -110,28 +269,42 @@ class TextModeration(commands.Cog):
             reason=reason
         )
 
+        events = self.bot.get_cog("Events")
+        if events:
+            events.expect_deletion([target.id, ctx.message.id])
+
         try:
-            await target.delete()
-            
-            await ctx.message.delete() 
+            await dispatch(
+                self.bot, ENFORCEMENT, route("message.delete", target.channel.id), ctx.guild.id,
+                target.delete
+            )
+
+            search = self.bot.get_cog("ModSearch")
+            if search:
+                search.queue_deleted_message(ctx.author, target, reason)
+
+            await dispatch(
+                self.bot, RESPONSE, route("message.delete", ctx.channel.id), ctx.guild.id,
+                ctx.message.delete
+            )
             confirm_embed = discord.Embed(
                 description=f"🗑️ Pesan dari **{target.author.mention}** telah dihapus oleh {ctx.author.mention}.",
                 color=discord.Color.red()
             )
             if reason:
                 confirm_embed.set_footer(text=f"Alasan: {reason}")
-                
-            await ctx.send(embed=confirm_embed)
+
+            await send_message(self.bot, RESPONSE, ctx.channel, embed=confirm_embed)
 
         except discord.Forbidden:
-            await ctx.send("Bot tidak memiliki izin untuk menghapus pesan target atau pesan command.", delete_after=8)
+            await send_message(self.bot, RESPONSE, ctx.channel, "Bot tidak memiliki izin untuk menghapus pesan target atau pesan command.", delete_after=8)
         except Exception as e:
             await self.log_action(
                 ctx, 
                 title="❌ Gagal Operasi Delete", 
                 description=f"Gagal menghapus pesan/mengirim konfirmasi:\n{e}"
             )
-            await ctx.send(f"Gagal menghapus pesan: {e}", delete_after=8)
+            await send_message(self.bot, RESPONSE, ctx.channel, f"Gagal menghapus pesan: {e}", delete_after=8)
 
 
 async def setup(bot: commands.Bot):
@@ -0,0 +1,216 @@
+# cogs/traffic_recorder.py
+import discord
+from discord.ext import commands, tasks
+import asyncio
+import collections
+import hashlib
+import hmac
+import json
+import os
+import re
+import time
+import typing
+
+
+# Rekaman aktif hanya bila RECORD_TRAFFIC berisi path file output (JSONL).
+RECORD_ENV = "RECORD_TRAFFIC"
+MAX_RECORD_BYTES = 200 * 1024 * 1024
+FLUSH_SECONDS = 1.0
+# Opsi teks bebas yang isinya diganti seluruhnya.
+FREE_TEXT_OPTIONS = {"reason", "query"}
+# Opsi teks yang bentuknya dipertahankan (durasi, selector) kecuali ID di dalamnya.
+STRUCTURED_OPTIONS = {"duration", "selector", "window", "kind", "role", "snapshot"}
+PREFIX_COMMANDS = {"delete": "delete", "del": "delete"}
+
+_SNOWFLAKE_RE = re.compile(r"\d{15,21}")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+# Argumen selector yang diketik moderator (regex nama, nama role) selalu disamarkan.
+_SELECTOR_ARG_RE = re.compile(r'((?:name~|role:))("(?:[^"\\]|\\.)*"|[^\s()]+)', re.IGNORECASE)
+
+# --- HELPER FUNCTIONS (ANONYMIZATION) ---
+
+class Anonymizer:
+    """Memetakan ID ke ID palsu yang konsisten dalam satu rekaman (HMAC dengan salt acak yang tidak disimpan)."""
+
+    def __init__(self):
+        self._key = os.urandom(16)
+
+    def id(self, value: typing.Optional[int]) -> typing.Optional[int]:
+        if value is None:
+            return None
+        digest = hmac.new(self._key, str(value).encode(), hashlib.sha256).digest()
+        # 56 bit agar tetap terlihat seperti snowflake
+        return int.from_bytes(digest[:7], "big") | (1 << 55)
+
+    def text(self, value: str, keep_letters: bool) -> str:
+        value = _SNOWFLAKE_RE.sub(lambda m: str(self.id(int(m.group()))), value)
+        return value if keep_letters else _LETTER_RE.sub("x", value)
+
+    def selector(self, value: str) -> str:
+        value = self.text(value, keep_letters=True)
+        return _SELECTOR_ARG_RE.sub(lambda m: m.group(1) + _LETTER_RE.sub("x", m.group(2)), value)
+
+    def options(self, options: typing.List[dict]) -> typing.List[dict]:
+        result = []
+        for o in options:
+            entry = {"name": o.get("name"), "type": o.get("type")}
+            if o.get("focused"):
+                entry["focused"] = True
+            if "options" in o:
+                entry["options"] = self.options(o["options"])
+            value = o.get("value")
+            if isinstance(value, str):
+                name = o.get("name") or ""
+                if name in FREE_TEXT_OPTIONS:
+                    value = "x" * len(value)
+                elif value.isdigit() and len(value) >= 15:
+                    value = str(self.id(int(value)))
+                elif name == "selector":
+                    value = self.selector(value)
+                else:
+                    value = self.text(value, keep_letters=name in STRUCTURED_OPTIONS)
+            if value is not None:
+                entry["value"] = value
+            result.append(entry)
+        return result
+
+# --- COG CLASS ---
+
+class TrafficRecorder(commands.Cog):
+    """Merekam interaction dan event voice/member (teranonimkan) untuk benchmarks/replay_traffic.py."""
+
+    def __init__(self, bot: commands.Bot, path: str):
+        self.bot = bot
+        self.path = path
+        self.anon = Anonymizer()
+        self._started = time.monotonic()
+        self._buffer: typing.Deque[str] = collections.deque()
+        self._written = 0
+        self._full = False
+        self.flush_task.start()
+
+    def cog_unload(self):
+        self.flush_task.cancel()
+        self._write(list(self._buffer))
+        self._buffer.clear()
+
+    def _emit(self, kind: str, **fields):
+        if self._full:
+            return
+        fields["t"] = round(time.monotonic() - self._started, 4)
+        fields["kind"] = kind
+        self._buffer.append(json.dumps(fields, separators=(",", ":")))
+
+    def _write(self, lines: typing.List[str]):
+        if not lines:
+            return
+        data = "\n".join(lines) + "\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+        self._written += len(data)
+        if self._written >= MAX_RECORD_BYTES and not self._full:
+            self._full = True
+            print(f"Rekaman trafik mencapai batas {MAX_RECORD_BYTES} byte, perekaman dihentikan.")
+
+    def _guild_state(self, guild: discord.Guild):
+        a = self.anon.id
+        self._emit(
+            "guild",
+            guild=a(guild.id),
+            members=guild.member_count or len(guild.members),
+            voice_channels=[
+                {"id": a(ch.id), "members": [[a(m.id), bool(m.voice and m.voice.mute), bool(m.voice and m.voice.deaf)] for m in ch.members]}
+                for ch in guild.voice_channels
+            ],
+            text_channels=[a(ch.id) for ch in guild.text_channels],
+        )
+
+    # --- BACKGROUND TASK: Flush ---
+    @tasks.loop(seconds=FLUSH_SECONDS)
+    async def flush_task(self):
+        if not self._buffer:
+            return
+        lines = list(self._buffer)
+        self._buffer.clear()
+        try:
+            await asyncio.to_thread(self._write, lines)
+        except Exception as e:
+            print(f"ERROR: Gagal menulis rekaman trafik: {e}")
+
+    # --- LISTENERS ---
+    @commands.Cog.listener()
+    async def on_ready(self):
+        for guild in self.bot.guilds:
+            self._guild_state(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild):
+        self._guild_state(guild)
+
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        if interaction.type not in (discord.InteractionType.application_command, discord.InteractionType.autocomplete):
+            return
+        data = interaction.data or {}
+        a = self.anon.id
+        self._emit(
+            "autocomplete" if interaction.type == discord.InteractionType.autocomplete else "command",
+            guild=a(interaction.guild_id),
+            channel=a(interaction.channel_id),
+            user=a(interaction.user.id),
+            command=data.get("name"),
+            options=self.anon.options(data.get("options") or []),
+        )
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.guild is None or message.author.bot or not message.content.startswith("!"):
+            return
+        name, _, rest = message.content[1:].partition(" ")
+        command = PREFIX_COMMANDS.get(name.lower())
+        if command is None:
+            return
+        a = self.anon.id
+        ref = message.reference
+        resolved = ref.resolved if ref and isinstance(ref.resolved, discord.Message) else None
+        self._emit(
+            "prefix",
+            guild=a(message.guild.id),
+            channel=a(message.channel.id),
+            user=a(message.author.id),
+            command=command,
+            reason="x" * len(rest.strip()) if rest.strip() else None,
+            reply_to=a(ref.message_id) if ref else None,
+            reply_author=a(resolved.author.id) if resolved else None,
+            cached=resolved is not None,
+        )
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        a = self.anon.id
+        self._emit(
+            "voice",
+            guild=a(member.guild.id),
+            member=a(member.id),
+            before=a(before.channel.id) if before.channel else None,
+            after=a(after.channel.id) if after.channel else None,
+            mute=bool(after.mute),
+            deaf=bool(after.deaf),
+        )
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self._emit("member_join", guild=self.anon.id(member.guild.id), member=self.anon.id(member.id))
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self._emit("member_remove", guild=self.anon.id(member.guild.id), member=self.anon.id(member.id))
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    path = os.getenv(RECORD_ENV)
+    if not path:
+        return
+    print(f"Merekam trafik ke {path}")
+    await bot.add_cog(TrafficRecorder(bot, path))
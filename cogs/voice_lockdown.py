@@ -0,0 +1,378 @@
+# cogs/voice_lockdown.py
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from .log_config import get_log_channel_id
+from .outbound import LOGGING, RESPONSE, edit_member, gather_bounded, send_message
+import asyncio
+import datetime
+import json
+import os
+import re
+import typing
+
+
+LOCKDOWN_FILE = "lockdown.json"
+LOCKDOWN_CONCURRENCY = 8
+
+# field lockdown -> (atribut VoiceState, kwarg member.edit)
+FIELDS = {
+    "mute": ("mute", "mute"),
+    "deafen": ("deaf", "deafen"),
+}
+
+_ROLE_RE = re.compile(r"<@&(\d+)>|(\d+)")
+
+# --- HELPER FUNCTIONS (JSON) ---
+
+def load_lockdowns() -> dict:
+    """Memuat state lockdown dari file JSON."""
+    if not os.path.exists(LOCKDOWN_FILE):
+        return {"locks": {}, "pending": {}}
+    with open(LOCKDOWN_FILE, 'r') as f:
+        data = json.load(f)
+    data.setdefault("locks", {})
+    data.setdefault("pending", {})
+    return data
+
+def save_lockdowns(data: dict):
+    """Menyimpan state lockdown ke file JSON."""
+    with open(LOCKDOWN_FILE, 'w') as f:
+        json.dump(data, f, indent=4)
+
+def _parse_role_ids(text: typing.Optional[str]) -> typing.List[int]:
+    if not text:
+        return []
+    return [int(a or b) for a, b in _ROLE_RE.findall(text)]
+
+# --- COG CLASS ---
+
+class VoiceLockdown(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        # locks: guild_id -> channel_id -> {mute, deafen, exempt_roles, by, reason, since, changed: {member_id: [field]}}
+        # pending: guild_id -> member_id -> [field] (harus dikembalikan saat member masuk voice lagi)
+        self.data = load_lockdowns()
+        self._dirty = False
+        self.save_task.start()
+
+    def cog_unload(self):
+        self.save_task.cancel()
+        if self._dirty:
+            save_lockdowns(self.data)
+
+    # --- STATE HELPERS ---
+    def _lock(self, guild_id: int, channel_id: typing.Optional[int]) -> typing.Optional[dict]:
+        if channel_id is None:
+            return None
+        return self.data["locks"].get(str(guild_id), {}).get(str(channel_id))
+
+    def _is_exempt(self, member: discord.Member, channel: discord.abc.GuildChannel, lock: dict) -> bool:
+        if member.bot:
+            return True
+        if channel.permissions_for(member).mute_members:
+            return True
+        return any(member.get_role(role_id) for role_id in lock["exempt_roles"])
+
+    async def _edit_fields(self, member: discord.Member, fields: typing.Dict[str, bool], reason: str):
+        kwargs = {FIELDS[f][1]: value for f, value in fields.items()}
+        await edit_member(self.bot, member, reason=reason, **kwargs)
+
+    def _journal(self, guild_id: int, actor_id: int, member_id: int, fields: typing.Dict[str, bool], channel_id: typing.Optional[int], reason: str):
+        history = self.bot.get_cog("ModHistory")
+        if not history:
+            return
+        for field, value in fields.items():
+            action = field if value else f"un{field}"
+            history.record(guild_id, actor_id, member_id, action, channel_id, reason)
+
+    async def _apply(self, member: discord.Member, channel: discord.abc.GuildChannel, lock: dict, carried: typing.Iterable[str] = ()) -> typing.Optional[typing.List[str]]:
+        """Menerapkan lockdown ke satu member. Mengembalikan field yang diubah bot, None bila dikecualikan."""
+        if self._is_exempt(member, channel, lock):
+            return None
+        state = member.voice
+        carried = set(carried)
+        desired = {f for f in FIELDS if lock[f]}
+        changes: typing.Dict[str, bool] = {}
+        for f in desired:
+            if not getattr(state, FIELDS[f][0], False):
+                changes[f] = True
+        # field dari lockdown lain yang tidak diminta channel ini dikembalikan
+        for f in carried - desired:
+            if getattr(state, FIELDS[f][0], False):
+                changes[f] = False
+        if changes:
+            await self._edit_fields(member, changes, f"Lockdown {channel.name}: {lock.get('reason') or '—'}")
+            self._journal(member.guild.id, lock["by"], member.id, changes, channel.id, f"Lockdown: {lock.get('reason') or '—'}")
+        return sorted(f for f in desired if f in carried or changes.get(f))
+
+    async def _restore(self, member: discord.Member, fields: typing.Iterable[str], reason: str) -> bool:
+        """Mengembalikan field yang diubah lockdown, hanya bila masih aktif."""
+        changes = {f: False for f in fields if getattr(member.voice, FIELDS[f][0], False)}
+        if changes:
+            await self._edit_fields(member, changes, reason)
+            self._journal(member.guild.id, self.bot.user.id, member.id, changes, member.voice.channel.id, reason)
+        return bool(changes)
+
+    # --- BACKGROUND TASK: Save ---
+    @tasks.loop(seconds=5)
+    async def save_task(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            await asyncio.to_thread(save_lockdowns, json.loads(json.dumps(self.data)))
+        except Exception as e:
+            self._dirty = True
+            print(f"ERROR: Gagal menyimpan state lockdown: {e}")
+
+    async def _log(self, guild: discord.Guild, user: discord.abc.User, title: str, description: str, color: discord.Color):
+        log_channel_id = get_log_channel_id(guild.id)
+        if not log_channel_id:
+            return
+        log_ch = self.bot.get_channel(log_channel_id)
+        if not log_ch:
+            return
+        embed = discord.Embed(title=title, description=description, color=color, timestamp=datetime.datetime.now(datetime.timezone.utc))
+        embed.set_author(name=str(user))
+        embed.set_footer(text=f"Guild: {guild.id}")
+        try:
+            await send_message(self.bot, LOGGING, log_ch, embed=embed)
+        except Exception:
+            pass
+
+    # --- COMMAND: /lockdown ---
+    @app_commands.command(name="lockdown", description="Server mute/deafen semua member di voice channel")
+    @app_commands.describe(
+        channel="Voice channel",
+        mute="Server mute (default: ya)",
+        deafen="Server deafen (default: tidak)",
+        exempt="Role yang dikecualikan, contoh: @Speaker @Host",
+        reason="Alasan"
+    )
+    @app_commands.default_permissions(mute_members=True)
+    async def lockdown(
+        self,
+        interaction: discord.Interaction,
+        channel: discord.VoiceChannel,
+        mute: bool = True,
+        deafen: bool = False,
+        exempt: typing.Optional[str] = None,
+        reason: typing.Optional[str] = None
+    ):
+        guild = interaction.guild
+        if not mute and not deafen:
+            await interaction.response.send_message("Pilih minimal salah satu: mute atau deafen.", ephemeral=True)
+            return
+        if self._lock(guild.id, channel.id):
+            await interaction.response.send_message(f"<#{channel.id}> sudah dalam lockdown. Gunakan /unlock terlebih dulu.", ephemeral=True)
+            return
+
+        members = list(channel.members)
+        voice = self.bot.get_cog("VoiceModeration")
+        op = None
+        if voice:
+            op = await voice.begin_bulk(
+                interaction,
+                ("lockdown", channel.id),
+                f"lockdown {channel.name}",
+                exclusive=[("channel", channel.id)] + [("member", m.id) for m in members]
+            )
+            if not op:
+                return
+        try:
+            if not interaction.response.is_done():
+                await interaction.response.defer(thinking=True, ephemeral=True)
+
+            lock = {
+                "mute": mute,
+                "deafen": deafen,
+                "exempt_roles": _parse_role_ids(exempt),
+                "by": interaction.user.id,
+                "reason": reason,
+                "since": datetime.datetime.now(datetime.timezone.utc).timestamp(),
+                "changed": {},
+            }
+            # didaftarkan sebelum eksekusi agar member yang masuk selama proses ikut ditangani listener
+            self.data["locks"].setdefault(str(guild.id), {})[str(channel.id)] = lock
+            self._dirty = True
+
+            outcomes = await gather_bounded([
+                (lambda m=m: self._apply(m, channel, lock)) for m in members
+            ], LOCKDOWN_CONCURRENCY)
+
+            applied = exempted = 0
+            failures = []
+            for m, outcome in zip(members, outcomes):
+                if isinstance(outcome, Exception):
+                    failures.append(f"{m.display_name}: {outcome}")
+                elif outcome is None:
+                    exempted += 1
+                else:
+                    if outcome:
+                        lock["changed"][str(m.id)] = outcome
+                    applied += 1
+            self._dirty = True
+            summary = f"🔒 Lockdown <#{channel.id}>: **{applied}** member dikunci, {exempted} dikecualikan, {len(failures)} gagal."
+            if op:
+                op.summary = summary
+        except Exception:
+            if op:
+                op.summary = "gagal (error)"
+            raise
+        finally:
+            if op:
+                voice.operations.release(op)
+
+        detail = ("\n\nGagal:\n" + "\n".join(failures[:20])) if failures else ""
+        await interaction.followup.send(summary + detail, ephemeral=True)
+        await send_message(self.bot, RESPONSE, interaction.channel, embed=discord.Embed(
+            title="🔒 VOICE LOCKDOWN",
+            description=f"<#{channel.id}> dikunci oleh {interaction.user.mention}.\nAlasan: {reason or '—'}",
+            color=discord.Color.red()
+        ))
+        await self._log(guild, interaction.user, "Voice Lockdown", f"Channel: {channel.name}\nMute: {mute} • Deafen: {deafen}\n{summary}\nReason: {reason or '—'}", discord.Color.red())
+
+    # --- COMMAND: /unlock ---
+    @app_commands.command(name="unlock", description="Akhiri lockdown voice channel dan kembalikan state member")
+    @app_commands.describe(channel="Voice channel", reason="Alasan")
+    @app_commands.default_permissions(mute_members=True)
+    async def unlock(self, interaction: discord.Interaction, channel: discord.VoiceChannel, reason: typing.Optional[str] = None):
+        guild = interaction.guild
+        lock = self._lock(guild.id, channel.id)
+        if not lock:
+            await interaction.response.send_message(f"<#{channel.id}> tidak sedang dalam lockdown.", ephemeral=True)
+            return
+
+        changed = lock["changed"]
+        voice = self.bot.get_cog("VoiceModeration")
+        op = None
+        if voice:
+            op = await voice.begin_bulk(
+                interaction,
+                ("unlock", channel.id),
+                f"unlock {channel.name}",
+                exclusive=[("channel", channel.id)] + [("member", int(mid)) for mid in changed]
+            )
+            if not op:
+                return
+        try:
+            if not interaction.response.is_done():
+                await interaction.response.defer(thinking=True, ephemeral=True)
+
+            del self.data["locks"][str(guild.id)][str(channel.id)]
+            if not self.data["locks"][str(guild.id)]:
+                del self.data["locks"][str(guild.id)]
+            self._dirty = True
+
+            restore_reason = f"Unlock {channel.name} oleh {interaction.user}" + (f": {reason}" if reason else "")
+            online = []
+            pending = self.data["pending"].setdefault(str(guild.id), {})
+            for member_id, fields in changed.items():
+                member = guild.get_member(int(member_id))
+                if not member:
+                    continue
+                if member.voice and member.voice.channel:
+                    online.append((member, fields))
+                else:
+                    pending[member_id] = sorted(set(pending.get(member_id, [])) | set(fields))
+
+            outcomes = await gather_bounded([
+                (lambda m=m, f=f: self._restore(m, f, restore_reason)) for m, f in online
+            ], LOCKDOWN_CONCURRENCY)
+            restored = sum(1 for o in outcomes if o is True)
+            failed = sum(1 for o in outcomes if isinstance(o, Exception))
+            if not pending:
+                del self.data["pending"][str(guild.id)]
+            self._dirty = True
+            summary = (
+                f"🔓 Unlock <#{channel.id}>: **{restored}** member dipulihkan, {failed} gagal, "
+                f"{len(changed) - len(online)} dipulihkan saat kembali ke voice."
+            )
+            if op:
+                op.summary = summary
+        except Exception:
+            if op:
+                op.summary = "gagal (error)"
+            raise
+        finally:
+            if op:
+                voice.operations.release(op)
+
+        await interaction.followup.send(summary, ephemeral=True)
+        await send_message(self.bot, RESPONSE, interaction.channel, embed=discord.Embed(
+            title="🔓 VOICE UNLOCK",
+            description=f"<#{channel.id}> dibuka oleh {interaction.user.mention}.",
+            color=discord.Color.green()
+        ))
+        await self._log(guild, interaction.user, "Voice Unlock", f"Channel: {channel.name}\n{summary}\nReason: {reason or '—'}", discord.Color.green())
+
+    # --- LISTENERS ---
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        guild_id = str(member.guild.id)
+        locks = self.data["locks"].get(guild_id)
+        pending = self.data["pending"].get(guild_id)
+        if not locks and not pending:
+            return
+        before_id = before.channel.id if before.channel else None
+        after_id = after.channel.id if after.channel else None
+        if before_id == after_id:
+            return
+
+        member_key = str(member.id)
+        carried: typing.Set[str] = set()
+        before_lock = self._lock(member.guild.id, before_id)
+        if before_lock:
+            carried |= set(before_lock["changed"].pop(member_key, []))
+        if pending and member_key in pending:
+            carried |= set(pending.pop(member_key))
+            if not pending:
+                del self.data["pending"][guild_id]
+        after_lock = self._lock(member.guild.id, after_id)
+        if not carried and not after_lock:
+            return
+        self._dirty = True
+
+        try:
+            if after_lock:
+                fields = await self._apply(member, after.channel, after_lock, carried)
+                if fields:
+                    after_lock["changed"][member_key] = fields
+                elif fields is None and carried:
+                    await self._restore(member, carried, "Lockdown: member dikecualikan")
+            elif after.channel:
+                await self._restore(member, carried, "Lockdown berakhir untuk member ini")
+            else:
+                self.data["pending"].setdefault(guild_id, {})[member_key] = sorted(carried)
+        except Exception as e:
+            print(f"ERROR: Gagal memproses lockdown untuk {member} ({member.guild.name}): {e}")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # member yang masuk saat bot offline ikut dikunci
+        for guild_id, locks in list(self.data["locks"].items()):
+            guild = self.bot.get_guild(int(guild_id))
+            if not guild:
+                continue
+            for channel_id, lock in list(locks.items()):
+                channel = guild.get_channel(int(channel_id))
+                if not isinstance(channel, discord.VoiceChannel):
+                    continue
+                for m in channel.members:
+                    key = str(m.id)
+                    if key in lock["changed"]:
+                        continue
+                    try:
+                        fields = await self._apply(m, channel, lock)
+                    except Exception as e:
+                        print(f"ERROR: Gagal menerapkan lockdown ke {m} ({guild.name}): {e}")
+                        continue
+                    if fields:
+                        lock["changed"][key] = fields
+                        self._dirty = True
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(VoiceLockdown(bot))
@@ -2,12 +2,183 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from .log_config import get_log_channel_id
+from .outbound import ENFORCEMENT, RESPONSE, LOGGING, send_message, edit_member, move_member
+from .voice_timers import MAX_DURATION, parse_duration
+from .member_index import SelectorError, member_label
+from .pagination import ResultPaginator
 import typing
+import asyncio
+import collections
 import datetime
+import io
 import pytz
 import re
+import statistics
+import time
 
 JAKARTA_TZ = pytz.timezone('Asia/Jakarta')
+SELECTOR_PREVIEW_NAMES = 15
+PROGRESS_INTERVAL_SECONDS = 1.0
+SUMMARY_CHARS = 3500
+RESULT_PAGE_CHARS = 3800
+RESULT_PAGE_LINES = 40
+RESULT_FILE_THRESHOLD = 300
+MAX_BULK_OPS_PER_GUILD = 2
+# Pipeline perintah single-target: respons harus terkirim jauh sebelum batas 3 detik interaction.
+# Sisa waktu setelah budget dipakai untuk round trip defer itu sendiri (dan lag gateway).
+ACK_BUDGET_SECONDS = 0.75
+ENFORCE_TIMEOUT_SECONDS = 5.0
+ENFORCE_ATTEMPTS = 3
+ENFORCE_RETRY_BACKOFF_SECONDS = 0.5
+STAGE_SAMPLES = 500
+PIPELINE_STAGES = (
+    ("ack", "Ack"),
+    ("enforce", "Enforcement"),
+    ("respond", "Respons akhir"),
+    ("announce", "Pengumuman"),
+    ("log", "Log"),
+)
+
+def _truncate_lines(lines: typing.List[str], limit: int = SUMMARY_CHARS) -> str:
+    """Menggabungkan baris sampai batas karakter, sisanya diringkas menjadi '… dan N lainnya'."""
+    out = []
+    size = 0
+    for i, line in enumerate(lines):
+        if size + len(line) + 1 > limit:
+            out.append(f"… dan {len(lines) - i} lainnya")
+            break
+        out.append(line)
+        size += len(line) + 1
+    return "\n".join(out)
+
+def _paginate_lines(lines: typing.List[str], max_chars: int = RESULT_PAGE_CHARS, max_lines: int = RESULT_PAGE_LINES) -> typing.List[str]:
+    pages = []
+    current: typing.List[str] = []
+    size = 0
+    for line in lines:
+        line = line[:max_chars]
+        if current and (size + len(line) + 1 > max_chars or len(current) >= max_lines):
+            pages.append("\n".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current or not pages:
+        pages.append("\n".join(current) or "—")
+    return pages
+
+class BulkOperation:
+    __slots__ = ("guild_id", "signature", "label", "exclusive", "shared", "actor_id", "summary", "_done")
+
+    def __init__(self, guild_id: int, signature: tuple, label: str, exclusive: frozenset, shared: frozenset, actor_id: int):
+        self.guild_id = guild_id
+        self.signature = signature
+        self.label = label
+        self.exclusive = exclusive
+        self.shared = shared
+        self.actor_id = actor_id
+        self.summary = "selesai"
+        self._done: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    async def wait(self) -> str:
+        return await asyncio.shield(self._done)
+
+class BulkOperationCoordinator:
+    """Mengunci channel/member yang sedang diproses operasi bulk dan membatasi jumlahnya per guild.
+
+    Resource eksklusif (channel asal, member) tidak boleh dipakai operasi lain; resource bersama
+    (channel tujuan) boleh dipakai bersama asal tidak sedang dikuras sebagai channel asal.
+    """
+
+    def __init__(self, max_per_guild: int = MAX_BULK_OPS_PER_GUILD):
+        self.max_per_guild = max_per_guild
+        self._ops: typing.Dict[int, typing.List[BulkOperation]] = {}
+
+    def acquire(
+        self,
+        guild_id: int,
+        signature: tuple,
+        label: str,
+        exclusive: typing.Iterable[tuple],
+        shared: typing.Iterable[tuple],
+        actor_id: int
+    ) -> typing.Tuple[typing.Optional[BulkOperation], typing.Optional[BulkOperation]]:
+        """Mengembalikan (operasi baru, None) bila berhasil, atau (None, operasi penghalang | None bila kuota penuh)."""
+        exclusive = frozenset(exclusive)
+        shared = frozenset(shared) - exclusive
+        ops = self._ops.setdefault(guild_id, [])
+        for op in ops:
+            if op.signature == signature:
+                return None, op
+        for op in ops:
+            if exclusive & (op.exclusive | op.shared) or shared & op.exclusive:
+                return None, op
+        if len(ops) >= self.max_per_guild:
+            return None, None
+        op = BulkOperation(guild_id, signature, label, exclusive, shared, actor_id)
+        ops.append(op)
+        return op, None
+
+    def release(self, op: BulkOperation):
+        ops = self._ops.get(op.guild_id, [])
+        if op in ops:
+            ops.remove(op)
+        if not ops:
+            self._ops.pop(op.guild_id, None)
+        if not op._done.done():
+            op._done.set_result(op.summary)
+
+    def active(self, guild_id: int) -> typing.List[BulkOperation]:
+        return list(self._ops.get(guild_id, ()))
+
+class ProgressReporter:
+    """Mengedit satu pesan status (response asli interaction) paling sering sekali per interval."""
+
+    def __init__(self, interaction: discord.Interaction, title: str, total: int, interval: float = PROGRESS_INTERVAL_SECONDS):
+        self.interaction = interaction
+        self.title = title
+        self.total = total
+        self.interval = interval
+        self.ok = 0
+        self.failed = 0
+        self.skipped = 0
+        self._started = time.monotonic()
+        self._last_edit = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.ok + self.failed + self.skipped
+
+    def _render(self) -> str:
+        elapsed = time.monotonic() - self._started
+        line = f"⏳ {self.title}: **{self.processed}/{self.total}** (✅ {self.ok} • ⏭️ {self.skipped} • ❌ {self.failed})"
+        if self.processed:
+            eta = elapsed / self.processed * (self.total - self.processed)
+            line += f" — ETA ~{eta:.0f} detik"
+        return line
+
+    async def _edit(self, content: str):
+        self._last_edit = time.monotonic()
+        try:
+            await self.interaction.edit_original_response(content=content)
+        except Exception:
+            pass
+
+    async def start(self):
+        await self._edit(self._render())
+
+    async def tick(self, ok: typing.Optional[bool]):
+        """True = berhasil, False = gagal, None = dilewati."""
+        if ok is None:
+            self.skipped += 1
+        elif ok:
+            self.ok += 1
+        else:
+            self.failed += 1
+        if time.monotonic() - self._last_edit >= self.interval and self.processed < self.total:
+            await self._edit(self._render())
+
+    async def finish(self, summary: str):
+        await self._edit(f"{summary} ({time.monotonic() - self._started:.1f} detik)")
 
 class ActiveVoiceChannel(app_commands.Transform):
     @classmethod
@@ -18,9 +189,50 @@ class ActiveVoiceChannel(app_commands.Transform):
             raise app_commands.AppCommandError("Channel tidak memiliki anggota aktif.")
         return value
 
+class ConfirmView(discord.ui.View):
+    def __init__(self, owner_id: int, timeout: float = 60):
+        super().__init__(timeout=timeout)
+        self.owner_id = owner_id
+        self.value: typing.Optional[bool] = None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.owner_id
+
+    @discord.ui.button(label="Lanjutkan", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = True
+        await interaction.response.defer()
+        self.stop()
+
+    @discord.ui.button(label="Batal", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = False
+        await interaction.response.defer()
+        self.stop()
+
+class StageTimings:
+    """Sampel durasi terakhir per tahap pipeline beserta counter kejadian."""
+
+    def __init__(self, max_samples: int = STAGE_SAMPLES):
+        self.samples: typing.Dict[str, typing.Deque[float]] = collections.defaultdict(lambda: collections.deque(maxlen=max_samples))
+        self.counters = collections.Counter()
+
+    def record(self, stage: str, seconds: float):
+        self.samples[stage].append(seconds)
+
+    def summary(self, stage: str) -> typing.Tuple[int, float, float, float]:
+        """(jumlah sampel, p50, p95, maks) dalam detik."""
+        values = sorted(self.samples.get(stage, ()))
+        if not values:
+            return 0, 0.0, 0.0, 0.0
+        return len(values), statistics.median(values), values[min(len(values) - 1, int(len(values) * 0.95))], values[-1]
+
 class VoiceModeration(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.operations = BulkOperationCoordinator()
+        self.timings = StageTimings()
+        self._background: typing.Set[asyncio.Task] = set()
 
     async def log_action(self, interaction: discord.Interaction, title: str, description: str, color=discord.Color.orange()):
         log_channel_id = get_log_channel_id(interaction.guild_id)
@@ -40,10 +252,142 @@ class VoiceModeration(commands.Cog):
         embed.set_footer(text=f"Guild: {interaction.guild.id if interaction.guild else 'DM'}")
         if log_ch:
             try:
-                await log_ch.send(embed=embed)
+                await send_message(self.bot, LOGGING, log_ch, embed=embed)
             except Exception:
                 pass
 
+    def _journal(self, interaction: discord.Interaction, action: str, member: discord.abc.Snowflake, channel_id: typing.Optional[int], reason: typing.Optional[str]):
+        history = self.bot.get_cog("ModHistory")
+        if history:
+            history.record(interaction.guild_id, interaction.user.id, member.id, action, channel_id, reason)
+
+    async def _enforce(
+        self,
+        factory: typing.Callable[[], typing.Awaitable[typing.Any]],
+        applied: typing.Callable[[], bool]
+    ) -> typing.Any:
+        """Panggilan enforcement dengan timeout; timeout dan error server Discord dicoba ulang.
+
+        Request yang timeout atau 5xx bisa saja sudah diproses Discord, jadi sebelum mengulang
+        `applied` memeriksa voice state dari cache gateway; bila aksi sudah terjadi, tidak dikirim lagi.
+        """
+        for attempt in range(1, ENFORCE_ATTEMPTS + 1):
+            try:
+                return await asyncio.wait_for(factory(), ENFORCE_TIMEOUT_SECONDS)
+            except (asyncio.TimeoutError, discord.DiscordServerError) as e:
+                if attempt == ENFORCE_ATTEMPTS:
+                    if isinstance(e, asyncio.TimeoutError):
+                        self.timings.counters["timeouts"] += 1
+                        raise RuntimeError(f"Discord tidak merespons setelah {ENFORCE_ATTEMPTS} percobaan.") from e
+                    raise
+                # beri waktu event voice state dari gateway sampai sebelum memeriksa
+                await asyncio.sleep(ENFORCE_RETRY_BACKOFF_SECONDS * attempt)
+                if applied():
+                    self.timings.counters["applied_before_retry"] += 1
+                    return None
+                self.timings.counters["retries"] += 1
+
+    async def _run_single(
+        self,
+        interaction: discord.Interaction,
+        command: str,
+        enforce: typing.Callable[[], typing.Awaitable[typing.Any]],
+        applied: typing.Callable[[], bool],
+        finalize: typing.Callable[[], typing.Awaitable[str]],
+        embed: discord.Embed,
+        log_title: str,
+        log_description: str,
+        log_color: discord.Color
+    ):
+        """Pipeline perintah voice single-target.
+
+        Enforcement dimulai segera; bila belum selesai dalam ACK_BUDGET_SECONDS (atau antrean
+        enforcement Outbound sedang tidak kosong) interaction di-defer dulu. `finalize` (journal, timer) mengembalikan teks konfirmasi. Pengumuman publik dan log
+        dikirim bersamaan di background setelah respons terkirim.
+        """
+        started = time.perf_counter()
+        self.timings.counters[command] += 1
+
+        async def enforce_and_finalize() -> str:
+            t = time.perf_counter()
+            await self._enforce(enforce, applied)
+            self.timings.record("enforce", time.perf_counter() - t)
+            return await finalize()
+
+        task = asyncio.create_task(enforce_and_finalize())
+        if self._enforcement_backlog():
+            # antrean sudah penuh: hampir pasti lewat budget, jadi defer tanpa menunggu
+            self.timings.counters["deferred_backlog"] += 1
+            done = set()
+        else:
+            done, _ = await asyncio.wait({task}, timeout=ACK_BUDGET_SECONDS)
+        deferred = not done
+        if deferred:
+            self.timings.counters["deferred"] += 1
+            try:
+                await interaction.response.defer(ephemeral=True, thinking=True)
+                self.timings.record("ack", time.perf_counter() - started)
+            except Exception as e:
+                self.timings.counters["ack_failed"] += 1
+                print(f"ERROR: Gagal defer interaction /{command}: {e}")
+
+        try:
+            confirm = await task
+            succeeded = True
+        except Exception as e:
+            self.timings.counters["failed"] += 1
+            confirm = f"Terjadi error: {e}"
+            succeeded = False
+
+        # respons ke moderator boleh gagal (mis. 10062 Unknown interaction); aksi yang sudah
+        # terjadi tetap harus diumumkan dan dicatat di log
+        try:
+            if deferred:
+                await interaction.edit_original_response(content=confirm)
+            else:
+                await interaction.response.send_message(confirm, ephemeral=True)
+                self.timings.record("ack", time.perf_counter() - started)
+            self.timings.record("respond", time.perf_counter() - started)
+        except Exception as e:
+            self.timings.counters["respond_failed"] += 1
+            print(f"ERROR: Gagal mengirim respons /{command}: {e}")
+
+        if succeeded:
+            bg = asyncio.create_task(self._announce(interaction, embed, log_title, log_description, log_color))
+            self._background.add(bg)
+            bg.add_done_callback(self._background.discard)
+
+    def _enforcement_backlog(self) -> int:
+        outbound = self.bot.get_cog("Outbound")
+        if outbound is None or not outbound.scheduler.running:
+            return 0
+        return outbound.scheduler.depth(ENFORCEMENT)
+
+    async def _announce(self, interaction: discord.Interaction, embed: discord.Embed, log_title: str, log_description: str, log_color: discord.Color):
+        async def timed(stage: str, coro: typing.Awaitable[typing.Any]):
+            t = time.perf_counter()
+            try:
+                await coro
+            except Exception as e:
+                self.timings.counters[f"{stage}_failed"] += 1
+                print(f"ERROR: Gagal mengirim {stage} voice moderation: {e}")
+            finally:
+                self.timings.record(stage, time.perf_counter() - t)
+
+        await asyncio.gather(
+            timed("announce", send_message(self.bot, RESPONSE, interaction.channel, embed=embed)),
+            timed("log", self.log_action(interaction, log_title, log_description, color=log_color))
+        )
+
+    def _action_embed(self, interaction: discord.Interaction, title: str, description: str, color: discord.Color, reason: typing.Optional[str]) -> discord.Embed:
+        embed = discord.Embed(title=title, description=description, color=color)
+        if reason:
+            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
+            embed.add_field(name="Alasan", value=reason, inline=True)
+        else:
+            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}", inline=True)
+        return embed
+
     async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
         if isinstance(error, app_commands.CommandOnCooldown):
             await interaction.response.send_message(f"Perintah sedang cooldown. Coba lagi setelah {error.retry_after:.1f}s.", ephemeral=False)
@@ -56,6 +400,126 @@ class VoiceModeration(commands.Cog):
         except Exception:
             pass
 
+    async def _resolve_duration(self, interaction: discord.Interaction, duration: typing.Optional[str]) -> typing.Tuple[bool, typing.Optional[datetime.timedelta]]:
+        """Validasi opsi durasi. Mengirim pesan error dan mengembalikan (False, None) bila tidak valid."""
+        if not duration:
+            return True, None
+        delta = parse_duration(duration)
+        if delta is None or delta > MAX_DURATION:
+            await interaction.response.send_message("Durasi tidak valid. Contoh: `30m`, `2h`, `1d12h` (maks 28 hari).", ephemeral=True)
+            return False, None
+        if not self.bot.get_cog("VoiceTimers"):
+            await interaction.response.send_message("Fitur durasi tidak aktif (cog VoiceTimers tidak dimuat).", ephemeral=True)
+            return False, None
+        return True, delta
+
+    async def _schedule_expiry(self, interaction: discord.Interaction, member: discord.Member, action: str, delta: typing.Optional[datetime.timedelta], reason: typing.Optional[str]) -> str:
+        """Menjadwalkan pembatalan otomatis; mengembalikan teks tambahan untuk pesan konfirmasi."""
+        timers = self.bot.get_cog("VoiceTimers")
+        if not timers:
+            return ""
+        if delta is None:
+            await timers.cancel(interaction.guild_id, member.id, action)
+            return ""
+        due_at = await timers.schedule(interaction.guild_id, member.id, action, delta, interaction.user.id, reason)
+        return f" Berakhir <t:{int(due_at)}:R>."
+
+    async def _cancel_expiry(self, interaction: discord.Interaction, member: discord.Member, action: str):
+        timers = self.bot.get_cog("VoiceTimers")
+        if timers:
+            await timers.cancel(interaction.guild_id, member.id, action)
+
+    async def _snapshot(self, interaction: discord.Interaction, operation: str, members: typing.Iterable[discord.Member], dest_channel_id: typing.Optional[int], reason: typing.Optional[str]) -> str:
+        """Menyimpan snapshot sebelum operasi bulk; mengembalikan petunjuk /undo untuk pesan hasil."""
+        snapshots = self.bot.get_cog("VoiceSnapshots")
+        if not snapshots:
+            return ""
+        try:
+            snapshot_id = await snapshots.record(interaction.guild_id, interaction.user.id, operation, members, dest_channel_id, reason)
+        except Exception as e:
+            print(f"ERROR: Gagal menyimpan snapshot voice: {e}")
+            return ""
+        return f"\n↩️ Batalkan dengan `/undo snapshot:{snapshot_id}`" if snapshot_id else ""
+
+    async def _select_members(self, interaction: discord.Interaction, selector: typing.Optional[str]) -> typing.Optional[typing.List[discord.Member]]:
+        """Evaluasi selector lewat MemberIndex. None bila gagal (pesan error sudah dikirim)."""
+        if not selector:
+            return []
+        index = self.bot.get_cog("MemberIndex")
+        if not index:
+            await interaction.followup.send("Selector tidak aktif (cog MemberIndex tidak dimuat).", ephemeral=True)
+            return None
+        try:
+            return index.select(interaction.guild, selector)
+        except SelectorError as e:
+            await interaction.followup.send(f"Selector tidak valid: {e}", ephemeral=True)
+            return None
+
+    async def _confirm_selection(self, interaction: discord.Interaction, members: typing.List[discord.Member], action_text: str) -> bool:
+        """Menampilkan preview jumlah member hasil selector dan menunggu konfirmasi."""
+        preview = ", ".join(m.display_name for m in members[:SELECTOR_PREVIEW_NAMES])
+        if len(members) > SELECTOR_PREVIEW_NAMES:
+            preview += f", … (+{len(members) - SELECTOR_PREVIEW_NAMES})"
+        view = ConfirmView(interaction.user.id)
+        msg = await interaction.followup.send(
+            f"🎯 Selector cocok dengan **{len(members)}** member yang akan {action_text}:\n{preview}\n\nLanjutkan?",
+            view=view, ephemeral=True, wait=True
+        )
+        await view.wait()
+        if not view.value:
+            await msg.edit(content="❎ Dibatalkan." if view.value is False else "⌛ Waktu konfirmasi habis.", view=None)
+            return False
+        await msg.edit(content=f"▶️ Menjalankan operasi untuk {len(members)} member…", view=None)
+        return True
+
+    async def _send_results(self, interaction: discord.Interaction, title: str, lines: typing.List[str], color: discord.Color):
+        """Mengirim detail per member: embed berhalaman, atau file bila terlalu banyak."""
+        if len(lines) > RESULT_FILE_THRESHOLD:
+            data = io.BytesIO("\n".join(lines).encode("utf-8"))
+            await interaction.followup.send(
+                f"📄 {title}: {len(lines)} baris terlampir.",
+                file=discord.File(data, filename="hasil.txt"),
+                ephemeral=True
+            )
+            return
+        pages = _paginate_lines(lines)
+        embeds = []
+        for i, page in enumerate(pages):
+            embed = discord.Embed(title=title, description=page, color=color)
+            embed.set_footer(text=f"Halaman {i + 1}/{len(pages)}")
+            embeds.append(embed)
+        kwargs = {}
+        if len(embeds) > 1:
+            async def render(page: int) -> discord.Embed:
+                return embeds[page]
+            kwargs["view"] = ResultPaginator(interaction.user.id, len(embeds), render)
+        await interaction.followup.send(embed=embeds[0], ephemeral=True, **kwargs)
+
+    async def begin_bulk(
+        self,
+        interaction: discord.Interaction,
+        signature: tuple,
+        label: str,
+        exclusive: typing.Iterable[tuple],
+        shared: typing.Iterable[tuple] = ()
+    ) -> typing.Optional[BulkOperation]:
+        """Mendaftarkan operasi bulk. None bila ditolak atau digabung dengan operasi identik (pesan sudah dikirim)."""
+        op, blocker = self.operations.acquire(interaction.guild_id, signature, label, exclusive, shared, interaction.user.id)
+        if op:
+            return op
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        if blocker is None:
+            await send(f"⚠️ Sudah ada {self.operations.max_per_guild} operasi bulk berjalan di server ini. Coba lagi setelah selesai.", ephemeral=True)
+        elif blocker.signature == signature:
+            if not interaction.response.is_done():
+                await interaction.response.defer(thinking=True, ephemeral=True)
+            await interaction.followup.send(f"🔁 Operasi yang sama sedang dijalankan oleh <@{blocker.actor_id}>. Permintaan ini digabung, menunggu hasilnya…", ephemeral=True)
+            summary = await blocker.wait()
+            await interaction.followup.send(f"🔁 Operasi gabungan selesai: {summary}", ephemeral=True)
+        else:
+            await send(f"⛔ Bentrok dengan operasi **{blocker.label}** oleh <@{blocker.actor_id}> yang masih berjalan pada channel/member yang sama. Coba lagi setelah selesai.", ephemeral=True)
+        return None
+
     def _can_connect(self, channel: discord.VoiceChannel, member: discord.Member) -> bool:
         perms = channel.permissions_for(member)
         return perms.view_channel and perms.connect
@@ -74,9 +538,7 @@ class VoiceModeration(commands.Cog):
         return None
 
     def _member_label(self, m: discord.Member) -> str:
-        disc = getattr(m, "discriminator", None)
-        uname = f"{m.name}#{disc}" if disc is not None else m.name
-        return f"{m.display_name} — {uname}"
+        return member_label(m)
 
     _MENTION_RE = re.compile(r"<@!?(\d+)>")
     _ID_RE = re.compile(r"^\s*(\d+)\s*$")
@@ -108,6 +570,21 @@ class VoiceModeration(commands.Cog):
         invoker = interaction.user
         cmd = interaction.data.get("name") if getattr(interaction, "data", None) else None
         choices: list[app_commands.Choice] = []
+        index = self.bot.get_cog("MemberIndex")
+        warm = index.warm_voice_members(guild) if index else None
+        if warm is not None:
+            # guild belum selesai di-chunk setelah restart: pakai label dari warm cache
+            for member_id, channel_id, label, mute, deaf in warm:
+                channel = guild.get_channel(channel_id)
+                if channel is None or not self._can_connect(channel, invoker):
+                    continue
+                if (cmd == "mute" and mute) or (cmd == "unmute" and not mute):
+                    continue
+                if (cmd == "deafen" and deaf) or (cmd == "undeafen" and not deaf):
+                    continue
+                if not current or current.lower() in label.lower():
+                    choices.append(app_commands.Choice(name=label[:100], value=f"<@{member_id}>"))
+            return choices[:25]
         for m in guild.members:
             if not (m.voice and m.voice.channel):
                 continue
@@ -327,11 +804,25 @@ class VoiceModeration(commands.Cog):
                 choices.append(app_commands.Choice(name=label, value=str(ch.id)))
         return choices[:25]
 
+    async def _selector_autocomplete(self, interaction: discord.Interaction, current: str) -> typing.List[app_commands.Choice]:
+        guild = interaction.guild
+        index = self.bot.get_cog("MemberIndex")
+        if not guild or not index or not current or len(current) > 100:
+            return []
+        try:
+            label = f"✔ {index.preview(guild, current)} member cocok: {current}"
+        except SelectorError as e:
+            label = f"⚠ {e}"
+        return [app_commands.Choice(name=label[:100], value=current)]
+
     # ---------- Commands (responses visible to all) ----------
     @app_commands.command(name="mute", description="Mute user")
-    @app_commands.describe(user="Pilih user", reason="Alasan")
+    @app_commands.describe(user="Pilih user", reason="Alasan", duration="Durasi (opsional), contoh: 30m, 2h, 1d")
     @app_commands.autocomplete(user=_voice_member_autocomplete)
-    async def mute(self, interaction: discord.Interaction, user: str, reason: typing.Optional[str] = None):
+    async def mute(self, interaction: discord.Interaction, user: str, reason: typing.Optional[str] = None, duration: typing.Optional[str] = None):
+        ok, delta = await self._resolve_duration(interaction, duration)
+        if not ok:
+            return
         ids = self._parse_user_ids_from_string(user)
         if not ids:
             await interaction.response.send_message("User tidak dapat di-mute.", ephemeral=True)
@@ -340,21 +831,21 @@ class VoiceModeration(commands.Cog):
         if not member or not member.voice or not member.voice.channel or getattr(member.voice, "mute", False):
             await interaction.response.send_message("User tidak dapat di-mute.", ephemeral=True)
             return
-        await member.edit(mute=True, reason=reason)
-        await interaction.response.send_message(f"✅ Berhasil mute {member.mention}.", ephemeral=True)
-        embed = discord.Embed(
-                title="🔇 SERVER MUTE",
-                description=f"**{member.mention}** telah dibisukan di Voice.",
-                color=discord.Color.red()
-                 )
-        if reason:
-                embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-                embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-                embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+        channel_id = member.voice.channel.id
+
+        async def finalize() -> str:
+            self._journal(interaction, "mute", member, channel_id, reason)
+            expiry_note = await self._schedule_expiry(interaction, member, "unmute", delta, reason)
+            return f"✅ Berhasil mute {member.mention}.{expiry_note}"
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Server Mute", f"Target: {member}\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.orange())
+        await self._run_single(
+            interaction, "mute",
+            lambda: edit_member(self.bot, member, mute=True, reason=reason),
+            lambda: bool(member.voice and member.voice.mute),
+            finalize,
+            self._action_embed(interaction, "🔇 SERVER MUTE", f"**{member.mention}** telah dibisukan di Voice.", discord.Color.red(), reason),
+            "Server Mute", f"Target: {member}\nBy: {interaction.user}\nReason: {reason or '—'}", discord.Color.orange()
+        )
 
     @app_commands.command(name="unmute", description="Unmute user")
     @app_commands.describe(user="Pilih user", reason="Alasan")
@@ -368,26 +859,29 @@ class VoiceModeration(commands.Cog):
         if not member or not member.voice or not member.voice.channel or not getattr(member.voice, "mute", False):
             await interaction.response.send_message("User tidak dapat di-unmute.", ephemeral=False)
             return
-        await member.edit(mute=False, reason=reason)
-        await interaction.response.send_message(f"🔊 Berhasil unmute {member.mention}.", ephemeral=True)
-        embed = discord.Embed(
-                title="🔊 SERVER UNMUTE",
-                description=f"**{member.mention}** mic telah diaktifkan.",
-                color=discord.Color.green()
-            )
-        if reason:
-            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+        channel_id = member.voice.channel.id
+
+        async def finalize() -> str:
+            self._journal(interaction, "unmute", member, channel_id, reason)
+            await self._cancel_expiry(interaction, member, "unmute")
+            return f"🔊 Berhasil unmute {member.mention}."
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Server Unmute", f"Target: {member} ({member.id})\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.green())
+        await self._run_single(
+            interaction, "unmute",
+            lambda: edit_member(self.bot, member, mute=False, reason=reason),
+            lambda: bool(member.voice and not member.voice.mute),
+            finalize,
+            self._action_embed(interaction, "🔊 SERVER UNMUTE", f"**{member.mention}** mic telah diaktifkan.", discord.Color.green(), reason),
+            "Server Unmute", f"Target: {member} ({member.id})\nBy: {interaction.user}\nReason: {reason or '—'}", discord.Color.green()
+        )
 
     @app_commands.command(name="deafen", description="Deafen user")
-    @app_commands.describe(user="Pilih user", reason="Alasan")
+    @app_commands.describe(user="Pilih user", reason="Alasan", duration="Durasi (opsional), contoh: 30m, 2h, 1d")
     @app_commands.autocomplete(user=_voice_member_autocomplete)
-    async def deafen(self, interaction: discord.Interaction, user: str, reason: typing.Optional[str] = None):
+    async def deafen(self, interaction: discord.Interaction, user: str, reason: typing.Optional[str] = None, duration: typing.Optional[str] = None):
+        ok, delta = await self._resolve_duration(interaction, duration)
+        if not ok:
+            return
         ids = self._parse_user_ids_from_string(user)
         if not ids:
             await interaction.response.send_message("User tidak dapat di-deafen.", ephemeral=False)
@@ -396,21 +890,21 @@ class VoiceModeration(commands.Cog):
         if not member or not member.voice or not member.voice.channel or getattr(member.voice, "deaf", False):
             await interaction.response.send_message("User tidak dapat di-deafen.", ephemeral=False)
             return
-        await member.edit(deafen=True, reason=reason)
-        await interaction.response.send_message(f"🔕 Berhasil deafen {member.mention}.", ephemeral=True)
-        embed = discord.Embed(
-                title="🔕 SERVER DEAFEN",
-                description=f"**{member.mention}** telah di-deafen.",
-                color=discord.Color.red()
-            )
-        if reason:
-            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+        channel_id = member.voice.channel.id
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Server Deafen", f"Target: {member} ({member.id})\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.orange())
+        async def finalize() -> str:
+            self._journal(interaction, "deafen", member, channel_id, reason)
+            expiry_note = await self._schedule_expiry(interaction, member, "undeafen", delta, reason)
+            return f"🔕 Berhasil deafen {member.mention}.{expiry_note}"
+
+        await self._run_single(
+            interaction, "deafen",
+            lambda: edit_member(self.bot, member, deafen=True, reason=reason),
+            lambda: bool(member.voice and member.voice.deaf),
+            finalize,
+            self._action_embed(interaction, "🔕 SERVER DEAFEN", f"**{member.mention}** telah di-deafen.", discord.Color.red(), reason),
+            "Server Deafen", f"Target: {member} ({member.id})\nBy: {interaction.user}\nReason: {reason or '—'}", discord.Color.orange()
+        )
 
     @app_commands.command(name="undeafen", description="Undeafen user")
     @app_commands.describe(user="Pilih user", reason="Alasan")
@@ -424,21 +918,22 @@ class VoiceModeration(commands.Cog):
         if not member or not member.voice or not member.voice.channel or not getattr(member.voice, "deaf", False):
             await interaction.response.send_message("Member tidak dapat di-undeafen.", ephemeral=False)
             return
-        await member.edit(deafen=False, reason=reason)
-        await interaction.response.send_message(f"🔔 Berhasil undeafen {member.mention}.", ephemeral=True)
-        embed = discord.Embed(
-                title="🔔 SERVER UNDEAFEN",
-                description=f"**{member.mention}** telah di-undeafen.",
-                color=discord.Color.green()
-            )
-        if reason:
-            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+        channel_id = member.voice.channel.id
+
+        async def finalize() -> str:
+            self._journal(interaction, "undeafen", member, channel_id, reason)
+            await self._cancel_expiry(interaction, member, "undeafen")
+            return f"🔔 Berhasil undeafen {member.mention}."
+
+        await self._run_single(
+            interaction, "undeafen",
+            lambda: edit_member(self.bot, member, deafen=False, reason=reason),
+            lambda: bool(member.voice and not member.voice.deaf),
+            finalize,
+            self._action_embed(interaction, "🔔 SERVER UNDEAFEN", f"**{member.mention}** telah di-undeafen.", discord.Color.green(), reason),
+            "Server Undeafen", f"Target: {member} ({member.id})\nBy: {interaction.user}\nReason: {reason or '—'}", discord.Color.green()
+        )
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Server Undeafen", f"Target: {member} ({member.id})\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.green())
     @app_commands.command(name="move", description="Pindahkan satu user ke channel lain")
     @app_commands.describe(user="Pilih user", destination="Pilih channel tujuan", reason="Alasan")
     @app_commands.autocomplete(user=_voice_member_autocomplete)
@@ -461,21 +956,22 @@ class VoiceModeration(commands.Cog):
             await interaction.response.send_message("Member sudah berada di channel tujuan.", ephemeral=True)
             return
         
-        await member.move_to(dest, reason=reason)
-        await interaction.response.send_message(f"✅ Berhasil memindahkan {member.mention} dari 🔊 {original_channel.name} ke 🔊 {dest.name}.", ephemeral=True)
-        embed = discord.Embed(
-            title="🚚 VOICE MOVE",
-            description=f"**{member.mention}** telah dipindahkan dari **<#{original_channel.id}>** ke **<#{dest.id}>**.",
-            color=discord.Color.blue()
-        )
-        if reason:
-            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+        async def finalize() -> str:
+            self._journal(interaction, "move", member, dest.id, reason)
+            return f"✅ Berhasil memindahkan {member.mention} dari 🔊 {original_channel.name} ke 🔊 {dest.name}."
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Voice Move", f"Target: {member}\n{original_channel.name} -> {dest.name}\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.blue())
+        await self._run_single(
+            interaction, "move",
+            lambda: move_member(self.bot, member, dest, reason=reason),
+            lambda: bool(member.voice and member.voice.channel and member.voice.channel.id == dest.id),
+            finalize,
+            self._action_embed(
+                interaction, "🚚 VOICE MOVE",
+                f"**{member.mention}** telah dipindahkan dari **<#{original_channel.id}>** ke **<#{dest.id}>**.",
+                discord.Color.blue(), reason
+            ),
+            "Voice Move", f"Target: {member}\n{original_channel.name} -> {dest.name}\nBy: {interaction.user}\nReason: {reason or '—'}", discord.Color.blue()
+        )
 
     @app_commands.command(name="movebulk", description="Pindahkan beberapa user sekaligus ke channel lain")
     @app_commands.describe(
@@ -485,8 +981,10 @@ class VoiceModeration(commands.Cog):
         user3="Pilih user ketiga (opsional)",
         user4="Pilih user keempat (opsional)",
         user5="Pilih user kelima (opsional)",
-        reason="Alasan"
+        reason="Alasan",
+        selector="Selector member, contoh: role:@Raiders and joined<10m and not name~mod*"
     )
+    @app_commands.autocomplete(selector=_selector_autocomplete)
     @app_commands.autocomplete(user1=_movebulk_users_autocomplete)
     @app_commands.autocomplete(user2=_movebulk_users_autocomplete)
     @app_commands.autocomplete(user3=_movebulk_users_autocomplete)
@@ -496,20 +994,26 @@ class VoiceModeration(commands.Cog):
     async def movebulk(
         self, 
         interaction: discord.Interaction, 
-        user1: str,
+        user1: typing.Optional[str] = None,
         destination: str = None,
         user2: typing.Optional[str] = None,
         user3: typing.Optional[str] = None,
         user4: typing.Optional[str] = None,
         user5: typing.Optional[str] = None,
-        reason: typing.Optional[str] = None
+        reason: typing.Optional[str] = None,
+        selector: typing.Optional[str] = None
     ):
         await interaction.response.defer(thinking=True, ephemeral=True)
         
         all_users = [u for u in [user1, user2, user3, user4, user5] if u]
-        combined = ", ".join(all_users)
+        combined = ", ".join(all_users + ([f"selector: {selector}"] if selector else []))
         
-        ids = self._parse_user_ids_from_string(combined)
+        ids = self._parse_user_ids_from_string(", ".join(all_users))
+        selected = await self._select_members(interaction, selector)
+        if selected is None:
+            return
+        seen = set(ids)
+        ids.extend(m.id for m in selected if m.id not in seen)
 
         valid_members = []
         original_channels = {}
@@ -527,7 +1031,7 @@ class VoiceModeration(commands.Cog):
             await interaction.followup.send("User tidak ditemukan atau tidak sedang di voice.", ephemeral=True)
             return
         
-        dest = interaction.guild.get_channel(int(destination))
+        dest = interaction.guild.get_channel(int(destination)) if destination else None
 
         if not isinstance(dest, discord.VoiceChannel):
             await interaction.followup.send("Channel tujuan tidak valid.", ephemeral=True)
@@ -537,43 +1041,68 @@ class VoiceModeration(commands.Cog):
                 await interaction.followup.send("Channel tidak dapat diakses oleh salah satu member yang dipilih.", ephemeral=True)
                 return
             
-        results_for_logs = []
-        results_for_display = []
-        moved_count = 0
-        for m in valid_members:
-            source_id = original_channels.get(m.id, (0, ))[0]
-            source_name = original_channels.get(m.id, ("ERROR: Unknown", ))[1]
+        if selector and not await self._confirm_selection(interaction, valid_members, f"dipindahkan ke <#{dest.id}>"):
+            return
+
+        op = await self.begin_bulk(
+            interaction,
+            ("movebulk", dest.id, tuple(sorted(m.id for m in valid_members))),
+            "movebulk",
+            exclusive=[("member", m.id) for m in valid_members],
+            shared=[("channel", dest.id)] + [("channel", m.voice.channel.id) for m in valid_members]
+        )
+        if not op:
+            return
         try:
-            if m.voice.channel.id == dest.id:
-                results_for_logs.append(f"SKIP: {m.display_name} sudah berada di 🔊 {dest.name}")
-                results_for_display.append(f"SKIP: {m.display_name} sudah berada di <#{dest.id}>")
+            undo_hint = await self._snapshot(interaction, "movebulk", valid_members, dest.id, reason)
+            results_for_logs = []
+            results_for_display = []
+            moved_count = 0
+            progress = ProgressReporter(interaction, "Memindahkan user", len(valid_members))
+            await progress.start()
+            for m in valid_members:
+                source_id = original_channels.get(m.id, (0, ))[0]
+                source_name = original_channels.get(m.id, ("ERROR: Unknown", ))[1]
+                try:
+                    if m.voice.channel.id == dest.id:
+                        results_for_logs.append(f"SKIP: {m.display_name} sudah berada di 🔊 {dest.name}")
+                        results_for_display.append(f"SKIP: {m.display_name} sudah berada di <#{dest.id}>")
+                        await progress.tick(None)
+                        continue
 
-            await m.move_to(dest, reason=reason)
-            moved_count += 1
+                    await move_member(self.bot, m, dest, reason=reason)
+                    moved_count += 1
+                    self._journal(interaction, "move", m, dest.id, reason)
 
-            results_for_logs.append(f"{m.display_name} dari 🔊 {source_name}")
-            results_for_display.append(f"{m.display_name} dari <#{source_id}>")
-        except Exception as e:
-            results_for_logs.append(f"{m.display_name} ({source_name}) -> Error: {e}")
-            results_for_display.append(f"{m.display_name} (<#{m.voice.channel.id}>) -> Error: {e}")
-            
-        await interaction.followup.send(
-            f"✅ {moved_count} user berhasil dipindahkan. Detail:\n\n" + "\n".join(results_for_logs),
-            ephemeral=True
-        )
-        embed = discord.Embed(
-            title="🚚 VOICE MOVE",
-            description=f"**{moved_count}** user telah dipindahkan ke **<#{dest.id}>**: \n\n" + "\n".join(results_for_display),
-            color=discord.Color.blue()
-        )
-        if reason:
-            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+                    results_for_logs.append(f"{m.display_name} dari 🔊 {source_name}")
+                    results_for_display.append(f"{m.display_name} dari <#{source_id}>")
+                    await progress.tick(True)
+                except Exception as e:
+                    results_for_logs.append(f"{m.display_name} ({source_name}) -> Error: {e}")
+                    results_for_display.append(f"{m.display_name} (<#{source_id}>) -> Error: {e}")
+                    await progress.tick(False)
+
+            op.summary = f"✅ {moved_count} user berhasil dipindahkan.{undo_hint}"
+            await progress.finish(op.summary)
+            await self._send_results(interaction, "🚚 Detail Move Bulk", results_for_logs, discord.Color.blue())
+            embed = discord.Embed(
+                title="🚚 VOICE MOVE",
+                description=f"**{moved_count}** user telah dipindahkan ke **<#{dest.id}>**: \n\n" + _truncate_lines(results_for_display),
+                color=discord.Color.blue()
+            )
+            if reason:
+                embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
+                embed.add_field(name="Alasan", value=reason, inline=True)
+            else:
+                embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Voice Bulk Move", f"Users: {combined}\nDestination: {dest.name}\nResults:\n\n" + "\n".join(results_for_logs) + f"\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.blue())
+            await send_message(self.bot, RESPONSE, interaction.channel, embed=embed)
+            await self.log_action(interaction, "Voice Bulk Move", f"Users: {combined}\nDestination: {dest.name}\nResults:\n\n" + _truncate_lines(results_for_logs) + f"\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.blue())
+        except Exception:
+            op.summary = "gagal (error)"
+            raise
+        finally:
+            self.operations.release(op)
 
     @app_commands.command(name="movechannel", description="Pindahkan semua user di voice channel sekaligus")
     @app_commands.describe(source="Channel asal", destination="Channel tujuan", reason="Alasan")
@@ -592,40 +1121,62 @@ class VoiceModeration(commands.Cog):
             if not self._can_connect(dest, m):
                 await interaction.response.send_message("Channel tujuan tidak dapat diakses oleh semua member di source.", ephemeral=True)
                 return
-        await interaction.response.defer(thinking=True, ephemeral=True)
+        op = await self.begin_bulk(
+            interaction,
+            ("movechannel", src.id, dest.id),
+            f"movechannel {src.name} → {dest.name}",
+            exclusive=[("channel", src.id)] + [("member", m.id) for m in src.members],
+            shared=[("channel", dest.id)]
+        )
+        if not op:
+            return
+        try:
+            await interaction.response.defer(thinking=True, ephemeral=True)
 
-        results= []
-        moved_count = 0
-        for m in list(src.members):
-            try:
-                if m.voice.channel.id == dest.id:
-                    results.append(f"SKIP: {m.display_name} sudah berada di {dest.name}")
-                    continue
+            members = list(src.members)
+            undo_hint = await self._snapshot(interaction, "movechannel", members, dest.id, reason)
+            results= []
+            moved_count = 0
+            progress = ProgressReporter(interaction, f"Memindahkan {src.name} → {dest.name}", len(members))
+            await progress.start()
+            for m in members:
+                try:
+                    if m.voice.channel.id == dest.id:
+                        results.append(f"SKIP: {m.display_name} sudah berada di {dest.name}")
+                        await progress.tick(None)
+                        continue
                 
-                moved_count += 1
+                    await move_member(self.bot, m, dest, reason=reason)
+                    moved_count += 1
+                    self._journal(interaction, "move", m, dest.id, reason)
+                    results.append(f"{m.display_name}")
+                    await progress.tick(True)
+                except Exception as e:
+                    results.append(f"❌ {m.display_name} ({src.name}) -> Error: {e}")
+                    await progress.tick(False)
 
-                await m.move_to(dest, reason=reason)
-                results(f"{m.display_name}")
-            except Exception as e:
-                results.append(f"❌ {m.display_name} ({src.name}) -> Error: {e}")
-   
-        await interaction.followup.send(
-            f"✅ {moved_count} user berhasil dipindahkan. Detail:\n\n" + "\n".join(results),
-            ephemeral=True
-        )
-        embed = discord.Embed(
-            title="🚚 VOICE MOVE",
-            description=f"**{moved_count}** user telah dipindahkan dari **<#{src.id}>** ke **<#{dest.id}>**: \n\n" + "\n".join(results),
-            color=discord.Color.blue()
-        )
-        if reason:
-            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+            op.summary = f"✅ {moved_count} user berhasil dipindahkan.{undo_hint}"
+            await progress.finish(op.summary)
+            await self._send_results(interaction, "🚚 Detail Move Channel", results, discord.Color.blue())
+            embed = discord.Embed(
+                title="🚚 VOICE MOVE",
+                description=f"**{moved_count}** user telah dipindahkan dari **<#{src.id}>** ke **<#{dest.id}>**: \n\n" + _truncate_lines(results),
+                color=discord.Color.blue()
+            )
+            if reason:
+                embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
+                embed.add_field(name="Alasan", value=reason, inline=True)
+            else:
+                embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+
+            await send_message(self.bot, RESPONSE, interaction.channel, embed=embed)
+            await self.log_action(interaction, "Voice Channel Move", f"Source: {src.name}\nDestination: {dest.name}\nResults:\n\n" + _truncate_lines(results) + f"\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.blue())
+        except Exception:
+            op.summary = "gagal (error)"
+            raise
+        finally:
+            self.operations.release(op)
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Voice Channel Move", f"Source: {src.name}\nDestination: {dest.name}\nResults:\n\n" + "\n".join(results) + f"\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.blue())
     @app_commands.command(name="dc", description="Disconnect user dari voice")
     @app_commands.describe(user="Pilih user", reason="Alasan")
     @app_commands.autocomplete(user=_voice_member_autocomplete)
@@ -641,21 +1192,18 @@ class VoiceModeration(commands.Cog):
         
         original_channel_id = member.voice.channel.id
 
-        await member.move_to(None, reason=reason)
-        await interaction.response.send_message(f"✅ Berhasil disconnect {member.mention}.", ephemeral=True)
-        embed = discord.Embed(
-            title="🔌 VOICE Disconnect",
-            description=f"**{member.mention}** telah di-disconnect dari <#{original_channel_id}>.",
-            color=discord.Color.red()
-        )
-        if reason:
-            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+        async def finalize() -> str:
+            self._journal(interaction, "disconnect", member, original_channel_id, reason)
+            return f"✅ Berhasil disconnect {member.mention}."
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Voice Disconnect", f"Target: {member} ({member.id})\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.red())
+        await self._run_single(
+            interaction, "dc",
+            lambda: move_member(self.bot, member, None, reason=reason),
+            lambda: not (member.voice and member.voice.channel),
+            finalize,
+            self._action_embed(interaction, "🔌 VOICE Disconnect", f"**{member.mention}** telah di-disconnect dari <#{original_channel_id}>.", discord.Color.red(), reason),
+            "Voice Disconnect", f"Target: {member} ({member.id})\nBy: {interaction.user}\nReason: {reason or '—'}", discord.Color.red()
+        )
 
     @app_commands.command(name="dcbulk", description="Disconnect beberapa user sekaligus")
     @app_commands.describe(
@@ -664,8 +1212,10 @@ class VoiceModeration(commands.Cog):
         user3="Pilih user ketiga (opsional)",
         user4="Pilih user keempat (opsional)",
         user5="Pilih user kelima (opsional)",
-        reason="Alasan"
+        reason="Alasan",
+        selector="Selector member, contoh: channel:<#id> and voice<5m"
     )
+    @app_commands.autocomplete(selector=_selector_autocomplete)
     @app_commands.autocomplete(user1=_dcbulk_users_autocomplete)
     @app_commands.autocomplete(user2=_dcbulk_users_autocomplete)
     @app_commands.autocomplete(user3=_dcbulk_users_autocomplete)
@@ -674,55 +1224,89 @@ class VoiceModeration(commands.Cog):
     async def dcbulk(
         self, 
         interaction: discord.Interaction, 
-        user1: str,
+        user1: typing.Optional[str] = None,
         reason: typing.Optional[str] = None,
         user2: typing.Optional[str] = None,
         user3: typing.Optional[str] = None,
         user4: typing.Optional[str] = None,
-        user5: typing.Optional[str] = None
+        user5: typing.Optional[str] = None,
+        selector: typing.Optional[str] = None
     ):
         await interaction.response.defer(thinking=True)
         
         all_users = [u for u in [user1, user2, user3, user4, user5] if u]
-        combined = ", ".join(all_users)
+        combined = ", ".join(all_users + ([f"selector: {selector}"] if selector else []))
         
-        ids = self._parse_user_ids_from_string(combined)
-        results = []
-        disconnected_count = 0
-        for uid in ids:
-            member = interaction.guild.get_member(uid)
-            if not member:
-                results.append(f"{uid} -> not in guild")
-                continue
-            if not member.voice or not member.voice.channel:
-                results.append(f"{member} -> not in voice")
-                continue
-            try:
-                await member.move_to(None, reason=reason)
+        ids = self._parse_user_ids_from_string(", ".join(all_users))
+        selected = await self._select_members(interaction, selector)
+        if selected is None:
+            return
+        seen = set(ids)
+        ids.extend(m.id for m in selected if m.id not in seen)
+        if not ids:
+            await interaction.followup.send("Tidak ada user yang dipilih.", ephemeral=True)
+            return
+        if selector:
+            in_voice = [m for m in map(interaction.guild.get_member, ids) if m and m.voice and m.voice.channel]
+            if not await self._confirm_selection(interaction, in_voice, "di-disconnect"):
+                return
+        op = await self.begin_bulk(
+            interaction,
+            ("dcbulk", tuple(sorted(ids))),
+            "dcbulk",
+            exclusive=[("member", uid) for uid in ids]
+        )
+        if not op:
+            return
+        try:
+            results = []
+            disconnected_count = 0
+            progress = ProgressReporter(interaction, "Disconnect user", len(ids))
+            await progress.start()
+            for uid in ids:
+                member = interaction.guild.get_member(uid)
+                if not member:
+                    results.append(f"{uid} -> not in guild")
+                    await progress.tick(None)
+                    continue
+                if not member.voice or not member.voice.channel:
+                    results.append(f"{member} -> not in voice")
+                    await progress.tick(None)
+                    continue
+                try:
+                    source_id = member.voice.channel.id
+                    await move_member(self.bot, member, None, reason=reason)
 
-                disconnected_count += 1
+                    disconnected_count += 1
+                    self._journal(interaction, "disconnect", member, source_id, reason)
 
-                results.append(f"{member}")
-            except Exception as e:
-                results.append(f"{member} -> error: {e}")
-        
-        await interaction.followup.send(
-            f"✅ {disconnected_count} user berhasil di-disconnect. Detail:\n\n" + "\n".join(results),
-            ephemeral=True
-        )
-        embed = discord.Embed(
-            title="🔌 VOICE DISCONNECT",
-            description=f"**{disconnected_count}** user telah di-disconnect: \n\n" + "\n".join(results),
-            color=discord.Color.red()
-        )
-        if reason:
-            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+                    results.append(f"{member}")
+                    await progress.tick(True)
+                except Exception as e:
+                    results.append(f"{member} -> error: {e}")
+                    await progress.tick(False)
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Voice Bulk Disconnect", f"Users: {combined}\nResults:\n\n" + "\n".join(results) + f"\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.red())
+            op.summary = f"✅ {disconnected_count} user berhasil di-disconnect."
+            await progress.finish(op.summary)
+            await self._send_results(interaction, "🔌 Detail Disconnect Bulk", results, discord.Color.red())
+            embed = discord.Embed(
+                title="🔌 VOICE DISCONNECT",
+                description=f"**{disconnected_count}** user telah di-disconnect: \n\n" + _truncate_lines(results),
+                color=discord.Color.red()
+            )
+            if reason:
+                embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
+                embed.add_field(name="Alasan", value=reason, inline=True)
+            else:
+                embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+
+            await send_message(self.bot, RESPONSE, interaction.channel, embed=embed)
+            await self.log_action(interaction, "Voice Bulk Disconnect", f"Users: {combined}\nResults:\n\n" + _truncate_lines(results) + f"\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.red())
+        except Exception:
+            op.summary = "gagal (error)"
+            raise
+        finally:
+            self.operations.release(op)
 
     @app_commands.command(name="dcchannel", description="Disconnect semua anggota dari voice channel yang dipilih")
     @app_commands.describe(channel="Pilih channel", reason="Alasan")
@@ -732,36 +1316,81 @@ class VoiceModeration(commands.Cog):
         if not isinstance(ch, discord.VoiceChannel) or len(ch.members) == 0:
             await interaction.response.send_message("Channel tidak valid atau tidak memiliki anggota.", ephemeral=True)
             return
-        await interaction.response.defer(thinking=True, ephemeral=True)
-        results = []
-        disconnected_count = 0
-        for m in list(ch.members):
-            try:
-                await m.move_to(None, reason=reason)
+        op = await self.begin_bulk(
+            interaction,
+            ("dcchannel", ch.id),
+            f"dcchannel {ch.name}",
+            exclusive=[("channel", ch.id)] + [("member", m.id) for m in ch.members]
+        )
+        if not op:
+            return
+        try:
+            await interaction.response.defer(thinking=True, ephemeral=True)
+            members = list(ch.members)
+            results = []
+            disconnected_count = 0
+            progress = ProgressReporter(interaction, f"Disconnect {ch.name}", len(members))
+            await progress.start()
+            for m in members:
+                try:
+                    await move_member(self.bot, m, None, reason=reason)
 
-                disconnected_count += 1
+                    disconnected_count += 1
+                    self._journal(interaction, "disconnect", m, ch.id, reason)
 
-                results.append(f"{m}")
-            except Exception as e:
-                results.append(f"{m} -> error: {e}")
+                    results.append(f"{m}")
+                    await progress.tick(True)
+                except Exception as e:
+                    results.append(f"{m} -> error: {e}")
+                    await progress.tick(False)
 
-        await interaction.followup.send(
-            f"✅ berhasil disconnect {disconnected_count}. Detail:\n\n" + "\n".join(results),
-            ephemeral=True
-        )
-        embed = discord.Embed(
-            title="🔌 VOICE DISCONNECT",
-            description=f"**{disconnected_count}** user telah di-disconnect: \n\n" + "\n".join(results),
-            color=discord.Color.red()
-        )
-        if reason:
-            embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Alasan", value=reason, inline=True)
-        else:
-            embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
+            op.summary = f"✅ berhasil disconnect {disconnected_count}."
+            await progress.finish(op.summary)
+            await self._send_results(interaction, "🔌 Detail Disconnect Channel", results, discord.Color.red())
+            embed = discord.Embed(
+                title="🔌 VOICE DISCONNECT",
+                description=f"**{disconnected_count}** user telah di-disconnect: \n\n" + _truncate_lines(results),
+                color=discord.Color.red()
+            )
+            if reason:
+                embed.add_field(name="Oleh", value=interaction.user.mention, inline=True)
+                embed.add_field(name="Alasan", value=reason, inline=True)
+            else:
+                embed.add_field(name="\u200b", value=f"**Oleh:** {interaction.user.mention}",inline=True)
 
-        await interaction.channel.send(embed=embed)
-        await self.log_action(interaction, "Voice Bulk Disconnect", f"Channel: 🔊 {ch.name}\nResults:\n\n" + "\n".join(results) + f"\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.red())
+            await send_message(self.bot, RESPONSE, interaction.channel, embed=embed)
+            await self.log_action(interaction, "Voice Bulk Disconnect", f"Channel: 🔊 {ch.name}\nResults:\n\n" + _truncate_lines(results) + f"\nBy: {interaction.user}\nReason: {reason or '—'}", color=discord.Color.red())
+        except Exception:
+            op.summary = "gagal (error)"
+            raise
+        finally:
+            self.operations.release(op)
+
+    @app_commands.command(name="voicecmdstats", description="Latensi per tahap perintah voice single-target")
+    @app_commands.default_permissions(administrator=True)
+    async def voicecmdstats(self, interaction: discord.Interaction):
+        embed = discord.Embed(title="⏱️ Pipeline Perintah Voice", color=discord.Color.blurple())
+        for stage, label in PIPELINE_STAGES:
+            count, p50, p95, worst = self.timings.summary(stage)
+            embed.add_field(
+                name=label,
+                value=f"p50/p95: {p50 * 1000:.0f}/{p95 * 1000:.0f} ms\nMaks: {worst * 1000:.0f} ms • n={count}",
+                inline=True
+            )
+        c = self.timings.counters
+        commands_run = " • ".join(f"{name}: {c[name]}" for name in ("mute", "unmute", "deafen", "undeafen", "move", "dc"))
+        embed.add_field(
+            name="Kejadian",
+            value=(
+                f"{commands_run}\n"
+                f"Defer: {c['deferred']} (lewat {ACK_BUDGET_SECONDS * 1000:.0f} ms, {c['deferred_backlog']} karena antrean) • "
+                f"Retry: {c['retries']} • Sudah diterapkan sebelum retry: {c['applied_before_retry']} • Timeout: {c['timeouts']} • Gagal: {c['failed']}\n"
+                f"Ack gagal: {c['ack_failed']} • Respons gagal: {c['respond_failed']} • "
+                f"Pengumuman gagal: {c['announce_failed']} • Log gagal: {c['log_failed']} • Background: {len(self._background)}"
+            ),
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(VoiceModeration(bot))
\ No newline at end of file
@@ -0,0 +1,298 @@
+# cogs/voice_snapshots.py
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from .outbound import dispatch, gather_bounded, route, ENFORCEMENT
+from .sqlite_store import SQLiteStore
+import asyncio
+import datetime
+import time
+import typing
+
+
+SNAPSHOT_DB_FILE = "voice_snapshots.db"
+SNAPSHOT_RETENTION_DAYS = 7
+UNDO_CONCURRENCY = 8
+# Sisakan ruang untuk header di deskripsi embed log (maks 4096).
+LOG_BODY_CHARS = 3500
+
+# Hanya operasi move yang bisa di-undo; bot tidak bisa menarik user yang di-disconnect kembali ke voice.
+OPERATION_LABELS = {
+    "movebulk": "🚚 Move bulk",
+    "movechannel": "🚚 Move channel",
+}
+# snapshot disconnect lama (sebelum dibatasi ke move) tetap diabaikan sampai terhapus prune
+_UNDOABLE = "operation IN ('movebulk', 'movechannel')"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id        INTEGER NOT NULL,
+    actor_id        INTEGER NOT NULL,
+    operation       TEXT NOT NULL,
+    dest_channel_id INTEGER,
+    reason          TEXT,
+    member_count    INTEGER NOT NULL,
+    created_at      REAL NOT NULL,
+    undone_at       REAL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_guild_time ON snapshots (guild_id, created_at);
+CREATE TABLE IF NOT EXISTS snapshot_members (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    member_id   INTEGER NOT NULL,
+    channel_id  INTEGER NOT NULL,
+    mute        INTEGER NOT NULL,
+    deaf        INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, member_id)
+);
+"""
+
+# --- HELPER FUNCTIONS (SQLITE) ---
+
+class SnapshotStore(SQLiteStore):
+    """Snapshot posisi voice sebelum operasi bulk, untuk dipakai /undo."""
+
+    def __init__(self, path: str = SNAPSHOT_DB_FILE):
+        super().__init__(path, _SCHEMA, foreign_keys=True)
+
+    def insert(self, header: tuple, members: typing.List[tuple]) -> int:
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO snapshots (guild_id, actor_id, operation, dest_channel_id, reason, member_count, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                header
+            )
+            snapshot_id = cur.lastrowid
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO snapshot_members (snapshot_id, member_id, channel_id, mute, deaf) VALUES (?, ?, ?, ?, ?)",
+                [(snapshot_id,) + m for m in members]
+            )
+        return snapshot_id
+
+    def recent(self, guild_id: int, limit: int) -> typing.List[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, operation, member_count, created_at FROM snapshots "
+                f"WHERE guild_id = ? AND undone_at IS NULL AND {_UNDOABLE} ORDER BY created_at DESC LIMIT ?",
+                (guild_id, limit)
+            ).fetchall()
+
+    def load(self, guild_id: int, snapshot_id: typing.Optional[int]) -> typing.Optional[typing.Tuple[tuple, typing.List[tuple]]]:
+        with self._lock:
+            if snapshot_id is None:
+                header = self._conn.execute(
+                    "SELECT id, actor_id, operation, dest_channel_id, reason, created_at FROM snapshots "
+                    f"WHERE guild_id = ? AND undone_at IS NULL AND {_UNDOABLE} ORDER BY created_at DESC LIMIT 1",
+                    (guild_id,)
+                ).fetchone()
+            else:
+                header = self._conn.execute(
+                    "SELECT id, actor_id, operation, dest_channel_id, reason, created_at FROM snapshots "
+                    f"WHERE guild_id = ? AND id = ? AND undone_at IS NULL AND {_UNDOABLE}",
+                    (guild_id, snapshot_id)
+                ).fetchone()
+            if not header:
+                return None
+            members = self._conn.execute(
+                "SELECT member_id, channel_id FROM snapshot_members WHERE snapshot_id = ?",
+                (header[0],)
+            ).fetchall()
+        return header, members
+
+    def mark_undone(self, snapshot_id: int):
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE snapshots SET undone_at = ? WHERE id = ?", (time.time(), snapshot_id))
+
+    def prune(self, before: float) -> int:
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM snapshots WHERE created_at < ?", (before,)).rowcount
+
+# --- COG CLASS ---
+
+class VoiceSnapshots(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.store = SnapshotStore()
+        self.prune_task.start()
+
+    def cog_unload(self):
+        self.prune_task.cancel()
+        self.store.close()
+
+    async def record(
+        self,
+        guild_id: int,
+        actor_id: int,
+        operation: str,
+        members: typing.Iterable[discord.Member],
+        dest_channel_id: typing.Optional[int],
+        reason: typing.Optional[str]
+    ) -> typing.Optional[int]:
+        """Menyimpan posisi voice member sebelum operasi bulk. Mengembalikan ID snapshot."""
+        rows = [
+            (m.id, m.voice.channel.id, int(bool(m.voice.mute)), int(bool(m.voice.deaf)))
+            for m in members if m.voice and m.voice.channel
+        ]
+        if not rows:
+            return None
+        header = (guild_id, actor_id, operation, dest_channel_id, reason, len(rows), time.time())
+        return await asyncio.to_thread(self.store.insert, header, rows)
+
+    async def _restore_member(
+        self,
+        guild: discord.Guild,
+        dest_channel_id: typing.Optional[int],
+        row: tuple,
+        reason: str
+    ) -> typing.Tuple[bool, str]:
+        member_id, channel_id = row
+        member = guild.get_member(member_id)
+        if not member:
+            return False, f"<@{member_id}> -> SKIP: sudah keluar dari server"
+        current = member.voice.channel if member.voice else None
+        if current is None:
+            return False, f"{member.display_name} -> SKIP: tidak di voice"
+        if current.id == channel_id:
+            return False, f"{member.display_name} -> SKIP: sudah di <#{channel_id}>"
+        if dest_channel_id and current.id != dest_channel_id:
+            return False, f"{member.display_name} -> SKIP: pindah sendiri ke <#{current.id}>"
+        original = guild.get_channel(channel_id)
+        if not isinstance(original, discord.VoiceChannel):
+            return False, f"{member.display_name} -> SKIP: channel asal sudah tidak ada"
+
+        # hanya posisi channel yang dikembalikan; move tidak mengubah mute/deafen, jadi
+        # mute/deafen yang diberikan setelah operasi bulk tidak boleh ikut dibatalkan
+        try:
+            await dispatch(
+                self.bot, ENFORCEMENT, route("member.edit", guild.id), guild.id,
+                lambda: member.edit(voice_channel=original, reason=reason)
+            )
+        except Exception as e:
+            return False, f"{member.display_name} -> Error: {e}"
+        return True, f"{member.display_name} -> <#{channel_id}>"
+
+    # --- BACKGROUND TASK: Prune ---
+    @tasks.loop(hours=6)
+    async def prune_task(self):
+        before = (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=SNAPSHOT_RETENTION_DAYS)).timestamp()
+        try:
+            await asyncio.to_thread(self.store.prune, before)
+        except Exception as e:
+            print(f"ERROR: Gagal membersihkan snapshot voice: {e}")
+
+    # --- COMMAND: /undo ---
+    async def _snapshot_autocomplete(self, interaction: discord.Interaction, current: str) -> typing.List[app_commands.Choice]:
+        rows = await asyncio.to_thread(self.store.recent, interaction.guild_id, 25)
+        now = time.time()
+        choices = []
+        for snapshot_id, operation, member_count, created_at in rows:
+            minutes = int((now - created_at) // 60)
+            label = f"#{snapshot_id} {OPERATION_LABELS.get(operation, operation)} • {member_count} user • {minutes} menit lalu"
+            if not current or current.lower() in label.lower():
+                choices.append(app_commands.Choice(name=label, value=str(snapshot_id)))
+        return choices[:25]
+
+    @app_commands.command(name="undo", description="Kembalikan posisi voice sebelum movebulk/movechannel")
+    @app_commands.describe(snapshot="Snapshot yang ingin dikembalikan (default: terakhir)", reason="Alasan")
+    @app_commands.autocomplete(snapshot=_snapshot_autocomplete)
+    @app_commands.default_permissions(move_members=True)
+    async def undo(self, interaction: discord.Interaction, snapshot: typing.Optional[str] = None, reason: typing.Optional[str] = None):
+        snapshot_id = None
+        if snapshot:
+            try:
+                snapshot_id = int(snapshot.lstrip("#"))
+            except ValueError:
+                await interaction.response.send_message("ID snapshot tidak valid.", ephemeral=True)
+                return
+
+        loaded = await asyncio.to_thread(self.store.load, interaction.guild_id, snapshot_id)
+        if not loaded:
+            await interaction.response.send_message("Tidak ada snapshot yang bisa dikembalikan.", ephemeral=True)
+            return
+        (snapshot_id, actor_id, operation, dest_channel_id, snap_reason, created_at), rows = loaded
+
+        voice = self.bot.get_cog("VoiceModeration")
+        op = None
+        if voice:
+            op = await voice.begin_bulk(
+                interaction,
+                ("undo", snapshot_id),
+                f"undo #{snapshot_id}",
+                exclusive=[("member", row[0]) for row in rows],
+                shared=[("channel", row[1]) for row in rows] + ([("channel", dest_channel_id)] if dest_channel_id else [])
+            )
+            if not op:
+                return
+        try:
+            await self._replay(interaction, snapshot_id, actor_id, operation, dest_channel_id, created_at, rows, reason, op)
+        finally:
+            if op:
+                voice.operations.release(op)
+
+    async def _replay(
+        self,
+        interaction: discord.Interaction,
+        snapshot_id: int,
+        actor_id: int,
+        operation: str,
+        dest_channel_id: typing.Optional[int],
+        created_at: float,
+        rows: typing.List[tuple],
+        reason: typing.Optional[str],
+        op: typing.Any
+    ):
+        if not interaction.response.is_done():
+            await interaction.response.defer(thinking=True, ephemeral=True)
+
+        guild = interaction.guild
+        undo_reason = f"Undo #{snapshot_id} oleh {interaction.user}" + (f": {reason}" if reason else "")
+        outcomes = await gather_bounded([
+            (lambda row=row: self._restore_member(guild, dest_channel_id, row, undo_reason)) for row in rows
+        ], UNDO_CONCURRENCY)
+
+        results = []
+        restored = 0
+        history = self.bot.get_cog("ModHistory")
+        for row, outcome in zip(rows, outcomes):
+            if isinstance(outcome, Exception):
+                results.append(f"<@{row[0]}> -> Error: {outcome}")
+                continue
+            ok, line = outcome
+            results.append(line)
+            if ok:
+                restored += 1
+                if history:
+                    history.record(guild.id, interaction.user.id, row[0], "move", row[1], undo_reason)
+        # snapshot tetap bisa di-undo ulang bila tidak ada satu pun member yang berhasil dikembalikan
+        if restored:
+            await asyncio.to_thread(self.store.mark_undone, snapshot_id)
+
+        header = (
+            f"↩️ Undo #{snapshot_id} ({OPERATION_LABELS.get(operation, operation)}, oleh <@{actor_id}> <t:{int(created_at)}:R>): "
+            f"**{restored}/{len(rows)}** user dikembalikan."
+        )
+        body = "\n".join(results)
+        if len(body) > 4096:
+            body = body[:4000] + f"\n… dan {body[4000:].count(chr(10)) + 1} baris lainnya"
+        embed = discord.Embed(description=body, color=discord.Color.blue())
+        if op:
+            op.summary = f"{restored}/{len(rows)} user dikembalikan"
+        await interaction.followup.send(header, embed=embed, ephemeral=True)
+
+        voice = self.bot.get_cog("VoiceModeration")
+        if voice:
+            log_body = "\n".join(results)
+            if len(log_body) > LOG_BODY_CHARS:
+                log_body = log_body[:LOG_BODY_CHARS] + f"\n… dan {log_body[LOG_BODY_CHARS:].count(chr(10)) + 1} baris lainnya"
+            await voice.log_action(
+                interaction, "Voice Undo",
+                f"Snapshot: #{snapshot_id} ({OPERATION_LABELS.get(operation, operation)} oleh <@{actor_id}>)\n"
+                f"Restored: {restored}/{len(rows)}\nResults:\n\n" + log_body +
+                f"\nBy: {interaction.user}\nReason: {reason or '—'}",
+                color=discord.Color.blue()
+            )
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(VoiceSnapshots(bot))
@@ -0,0 +1,344 @@
+# cogs/voice_stats.py
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from .sqlite_store import SQLiteStore
+import array
+import asyncio
+import collections
+import time
+import typing
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+VOICE_STATS_DB_FILE = "voice_stats.db"
+BUCKET_SECONDS = 300
+RING_BUCKETS = 7 * 24 * 3600 // BUCKET_SECONDS
+# Channel yang aktif di memori; sisanya hanya ada di SQLite sampai tersentuh lagi.
+MAX_CHANNELS_IN_MEMORY = 1000
+FLUSH_MINUTES = 5
+TOP_CHANNELS = 5
+
+WINDOWS = {
+    "1h": ("1 jam", 3600),
+    "6h": ("6 jam", 6 * 3600),
+    "24h": ("24 jam", 24 * 3600),
+    "7d": ("7 hari", 7 * 24 * 3600),
+}
+
+# (nama kolom, typecode array)
+SERIES_FIELDS = (
+    ("stamps", "I"),          # indeks bucket (epoch // BUCKET_SECONDS) pemilik slot
+    ("peak", "H"),            # okupansi tertinggi dalam bucket
+    ("member_seconds", "I"),  # integral okupansi (member x detik)
+    ("joins", "H"),
+    ("leaves", "H"),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS voice_series (
+    guild_id       INTEGER NOT NULL,
+    channel_id     INTEGER PRIMARY KEY,
+    stamps         BLOB NOT NULL,
+    peak           BLOB NOT NULL,
+    member_seconds BLOB NOT NULL,
+    joins          BLOB NOT NULL,
+    leaves         BLOB NOT NULL,
+    occupancy      INTEGER NOT NULL,
+    last_ts        REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_voice_series_guild ON voice_series (guild_id);
+"""
+
+# --- HELPER FUNCTIONS (SERIES) ---
+
+class ChannelSeries:
+    """Ring buffer per channel: satu slot per bucket BUCKET_SECONDS, total RING_BUCKETS slot."""
+
+    __slots__ = ("guild_id", "channel_id", "stamps", "peak", "member_seconds", "joins", "leaves", "occupancy", "last_ts", "dirty")
+
+    def __init__(self, guild_id: int, channel_id: int, now: float, row: typing.Optional[tuple] = None):
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        if row is None:
+            for name, code in SERIES_FIELDS:
+                setattr(self, name, array.array(code, bytes(array.array(code).itemsize * RING_BUCKETS)))
+            self.occupancy = 0
+            self.last_ts = now
+        else:
+            for (name, code), blob in zip(SERIES_FIELDS, row[:len(SERIES_FIELDS)]):
+                values = array.array(code)
+                values.frombytes(blob)
+                setattr(self, name, values)
+            self.occupancy, self.last_ts = row[len(SERIES_FIELDS):]
+        self.dirty = False
+
+    def _slot(self, bucket: int) -> int:
+        i = bucket % RING_BUCKETS
+        if self.stamps[i] != bucket:
+            self.stamps[i] = bucket
+            self.peak[i] = 0
+            self.member_seconds[i] = 0
+            self.joins[i] = 0
+            self.leaves[i] = 0
+        return i
+
+    def advance(self, now: float):
+        """Mengakumulasi okupansi saat ini dari last_ts sampai now ke bucket-bucket yang dilewati."""
+        if now <= self.last_ts:
+            return
+        occupancy = self.occupancy
+        if occupancy:
+            start = max(self.last_ts, now - RING_BUCKETS * BUCKET_SECONDS)
+            bucket = int(start // BUCKET_SECONDS)
+            last_bucket = int(now // BUCKET_SECONDS)
+            while bucket <= last_bucket:
+                i = self._slot(bucket)
+                seg_end = min(now, (bucket + 1) * BUCKET_SECONDS)
+                self.member_seconds[i] = min(self.member_seconds[i] + int(occupancy * (seg_end - start)), 0xFFFFFFFF)
+                if occupancy > self.peak[i]:
+                    self.peak[i] = min(occupancy, 0xFFFF)
+                start = seg_end
+                bucket += 1
+        self.last_ts = now
+        self.dirty = True
+
+    def record(self, now: float, occupancy: int, joined: int, left: int):
+        self.advance(now)
+        i = self._slot(int(now // BUCKET_SECONDS))
+        self.occupancy = occupancy
+        if occupancy > self.peak[i]:
+            self.peak[i] = min(occupancy, 0xFFFF)
+        if joined:
+            self.joins[i] = min(self.joins[i] + joined, 0xFFFF)
+        if left:
+            self.leaves[i] = min(self.leaves[i] + left, 0xFFFF)
+        self.dirty = True
+
+    def to_row(self) -> tuple:
+        return (self.guild_id, self.channel_id) + tuple(getattr(self, name).tobytes() for name, _ in SERIES_FIELDS) + (self.occupancy, self.last_ts)
+
+def aggregate(rows: typing.List[tuple], start_bucket: int, window_seconds: float) -> typing.List[typing.Tuple[int, int, float, int, int]]:
+    """rows: (channel_id, stamps, peak, member_seconds, joins, leaves) dengan array/bytes.
+    Mengembalikan (channel_id, peak, rata-rata okupansi, joins, leaves) per channel."""
+    if not rows:
+        return []
+    if np is not None:
+        def stack(index, dtype):
+            return np.stack([np.frombuffer(r[index], dtype=dtype) for r in rows])
+        stamps = stack(1, np.uint32)
+        mask = stamps >= start_bucket
+        peak = np.where(mask, stack(2, np.uint16), 0).max(axis=1)
+        member_seconds = np.where(mask, stack(3, np.uint32), 0).sum(axis=1, dtype=np.uint64)
+        joins = np.where(mask, stack(4, np.uint16), 0).sum(axis=1, dtype=np.uint64)
+        leaves = np.where(mask, stack(5, np.uint16), 0).sum(axis=1, dtype=np.uint64)
+        return [
+            (r[0], int(peak[i]), float(member_seconds[i]) / window_seconds, int(joins[i]), int(leaves[i]))
+            for i, r in enumerate(rows)
+        ]
+
+    result = []
+    for channel_id, *columns in rows:
+        stamps, peak, member_seconds, joins, leaves = (
+            c if isinstance(c, array.array) else array.array(code, c)
+            for c, (_, code) in zip(columns, SERIES_FIELDS)
+        )
+        idx = [i for i, b in enumerate(stamps) if b >= start_bucket]
+        result.append((
+            channel_id,
+            max((peak[i] for i in idx), default=0),
+            sum(member_seconds[i] for i in idx) / window_seconds,
+            sum(joins[i] for i in idx),
+            sum(leaves[i] for i in idx),
+        ))
+    return result
+
+# --- HELPER FUNCTIONS (SQLITE) ---
+
+class SeriesStore(SQLiteStore):
+    """Penyimpanan ring buffer per channel sebagai BLOB."""
+
+    def __init__(self, path: str = VOICE_STATS_DB_FILE):
+        super().__init__(path, _SCHEMA)
+
+    def load(self, channel_id: int) -> typing.Optional[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT stamps, peak, member_seconds, joins, leaves, occupancy, last_ts FROM voice_series WHERE channel_id = ?",
+                (channel_id,)
+            ).fetchone()
+
+    def load_guild(self, guild_id: int) -> typing.List[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT channel_id, stamps, peak, member_seconds, joins, leaves, occupancy, last_ts FROM voice_series WHERE guild_id = ?",
+                (guild_id,)
+            ).fetchall()
+
+    def upsert_many(self, rows: typing.List[tuple]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO voice_series (guild_id, channel_id, stamps, peak, member_seconds, joins, leaves, occupancy, last_ts) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+# --- COG CLASS ---
+
+class VoiceStats(commands.Cog):
+    """Statistik okupansi voice per channel dalam bucket waktu."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.store = SeriesStore()
+        self._series: typing.OrderedDict[int, ChannelSeries] = collections.OrderedDict()
+        # series yang dikeluarkan dari memori tapi belum di-flush
+        self._evicted: typing.Dict[int, ChannelSeries] = {}
+        # baris yang disimpan sebelum waktu ini berasal dari proses sebelumnya
+        self._started = time.time()
+        self.flush_task.start()
+
+    def cog_unload(self):
+        self.flush_task.cancel()
+        rows = [s.to_row() for s in self._all_dirty()]
+        if rows:
+            self.store.upsert_many(rows)
+        self.store.close()
+
+    def _all_dirty(self) -> typing.List[ChannelSeries]:
+        return [s for s in self._series.values() if s.dirty] + list(self._evicted.values())
+
+    def _from_row(self, guild_id: int, channel_id: int, now: float, row: typing.Optional[tuple]) -> ChannelSeries:
+        series = ChannelSeries(guild_id, channel_id, now, row)
+        if row is not None and series.last_ts < self._started:
+            # okupansi tersimpan sudah basi (bot mati di antaranya); okupansi live diisi ulang lewat record()
+            series.occupancy = 0
+            series.last_ts = now
+        return series
+
+    async def _get_series(self, guild_id: int, channel_id: int, now: float) -> ChannelSeries:
+        series = self._series.get(channel_id)
+        if series is not None:
+            self._series.move_to_end(channel_id)
+            return series
+        series = self._evicted.pop(channel_id, None)
+        if series is None:
+            row = await asyncio.to_thread(self.store.load, channel_id)
+            # event lain untuk channel yang sama mungkin sudah memuatnya
+            if channel_id in self._series:
+                return self._series[channel_id]
+            series = self._from_row(guild_id, channel_id, now, row)
+        self._series[channel_id] = series
+        while len(self._series) > MAX_CHANNELS_IN_MEMORY:
+            _, old = self._series.popitem(last=False)
+            if old.dirty:
+                self._evicted[old.channel_id] = old
+        return series
+
+    # --- LISTENER: okupansi voice ---
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        if before.channel == after.channel:
+            return
+        now = time.time()
+        for channel, joined in ((before.channel, False), (after.channel, True)):
+            if channel is None:
+                continue
+            series = await self._get_series(member.guild.id, channel.id, now)
+            series.record(now, len(channel.members), int(joined), int(not joined))
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # okupansi awal (juga setelah reconnect): channel yang sudah berisi saat bot menyala
+        now = time.time()
+        for guild in self.bot.guilds:
+            occupied = set()
+            for channel in [*guild.voice_channels, *guild.stage_channels]:
+                if not channel.members:
+                    continue
+                occupied.add(channel.id)
+                series = await self._get_series(guild.id, channel.id, now)
+                series.record(now, len(channel.members), 0, 0)
+            for series in list(self._series.values()):
+                if series.guild_id == guild.id and series.occupancy and series.channel_id not in occupied:
+                    series.record(now, 0, 0, 0)
+
+    # --- BACKGROUND TASK: Flush ---
+    @tasks.loop(minutes=FLUSH_MINUTES)
+    async def flush_task(self):
+        dirty = self._all_dirty()
+        if not dirty:
+            return
+        now = time.time()
+        for series in dirty:
+            series.advance(now)
+        rows = [s.to_row() for s in dirty]
+        try:
+            await asyncio.to_thread(self.store.upsert_many, rows)
+        except Exception as e:
+            print(f"ERROR: Gagal menyimpan statistik voice: {e}")
+            return
+        for series in dirty:
+            series.dirty = False
+            self._evicted.pop(series.channel_id, None)
+
+    # --- COMMAND: /voicestats ---
+    @app_commands.command(name="voicestats", description="Statistik okupansi voice channel")
+    @app_commands.describe(window="Rentang waktu", channel="Voice channel tertentu (opsional)")
+    @app_commands.choices(window=[app_commands.Choice(name=label, value=key) for key, (label, _) in WINDOWS.items()])
+    @app_commands.default_permissions(move_members=True)
+    async def voicestats(self, interaction: discord.Interaction, window: str = "24h", channel: typing.Optional[discord.VoiceChannel] = None):
+        await interaction.response.defer(thinking=True, ephemeral=True)
+        label, window_seconds = WINDOWS[window]
+        now = time.time()
+        start_bucket = int((now - window_seconds) // BUCKET_SECONDS) + 1
+
+        series_by_channel = {}
+        for row in await asyncio.to_thread(self.store.load_guild, interaction.guild_id):
+            # salinan sementara: channel yang hanya ada di SQLite tetap dihitung sampai sekarang
+            series_by_channel[row[0]] = self._from_row(interaction.guild_id, row[0], now, row[1:])
+        for series in [*self._series.values(), *self._evicted.values()]:
+            if series.guild_id == interaction.guild_id:
+                series_by_channel[series.channel_id] = series
+        rows = {}
+        for channel_id, series in series_by_channel.items():
+            series.advance(now)
+            rows[channel_id] = (channel_id,) + tuple(getattr(series, name).tobytes() for name, _ in SERIES_FIELDS)
+        if channel is not None:
+            rows = {channel.id: rows[channel.id]} if channel.id in rows else {}
+
+        stats = await asyncio.to_thread(aggregate, list(rows.values()), start_bucket, window_seconds)
+        stats = [s for s in stats if s[1] or s[3] or s[4]]
+        if not stats:
+            await interaction.followup.send(f"Belum ada aktivitas voice dalam {label} terakhir.", ephemeral=True)
+            return
+
+        hours = window_seconds / 3600
+        embed = discord.Embed(title=f"📊 Statistik Voice • {label} terakhir", color=discord.Color.blurple())
+        if channel is None:
+            embed.add_field(name="Puncak (per channel)", value=str(max(s[1] for s in stats)))
+            embed.add_field(name="Rata-rata total", value=f"{sum(s[2] for s in stats):.1f} user")
+            embed.add_field(name="Join / Leave per jam", value=f"{sum(s[3] for s in stats) / hours:.1f} / {sum(s[4] for s in stats) / hours:.1f}")
+            top = sorted(stats, key=lambda s: s[2], reverse=True)[:TOP_CHANNELS]
+            embed.add_field(
+                name=f"Top {len(top)} channel (rata-rata okupansi)",
+                value="\n".join(f"<#{cid}> • rata-rata {avg:.1f} • puncak {peak} • {joins} join" for cid, peak, avg, joins, _ in top),
+                inline=False
+            )
+        else:
+            _, peak, avg, joins, leaves = stats[0]
+            embed.description = f"<#{channel.id}>"
+            embed.add_field(name="Puncak", value=str(peak))
+            embed.add_field(name="Rata-rata", value=f"{avg:.1f} user")
+            embed.add_field(name="Join / Leave per jam", value=f"{joins / hours:.1f} / {leaves / hours:.1f}")
+        embed.set_footer(text=f"Bucket {BUCKET_SECONDS // 60} menit • {len(stats)} channel aktif")
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(VoiceStats(bot))
@@ -0,0 +1,267 @@
+# cogs/voice_timers.py
+import discord
+from discord.ext import commands
+from .log_config import get_log_channel_id
+from .outbound import LOGGING, edit_member, gather_bounded, send_message
+from .sqlite_store import SQLiteStore
+import asyncio
+import datetime
+import heapq
+import re
+import time
+import typing
+
+
+TIMERS_DB_FILE = "voice_timers.db"
+MAX_DURATION = datetime.timedelta(days=28)
+EXPIRY_CONCURRENCY = 10
+# Timer yang jatuh tempo dalam jarak ini diproses dalam satu batch.
+BATCH_WINDOW_SECONDS = 1.0
+MAX_SLEEP_SECONDS = 60.0
+
+# action -> (atribut VoiceState, kwargs member.edit, label log)
+EXPIRY_ACTIONS = {
+    "unmute": ("mute", {"mute": False}, "Server Unmute (durasi habis)"),
+    "undeafen": ("deaf", {"deafen": False}, "Server Undeafen (durasi habis)"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS voice_timers (
+    guild_id  INTEGER NOT NULL,
+    member_id INTEGER NOT NULL,
+    action    TEXT NOT NULL,
+    due_at    REAL NOT NULL,
+    actor_id  INTEGER NOT NULL,
+    reason    TEXT,
+    PRIMARY KEY (guild_id, member_id, action)
+);
+"""
+
+_DURATION_RE = re.compile(r"(\d+)\s*([smhd])")
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+TimerKey = typing.Tuple[int, int, str]
+
+# --- HELPER FUNCTIONS ---
+
+def parse_duration(text: str) -> typing.Optional[datetime.timedelta]:
+    """Mengubah teks seperti `30m`, `2h`, `1d12h` menjadi timedelta. None bila tidak valid."""
+    cleaned = text.strip().lower().replace(" ", "")
+    if not cleaned or _DURATION_RE.sub("", cleaned):
+        return None
+    seconds = sum(int(n) * _DURATION_UNITS[u] for n, u in _DURATION_RE.findall(cleaned))
+    if seconds <= 0:
+        return None
+    return datetime.timedelta(seconds=seconds)
+
+class TimerStore(SQLiteStore):
+    """Penyimpanan timer di SQLite; satu timer aktif per (guild, member, action)."""
+
+    def __init__(self, path: str = TIMERS_DB_FILE):
+        super().__init__(path, _SCHEMA)
+
+    def load_all(self) -> typing.List[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT guild_id, member_id, action, due_at, actor_id, reason FROM voice_timers"
+            ).fetchall()
+
+    def upsert(self, row: tuple):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO voice_timers (guild_id, member_id, action, due_at, actor_id, reason) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                row
+            )
+
+    def delete_many(self, keys: typing.List[TimerKey]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM voice_timers WHERE guild_id = ? AND member_id = ? AND action = ?",
+                keys
+            )
+
+# --- COG CLASS ---
+
+class VoiceTimers(commands.Cog):
+    """Satu scheduler berbasis heap untuk semua unmute/undeafen berdurasi."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.store = TimerStore()
+        self._heap: typing.List[typing.Tuple[float, int, TimerKey]] = []
+        self._seq = 0
+        # key -> (due_at, actor_id, reason); sumber kebenaran, entri heap yang tidak cocok dianggap basi
+        self._timers: typing.Dict[TimerKey, typing.Tuple[float, int, typing.Optional[str]]] = {}
+        # timer yang sudah jatuh tempo tapi member sedang tidak di voice
+        self._overdue: typing.Dict[TimerKey, typing.Tuple[float, int, typing.Optional[str]]] = {}
+        self._wakeup = asyncio.Event()
+        self._runner: typing.Optional[asyncio.Task] = None
+
+    async def cog_load(self):
+        rows = await asyncio.to_thread(self.store.load_all)
+        for guild_id, member_id, action, due_at, actor_id, reason in rows:
+            self._timers[(guild_id, member_id, action)] = (due_at, actor_id, reason)
+        self._heap = [(due_at, i, key) for i, (key, (due_at, _, _)) in enumerate(self._timers.items())]
+        self._seq = len(self._heap)
+        heapq.heapify(self._heap)
+        print(f"Memuat {len(self._heap)} timer voice tertunda.")
+        self._runner = asyncio.create_task(self._run())
+
+    def cog_unload(self):
+        if self._runner:
+            self._runner.cancel()
+        self.store.close()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._timers) + len(self._overdue)
+
+    async def schedule(
+        self,
+        guild_id: int,
+        member_id: int,
+        action: str,
+        delay: datetime.timedelta,
+        actor_id: int,
+        reason: typing.Optional[str]
+    ) -> float:
+        """Menjadwalkan (atau mengganti) timer. Mengembalikan waktu jatuh tempo (unix)."""
+        key = (guild_id, member_id, action)
+        due_at = time.time() + delay.total_seconds()
+        await asyncio.to_thread(self.store.upsert, (guild_id, member_id, action, due_at, actor_id, reason))
+        self._overdue.pop(key, None)
+        self._timers[key] = (due_at, actor_id, reason)
+        self._seq += 1
+        heapq.heappush(self._heap, (due_at, self._seq, key))
+        if self._heap[0][2] == key:
+            self._wakeup.set()
+        return due_at
+
+    async def cancel(self, guild_id: int, member_id: int, action: str) -> bool:
+        """Membatalkan timer yang masih tertunda, misalnya saat moderator unmute manual."""
+        key = (guild_id, member_id, action)
+        found = self._timers.pop(key, None) or self._overdue.pop(key, None)
+        if found:
+            await asyncio.to_thread(self.store.delete_many, [key])
+        return bool(found)
+
+    def _pop_due(self, now: float) -> typing.List[typing.Tuple[TimerKey, typing.Tuple[float, int, typing.Optional[str]]]]:
+        batch = []
+        while self._heap and self._heap[0][0] <= now + BATCH_WINDOW_SECONDS:
+            due_at, _, key = heapq.heappop(self._heap)
+            entry = self._timers.get(key)
+            if entry is None or entry[0] != due_at:
+                continue
+            del self._timers[key]
+            batch.append((key, entry))
+        return batch
+
+    async def _run(self):
+        await self.bot.wait_until_ready()
+        while True:
+            now = time.time()
+            batch = self._pop_due(now)
+            if batch:
+                try:
+                    await self._expire_batch(batch)
+                except Exception as e:
+                    print(f"ERROR: Gagal memproses timer voice: {e}")
+                continue
+
+            timeout = MAX_SLEEP_SECONDS
+            if self._heap:
+                timeout = min(max(self._heap[0][0] - now, 0.0), MAX_SLEEP_SECONDS)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _expire_batch(self, batch):
+        results = await gather_bounded([
+            (lambda key=key, entry=entry: self._expire(key, entry)) for key, entry in batch
+        ], EXPIRY_CONCURRENCY)
+
+        finished = []
+        for (key, entry), result in zip(batch, results):
+            if isinstance(result, Exception):
+                print(f"ERROR: Timer {key} gagal: {result}")
+                finished.append(key)
+            elif result:
+                finished.append(key)
+            else:
+                self._overdue[key] = entry
+        if finished:
+            await asyncio.to_thread(self.store.delete_many, finished)
+
+    async def _expire(self, key: TimerKey, entry: typing.Tuple[float, int, typing.Optional[str]]) -> bool:
+        """Menjalankan satu timer. False bila harus ditunda sampai member kembali ke voice."""
+        guild_id, member_id, action = key
+        _, actor_id, reason = entry
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            return True
+        member = guild.get_member(member_id)
+        if not member:
+            return True
+        if not member.voice or not member.voice.channel:
+            return False
+
+        state_attr, edit_kwargs, log_title = EXPIRY_ACTIONS[action]
+        if not getattr(member.voice, state_attr, False):
+            return True
+
+        channel_id = member.voice.channel.id
+        await edit_member(self.bot, member, reason=f"Durasi habis: {reason or '—'}", **edit_kwargs)
+
+        history = self.bot.get_cog("ModHistory")
+        if history:
+            history.record(guild_id, self.bot.user.id, member_id, action, channel_id, f"Durasi habis (oleh <@{actor_id}>)")
+        await self._log_expiry(guild, member, log_title, actor_id, reason)
+        return True
+
+    async def _log_expiry(self, guild: discord.Guild, member: discord.Member, title: str, actor_id: int, reason: typing.Optional[str]):
+        log_channel_id = get_log_channel_id(guild.id)
+        if not log_channel_id:
+            return
+        log_ch = self.bot.get_channel(log_channel_id)
+        if not log_ch:
+            return
+        embed = discord.Embed(
+            title=title,
+            description=f"Target: {member} ({member.id})\nDijadwalkan oleh: <@{actor_id}>\nReason: {reason or '—'}",
+            color=discord.Color.green(),
+            timestamp=datetime.datetime.now(datetime.timezone.utc)
+        )
+        embed.set_footer(text=f"Guild: {guild.id}")
+        try:
+            await send_message(self.bot, LOGGING, log_ch, embed=embed)
+        except Exception:
+            pass
+
+    # --- LISTENER: timer tertunda saat member kembali ke voice ---
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        if not self._overdue or before.channel is not None or after.channel is None:
+            return
+        batch = []
+        for action in EXPIRY_ACTIONS:
+            key = (member.guild.id, member.id, action)
+            entry = self._overdue.pop(key, None)
+            if entry:
+                batch.append((key, entry))
+        if batch:
+            await self._expire_batch(batch)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        keys = [(member.guild.id, member.id, action) for action in EXPIRY_ACTIONS]
+        dropped = [k for k in keys if self._timers.pop(k, None) or self._overdue.pop(k, None)]
+        if dropped:
+            await asyncio.to_thread(self.store.delete_many, dropped)
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(VoiceTimers(bot))
@@ -0,0 +1,219 @@
+# cogs/warm_cache.py
+import discord
+from discord.ext import commands, tasks
+import asyncio
+import math
+import mmap
+import os
+import struct
+import time
+import typing
+
+
+WARM_CACHE_FILE = "warm_cache.bin"
+WARM_CACHE_VERSION = 2
+# Snapshot guild yang lebih tua dari ini dianggap basi dan dibuang.
+WARM_MAX_AGE_SECONDS = 30 * 60
+SNAPSHOT_MINUTES = 10
+
+_MAGIC = b"DJWC"
+_HEADER = struct.Struct("<4sHId")        # magic, versi, jumlah guild, waktu tulis
+_GUILD = struct.Struct("<QdQI")          # guild_id, waktu capture, offset, panjang
+_COUNT = struct.Struct("<I")
+_VOICE = struct.Struct("<QQd")           # member_id, channel_id, voice_since (NaN = tidak diketahui)
+_STR_LEN = struct.Struct("<H")
+_MEMBER = struct.Struct("<QB")           # member_id, flag (bit 0 mute, bit 1 deaf), lalu label
+
+class WarmGuild(typing.NamedTuple):
+    captured_at: float
+    voice: typing.List[typing.Tuple[int, int, typing.Optional[float]]]
+    selectors: typing.List[str]
+    # (member_id, label autocomplete, mute, deaf) untuk member di voice
+    members: typing.List[typing.Tuple[int, str, bool, bool]]
+
+# --- HELPER FUNCTIONS (FORMAT) ---
+
+def _pack_str(value: str) -> bytes:
+    raw = value.encode("utf-8")[:0xFFFF]
+    return _STR_LEN.pack(len(raw)) + raw
+
+def _unpack_str(buf: typing.Union[bytes, mmap.mmap], offset: int) -> typing.Tuple[str, int]:
+    (size,) = _STR_LEN.unpack_from(buf, offset)
+    offset += _STR_LEN.size
+    return bytes(buf[offset:offset + size]).decode("utf-8", "replace"), offset + size
+
+def encode_guild(
+    voice: typing.Iterable[typing.Tuple[int, int, typing.Optional[float]]],
+    selectors: typing.Iterable[str],
+    members: typing.Iterable[typing.Tuple[int, str, bool, bool]] = ()
+) -> bytes:
+    """Section per guild: daftar voice state, sumber selector, lalu label member di voice."""
+    voice = list(voice)
+    selectors = list(selectors)
+    members = list(members)
+    parts = [_COUNT.pack(len(voice))]
+    parts.extend(_VOICE.pack(mid, cid, math.nan if since is None else since) for mid, cid, since in voice)
+    parts.append(_COUNT.pack(len(selectors)))
+    parts.extend(_pack_str(expr) for expr in selectors)
+    parts.append(_COUNT.pack(len(members)))
+    for mid, label, mute, deaf in members:
+        parts.append(_MEMBER.pack(mid, int(mute) | int(deaf) << 1))
+        parts.append(_pack_str(label))
+    return b"".join(parts)
+
+def decode_guild(buf: typing.Union[bytes, mmap.mmap], offset: int, length: int, captured_at: float) -> WarmGuild:
+    end = offset + length
+    (count,) = _COUNT.unpack_from(buf, offset)
+    offset += _COUNT.size
+    voice = []
+    for _ in range(count):
+        mid, cid, since = _VOICE.unpack_from(buf, offset)
+        offset += _VOICE.size
+        voice.append((mid, cid, None if math.isnan(since) else since))
+    (count,) = _COUNT.unpack_from(buf, offset)
+    offset += _COUNT.size
+    selectors = []
+    for _ in range(count):
+        expr, offset = _unpack_str(buf, offset)
+        selectors.append(expr)
+    (count,) = _COUNT.unpack_from(buf, offset)
+    offset += _COUNT.size
+    members = []
+    for _ in range(count):
+        mid, flags = _MEMBER.unpack_from(buf, offset)
+        label, offset = _unpack_str(buf, offset + _MEMBER.size)
+        members.append((mid, label, bool(flags & 1), bool(flags & 2)))
+    if offset > end:
+        raise ValueError("section melewati batas")
+    return WarmGuild(captured_at, voice, selectors, members)
+
+def write_snapshot(path: str, sections: typing.Dict[int, typing.Tuple[float, bytes]]):
+    """Menulis file snapshot secara atomik (tulis ke file sementara lalu rename)."""
+    table_size = _HEADER.size + _GUILD.size * len(sections)
+    table = [_HEADER.pack(_MAGIC, WARM_CACHE_VERSION, len(sections), time.time())]
+    offset = table_size
+    for guild_id, (captured_at, data) in sections.items():
+        table.append(_GUILD.pack(guild_id, captured_at, offset, len(data)))
+        offset += len(data)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(b"".join(table))
+        for _, data in sections.values():
+            f.write(data)
+    os.replace(tmp, path)
+
+# --- COG CLASS ---
+
+class WarmCache(commands.Cog):
+    """Snapshot indeks turunan (voice since, selector, label member voice) agar cepat pulih setelah restart."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._map: typing.Optional[mmap.mmap] = None
+        # guild_id -> (waktu capture, offset, panjang) di file lama yang belum diklaim
+        self._table: typing.Dict[int, typing.Tuple[float, int, int]] = {}
+        # guild_id -> (waktu capture, bytes section) hasil capture terakhir
+        self._captured: typing.Dict[int, typing.Tuple[float, bytes]] = {}
+        self.stats = {"loaded": 0, "claimed": 0, "stale": 0, "invalid": 0}
+
+    async def cog_load(self):
+        self._open()
+        self.snapshot_task.start()
+
+    def cog_unload(self):
+        self.snapshot_task.cancel()
+        self.capture()
+        try:
+            write_snapshot(WARM_CACHE_FILE, self._sections())
+        except Exception as e:
+            print(f"ERROR: Gagal menulis warm cache: {e}")
+        self._close()
+
+    def _open(self):
+        if not os.path.exists(WARM_CACHE_FILE) or os.path.getsize(WARM_CACHE_FILE) < _HEADER.size:
+            return
+        try:
+            with open(WARM_CACHE_FILE, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count, _ = _HEADER.unpack_from(self._map, 0)
+            if magic != _MAGIC or version != WARM_CACHE_VERSION:
+                self._close()
+                return
+            for i in range(count):
+                guild_id, captured_at, offset, length = _GUILD.unpack_from(self._map, _HEADER.size + i * _GUILD.size)
+                if offset + length <= len(self._map):
+                    self._table[guild_id] = (captured_at, offset, length)
+        except Exception as e:
+            print(f"ERROR: Warm cache tidak bisa dibaca, diabaikan: {e}")
+            self._table.clear()
+            self._close()
+            return
+        self.stats["loaded"] = len(self._table)
+        print(f"Warm cache: {len(self._table)} guild tersedia.")
+
+    def _close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def claim(self, guild_id: int) -> typing.Optional[WarmGuild]:
+        """Mengambil snapshot guild (sekali saja). None bila tidak ada, basi, atau rusak."""
+        entry = self._table.pop(guild_id, None)
+        if entry is None or self._map is None:
+            return None
+        captured_at, offset, length = entry
+        if time.time() - captured_at > WARM_MAX_AGE_SECONDS:
+            self.stats["stale"] += 1
+            return None
+        try:
+            warm = decode_guild(self._map, offset, length, captured_at)
+        except Exception:
+            self.stats["invalid"] += 1
+            return None
+        self.stats["claimed"] += 1
+        return warm
+
+    def capture(self, index: typing.Optional[commands.Cog] = None):
+        """Menyalin state MemberIndex saat ini ke buffer snapshot."""
+        index = index or self.bot.get_cog("MemberIndex")
+        if not index:
+            return
+        now = time.time()
+        for guild_id in index.indexed_guilds():
+            voice, selectors, members = index.export(guild_id)
+            self._captured[guild_id] = (now, encode_guild(voice, selectors, members))
+
+    def _sections(self) -> typing.Dict[int, typing.Tuple[float, bytes]]:
+        sections = dict(self._captured)
+        # guild yang belum diklaim sejak start ikut disalin selama belum basi
+        now = time.time()
+        if self._map is not None:
+            for guild_id, (captured_at, offset, length) in self._table.items():
+                if guild_id not in sections and now - captured_at <= WARM_MAX_AGE_SECONDS:
+                    sections[guild_id] = (captured_at, bytes(self._map[offset:offset + length]))
+        return sections
+
+    # --- BACKGROUND TASK: Snapshot berkala ---
+    @tasks.loop(minutes=SNAPSHOT_MINUTES)
+    async def snapshot_task(self):
+        self.capture()
+        try:
+            await asyncio.to_thread(write_snapshot, WARM_CACHE_FILE, self._sections())
+        except Exception as e:
+            print(f"ERROR: Gagal menulis warm cache: {e}")
+
+    @snapshot_task.before_loop
+    async def before_snapshot_task(self):
+        await self.bot.wait_until_ready()
+        # iterasi pertama langsung setelah ready hanya akan menyalin ulang file lama
+        await asyncio.sleep(SNAPSHOT_MINUTES * 60)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._table.pop(guild.id, None)
+        self._captured.pop(guild.id, None)
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(WarmCache(bot))
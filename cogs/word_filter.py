@@ -0,0 +1,319 @@
+# cogs/word_filter.py
+import discord
+from discord import app_commands
+from discord.ext import commands
+from .log_config import get_log_channel_id
+from .outbound import ENFORCEMENT, LOGGING, dispatch, route, send_message
+import asyncio
+import collections
+import datetime
+import json
+import os
+import typing
+import unicodedata
+
+
+FILTER_FILE = "word_filter.json"
+MAX_PATTERNS_PER_GUILD = 5000
+MAX_PATTERN_LENGTH = 100
+
+KINDS = {
+    "word": "📝 Kata",
+    "url": "🔗 URL",
+}
+
+# Karakter leetspeak dan homoglyph umum -> huruf latin.
+CONFUSABLES = str.maketrans({
+    "0": "o", "1": "i", "3": "e", "4": "a", "5": "s", "7": "t", "8": "b", "9": "g",
+    "@": "a", "$": "s", "!": "i", "|": "l", "+": "t",
+    "а": "a", "в": "b", "е": "e", "к": "k", "м": "m", "н": "h", "о": "o", "р": "p",
+    "с": "c", "т": "t", "у": "y", "х": "x", "і": "i", "ј": "j", "ѕ": "s", "ԁ": "d",
+    "ɡ": "g", "ո": "n", "ս": "u", "ı": "i", "ł": "l", "ø": "o", "đ": "d",
+    "α": "a", "β": "b", "ε": "e", "ι": "i", "κ": "k", "ν": "v", "ο": "o", "ρ": "p", "τ": "t", "υ": "u", "χ": "x",
+})
+_INVISIBLE = {"\u200b", "\u200c", "\u200d", "\u2060", "\ufeff", "\u00ad"}
+
+# --- HELPER FUNCTIONS (JSON) ---
+
+def load_filters() -> dict:
+    """Memuat daftar pola filter per guild dari file JSON."""
+    if not os.path.exists(FILTER_FILE):
+        return {}
+    with open(FILTER_FILE, 'r') as f:
+        return json.load(f)
+
+def save_filters(data: dict):
+    """Menyimpan daftar pola filter per guild ke file JSON."""
+    with open(FILTER_FILE, 'w') as f:
+        json.dump(data, f, indent=4)
+
+def normalize(text: str) -> str:
+    """Menormalkan teks: NFKD tanpa diakritik, huruf kecil, leetspeak/homoglyph dipetakan, karakter tak terlihat dibuang."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c) and c not in _INVISIBLE)
+    return stripped.casefold().translate(CONFUSABLES)
+
+# --- AHO-CORASICK ---
+
+class Automaton:
+    """Automaton Aho-Corasick: semua pola dicocokkan dalam satu scan linear."""
+
+    __slots__ = ("goto", "fail", "output", "patterns", "size")
+
+    def __init__(self, patterns: typing.Sequence[typing.Tuple[str, str]]):
+        # patterns: (teks pola yang sudah dinormalkan, kind)
+        self.patterns = list(patterns)
+        self.goto: typing.List[typing.Dict[str, int]] = [{}]
+        self.output: typing.List[typing.Tuple[int, ...]] = [()]
+        for index, (text, _) in enumerate(self.patterns):
+            node = 0
+            for ch in text:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.output.append(())
+                node = nxt
+            self.output[node] += (index,)
+
+        self.fail = [0] * len(self.goto)
+        queue = collections.deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.output[nxt] += self.output[self.fail[nxt]]
+        self.size = len(self.goto)
+
+    def find(self, text: str) -> typing.Optional[typing.Tuple[int, int]]:
+        """Mengembalikan (indeks pola, posisi akhir) untuk kecocokan pertama, atau None."""
+        goto, fail, output, patterns = self.goto, self.fail, self.output, self.patterns
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for index in output[node]:
+                pattern, kind = patterns[index]
+                if kind == "word":
+                    start = pos - len(pattern) + 1
+                    if (start > 0 and text[start - 1].isalnum()) or (pos + 1 < len(text) and text[pos + 1].isalnum()):
+                        continue
+                return index, pos
+        return None
+
+class GuildFilter:
+    """Dua automaton per guild: teks mentah (casefold) dan teks yang dinormalkan."""
+
+    __slots__ = ("raw", "normalized", "sources", "version")
+
+    def __init__(self, entries: typing.Dict[str, typing.List[str]], version: int):
+        self.sources: typing.List[typing.Tuple[str, str]] = [
+            (pattern, kind) for kind in KINDS for pattern in entries.get(kind, [])
+        ]
+        self.raw = Automaton([(p.casefold(), k) for p, k in self.sources])
+        self.normalized = Automaton([(normalize(p), k) for p, k in self.sources])
+        self.version = version
+
+    def match(self, content: str) -> typing.Optional[typing.Tuple[str, str]]:
+        """Mengembalikan (pola, kind) yang cocok, atau None."""
+        hit = self.raw.find(content.casefold())
+        if hit is None:
+            hit = self.normalized.find(normalize(content))
+        if hit is None:
+            return None
+        return self.sources[hit[0]]
+
+# --- COG CLASS ---
+
+class WordFilter(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.data = load_filters()
+        # guild_id -> GuildFilter; diganti utuh (atomic) setelah rebuild selesai
+        self._filters: typing.Dict[int, GuildFilter] = {}
+        self._versions: typing.Dict[int, int] = {}
+
+    async def cog_load(self):
+        for guild_id in list(self.data):
+            await self._rebuild(int(guild_id))
+
+    async def _rebuild(self, guild_id: int):
+        version = self._versions.get(guild_id, 0) + 1
+        self._versions[guild_id] = version
+        entries = {kind: list(patterns) for kind, patterns in self.data.get(str(guild_id), {}).items()}
+        if not any(entries.values()):
+            self._filters.pop(guild_id, None)
+            return
+        built = await asyncio.to_thread(GuildFilter, entries, version)
+        # rebuild yang lebih baru mungkin sudah selesai lebih dulu
+        if self._versions.get(guild_id) == version:
+            self._filters[guild_id] = built
+
+    # --- LISTENER: filter pesan ---
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.guild is None or message.author.bot or not message.content:
+            return
+        guild_filter = self._filters.get(message.guild.id)
+        if guild_filter is None:
+            return
+        hit = guild_filter.match(message.content)
+        if hit is None:
+            return
+        perms = message.channel.permissions_for(message.author)
+        if perms.manage_messages or perms.administrator:
+            return
+
+        pattern, kind = hit
+        events = self.bot.get_cog("Events")
+        if events:
+            events.expect_deletion([message.id])
+        evidence = self.bot.get_cog("EvidenceStore")
+        futures = []
+        if evidence and message.attachments:
+            # lampiran harus sudah terunduh sebelum delete; URL CDN tidak lagi valid setelahnya
+            futures = evidence.archive(message)
+            if not await evidence.settle(futures):
+                await self._forward(message)
+        try:
+            await dispatch(
+                self.bot, ENFORCEMENT, route("message.delete", message.channel.id), message.guild.id,
+                lambda: message.delete(reason=f"Filter {kind}: {pattern}")
+            )
+        except discord.NotFound:
+            pass
+        except Exception as e:
+            print(f"ERROR: Gagal menghapus pesan terfilter ({message.guild.name}): {e}")
+            return
+        log_msg, embed = await self._log(message, pattern, kind)
+        if evidence:
+            evidence.annotate_log(log_msg, embed, futures)
+
+    async def _forward(self, message: discord.Message):
+        """Cadangan bila arsip lampiran gagal: forward pesan asli ke channel log sebelum dihapus."""
+        log_channel_id = get_log_channel_id(message.guild.id)
+        log_ch = self.bot.get_channel(log_channel_id) if log_channel_id else None
+        if not log_ch:
+            return
+        try:
+            await dispatch(
+                self.bot, LOGGING, route("message.forward", log_ch.id), message.guild.id,
+                lambda: message.forward(log_ch)
+            )
+        except Exception as e:
+            print(f"ERROR: Gagal mem-forward pesan terfilter ({message.guild.name}): {e}")
+
+    async def _log(self, message: discord.Message, pattern: str, kind: str) -> typing.Tuple[typing.Optional[discord.Message], typing.Optional[discord.Embed]]:
+        log_channel_id = get_log_channel_id(message.guild.id)
+        if not log_channel_id:
+            return None, None
+        log_ch = self.bot.get_channel(log_channel_id)
+        if not log_ch:
+            return None, None
+        content = message.content if len(message.content) <= 1000 else message.content[:1000] + "…"
+        embed = discord.Embed(
+            title=f"🚫 Pesan Difilter ({KINDS[kind]})",
+            description=(
+                f"**User:** {message.author.mention}\n"
+                f"**Channel:** {message.channel.mention}\n"
+                f"**Pola:** `{pattern}`\n"
+                f"**Isi:** {content}"
+            ),
+            color=discord.Color.dark_red(),
+            timestamp=datetime.datetime.now(datetime.timezone.utc)
+        )
+        embed.set_footer(text=f"ID Pesan: {message.id}")
+        try:
+            return await send_message(self.bot, LOGGING, log_ch, embed=embed), embed
+        except Exception:
+            return None, None
+
+    # --- COMMAND: /filteradd ---
+    @app_commands.command(name="filteradd", description="Tambahkan kata/URL ke filter server")
+    @app_commands.describe(kind="Jenis pola", pattern="Kata, frasa, atau domain")
+    @app_commands.choices(kind=[app_commands.Choice(name=label, value=kind) for kind, label in KINDS.items()])
+    @app_commands.default_permissions(administrator=True)
+    async def filteradd(self, interaction: discord.Interaction, kind: str, pattern: str):
+        pattern = pattern.strip()
+        if not pattern or len(pattern) > MAX_PATTERN_LENGTH:
+            await interaction.response.send_message(f"Pola harus 1–{MAX_PATTERN_LENGTH} karakter.", ephemeral=True)
+            return
+        entries = self.data.setdefault(str(interaction.guild_id), {})
+        if sum(len(v) for v in entries.values()) >= MAX_PATTERNS_PER_GUILD:
+            await interaction.response.send_message(f"Batas {MAX_PATTERNS_PER_GUILD} pola per server tercapai.", ephemeral=True)
+            return
+        patterns = entries.setdefault(kind, [])
+        if pattern.casefold() in (p.casefold() for p in patterns):
+            await interaction.response.send_message(f"`{pattern}` sudah ada di filter.", ephemeral=True)
+            return
+        patterns.append(pattern)
+        save_filters(self.data)
+        await interaction.response.send_message(f"✅ {KINDS[kind]} `{pattern}` ditambahkan ke filter.", ephemeral=True)
+        await self._rebuild(interaction.guild_id)
+
+    # --- COMMAND: /filterremove ---
+    async def _pattern_autocomplete(self, interaction: discord.Interaction, current: str) -> typing.List[app_commands.Choice[str]]:
+        entries = self.data.get(str(interaction.guild_id), {})
+        choices = []
+        for kind, patterns in entries.items():
+            for p in patterns:
+                if current.lower() in p.lower():
+                    choices.append(app_commands.Choice(name=f"{KINDS.get(kind, kind)}: {p}"[:100], value=f"{kind}:{p}"[:100]))
+        return choices[:25]
+
+    @app_commands.command(name="filterremove", description="Hapus kata/URL dari filter server")
+    @app_commands.describe(pattern="Pola yang akan dihapus")
+    @app_commands.autocomplete(pattern=_pattern_autocomplete)
+    @app_commands.default_permissions(administrator=True)
+    async def filterremove(self, interaction: discord.Interaction, pattern: str):
+        entries = self.data.get(str(interaction.guild_id), {})
+        kind, sep, value = pattern.partition(":")
+        if not sep or kind not in KINDS:
+            kinds, value = list(KINDS), pattern
+        else:
+            kinds = [kind]
+        removed = None
+        for k in kinds:
+            patterns = entries.get(k, [])
+            match = next((p for p in patterns if p.casefold() == value.strip().casefold()), None)
+            if match is not None:
+                patterns.remove(match)
+                removed = (k, match)
+                break
+        if removed is None:
+            await interaction.response.send_message(f"`{value}` tidak ada di filter.", ephemeral=True)
+            return
+        if not any(entries.values()):
+            self.data.pop(str(interaction.guild_id), None)
+        save_filters(self.data)
+        await interaction.response.send_message(f"🗑️ {KINDS[removed[0]]} `{removed[1]}` dihapus dari filter.", ephemeral=True)
+        await self._rebuild(interaction.guild_id)
+
+    # --- COMMAND: /filterlist ---
+    @app_commands.command(name="filterlist", description="Tampilkan daftar filter server")
+    @app_commands.default_permissions(administrator=True)
+    async def filterlist(self, interaction: discord.Interaction):
+        entries = self.data.get(str(interaction.guild_id), {})
+        embed = discord.Embed(title="🚫 Filter Server", color=discord.Color.dark_red())
+        for kind, label in KINDS.items():
+            patterns = entries.get(kind, [])
+            value = ", ".join(f"`{p}`" for p in patterns) or "—"
+            if len(value) > 1024:
+                value = value[:1000] + f"… (+{len(patterns)} total)"
+            embed.add_field(name=f"{label} ({len(patterns)})", value=value, inline=False)
+        built = self._filters.get(interaction.guild_id)
+        if built:
+            embed.set_footer(text=f"Automaton: {built.raw.size} + {built.normalized.size} node • versi {built.version}")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+# --- SETUP COG ---
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(WordFilter(bot))